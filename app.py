@@ -1,13 +1,50 @@
+import multiprocessing
+import queue
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from cache import ResultCache, canonical_key
+from lookup_table import lookup_cover
+from quine_mccluskey import (
+    MemoryBudgetExceeded, MinimizationStats, minimize_function, resolve_num_vars, sop_expression, variable_names,
+)
+
+# How often the window checks the background solve for progress, in milliseconds
+POLL_INTERVAL_MS = 50
+
+# Pause in typing before a live re-solve starts, in milliseconds
+LIVE_SOLVE_DELAY_MS = 400
+
+# Function to minimize in a background process
+def solve_in_background(messages, minterms, dont_cares, num_vars):
+    """
+    Runs minimize_function in a worker process, posting ('progress', event, counters) for every level
+    and phase as MinimizationStats reports them, then ('done', implicants) or ('error', title, message).
+
+    Args:
+        messages (multiprocessing.Queue): Where to post the messages.
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int): Number of variables.
+    """
+    stats = MinimizationStats(lambda event, counters: messages.put(('progress', event, counters)))
+    try:
+        messages.put(('done', minimize_function(minterms, dont_cares, num_vars, stats=stats)))
+    except MemoryBudgetExceeded as error:
+        messages.put(('error', "Too Large!", str(error)))
+
 class Quine_McCluskey:
     
     def __init__(self, root):
         self.root = root
         self.root.title("Zigla's Quine-McCluskey Minimizer")
-        self.root.geometry("600x500") 
+        self.root.geometry("600x560") 
         self.root.resizable(False, False)
+        self.cache = ResultCache()
+        # the running background solve: its process, message queue, inputs and start time
+        self.job = None
+        self.live_solve_id = None
         self.apply_global_style() 
         self.setup_ui()
 
@@ -41,13 +78,25 @@ class Quine_McCluskey:
         self.variables_entry.pack(pady=10, fill="x")
         self.add_placeholder(self.variables_entry, "Enter variables if you want to change default (e.g., A, B, C, D)")
 
-        solve_button = ttk.Button(form_frame, text="Solve", command=self.solve)
-        solve_button.pack(pady=30)
+        for entry in (self.minterms_entry, self.dont_cares_entry, self.variables_entry):
+            entry.bind("<KeyRelease>", self.schedule_live_solve)
+
+        button_frame = ttk.Frame(form_frame)
+        button_frame.pack(pady=20)
+        solve_button = ttk.Button(button_frame, text="Solve", command=self.solve)
+        solve_button.pack(side="left", padx=10)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel, state="disabled")
+        self.cancel_button.pack(side="left", padx=10)
+        self.live = tk.BooleanVar(value=True)
+        ttk.Checkbutton(form_frame, text="Solve as I type", variable=self.live).pack()
 
         self.answer = tk.StringVar()
         self.answer_label = ttk.Label(form_frame, textvariable=self.answer)
         self.answer_label.pack(pady=20)
 
+        self.status = tk.StringVar()
+        ttk.Label(form_frame, textvariable=self.status, font=('Arial', 11)).pack()
+
     def add_placeholder(self, entry, placeholder):
         entry.insert(0, placeholder)
         entry.bind("<FocusIn>", lambda e: self.on_focus_in(entry, placeholder))
@@ -63,15 +112,20 @@ class Quine_McCluskey:
             entry.insert(0, placeholder)
             entry.config(fg="grey")
 
-    def solve(self):
+    def report(self, title, message, live, show=messagebox.showinfo):
+        # live re-solves happen mid-typing, so their complaints go to the status line instead of a dialog
+        if live:
+            self.status.set(message)
+        else:
+            show(title, message)
+
+    def read_inputs(self, live=False):
         if self.minterms_entry.get() == "Enter minterms (e.g., 0, 1, 2)":
-            return messagebox.showerror("Error!", "Please input minterms to solve!")
+            return self.report("Error!", "Please input minterms to solve!", live, messagebox.showerror)
         minterms = self.minterms_entry.get().replace(" ", "").strip(',')
         minterms = [int(x) for x in minterms.split(',') if x.isdigit()] #remove all characters which are not numbers
         if not minterms:
-            return messagebox.showinfo("Wrong Input!", "Please input numbers for minterms!")
-        if int(max(minterms)) > 15:
-            return messagebox.showinfo("Exceeded Limit!", "Maximum minterm should be 15, since its 4 variables.")
+            return self.report("Wrong Input!", "Please input numbers for minterms!", live)
 
     
         if self.dont_cares_entry.get() == "Enter don't cares (e.g., 3, 4)":
@@ -79,143 +133,117 @@ class Quine_McCluskey:
         else:
             dont_cares = self.dont_cares_entry.get().replace(" ", "").strip(',')
             dont_cares = [int(x) for x in dont_cares.split(',') if x.isdigit()]
-            if int(max(dont_cares)) > 15:
-                return messagebox.showinfo("Exceeded Limit!", "Maximum dont care should be 15, since its 4 variables.")
 
 
-        if self.variables_entry.get() == "Enter variables if you want to change default (e.g., A, B, C, D)":
-            variables = ['A', 'B', 'C', 'D']
-        else:
-            variables = self.variables_entry.get().replace(" ", "").strip(',').split(',')
-            if len(variables) > 4:
-                return messagebox.showinfo("Exceeded Limit!", "Too many variables, input just 4!")
-
+        try:
+            if self.variables_entry.get() == "Enter variables if you want to change default (e.g., A, B, C, D)":
+                num_vars = max(resolve_num_vars(minterms, dont_cares), 2)
+                variables = variable_names(num_vars)
+            else:
+                variables = self.variables_entry.get().replace(" ", "").strip(',').split(',')
+                num_vars = resolve_num_vars(minterms, dont_cares, len(variables))
+        except ValueError as error:
+            return self.report("Exceeded Limit!", str(error), live)
+        return minterms, dont_cares, variables, num_vars
+
+    def schedule_live_solve(self, event=None):
+        # restart the countdown on every keystroke so only the pause after the last one solves
+        if self.live_solve_id is not None:
+            self.root.after_cancel(self.live_solve_id)
+        self.live_solve_id = self.root.after(LIVE_SOLVE_DELAY_MS, self.live_solve) if self.live.get() else None
+
+    def live_solve(self):
+        self.live_solve_id = None
+        self.solve(live=True)
+
+    def solve(self, live=False):
+        inputs = self.read_inputs(live)
+        if inputs is None:
+            return
+        minterms, dont_cares, variables, num_vars = inputs
+        if self.job is not None:
+            if self.job['inputs'] == inputs:
+                return
+            # the inputs changed under a running solve, whose answer is no longer wanted
+            self.stop_job()
 
         print(f"Minterms: {minterms}")
         print(f"Don't Cares: {dont_cares}")
         print(f"Variables: {variables}")
 
-        print("Solving...")
-
-        def to_binary(num, num_vars):
-            return f"{num:0{num_vars}b}"
+        # up to four variables the answer is usually in the precomputed table
+        final_prime_implicants = lookup_cover(minterms, dont_cares, num_vars)
+        if final_prime_implicants is None:
+            final_prime_implicants = self.cache.get(canonical_key(minterms, dont_cares, num_vars))
+        if final_prime_implicants is not None:
+            return self.show_answer(final_prime_implicants, inputs)
 
-        def count_ones(binary):
-            return binary.count('1')
-
-        def combine_terms(term1, term2):
-            diff_count = 0
-            combined = []
-            for bit1, bit2 in zip(term1, term2):
-                if bit1 != bit2:
-                    diff_count += 1
-                    combined.append('-')
+        print("Solving...")
+        messages = multiprocessing.Queue()
+        process = multiprocessing.Process(target=solve_in_background, args=(messages, minterms, dont_cares, num_vars),
+                                          daemon=True)
+        process.start()
+        self.job = {'process': process, 'messages': messages, 'inputs': inputs, 'live': live,
+                    'started': time.perf_counter(), 'primes': 0}
+        self.cancel_button.state(['!disabled'])
+        self.status.set("Solving...")
+        self.root.after(POLL_INTERVAL_MS, self.poll, self.job)
+
+    def poll(self, job):
+        if job is not self.job:
+            return  # cancelled or replaced by a newer solve
+        elapsed = time.perf_counter() - job['started']
+        # checked before draining, so a worker that posts its answer and exits in between is not mistaken for a crash
+        alive = job['process'].is_alive()
+        while True:
+            try:
+                message = job['messages'].get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == 'progress':
+                _, event, counters = message
+                if event == 'level':
+                    # each level reports only the primes it found, so keep the running total here
+                    job['primes'] += counters['prime_implicants']
+                    self.status.set(f"Solving... {elapsed:.1f}s, prime implicants: level {counters['level']}, "
+                                    f"{counters['terms']} terms, {job['primes']} primes so far")
                 else:
-                    combined.append(bit1)
-            return ''.join(combined) if diff_count == 1 else None
-
-        def find_prime_implicants(minterms, num_vars):
-            groups = {i: [] for i in range(num_vars + 1)}
-            for minterm in minterms:
-                binary = to_binary(minterm, num_vars)
-                groups[count_ones(binary)].append(binary)
-
-            prime_implicants = []
-            checked = []
-            while any(groups.values()):
-                next_groups = {i: [] for i in range(num_vars + 1)}
-                for i in range(num_vars):
-                    for term1 in groups[i]:
-                        for term2 in groups[i + 1]:
-                            combined = combine_terms(term1, term2)
-                            if combined:
-                                checked.append(term1)
-                                checked.append(term2)
-                                next_groups[count_ones(combined)].append(combined)
-                prime_implicants.extend([term for group in groups.values() for term in group if term not in checked])
-                groups = next_groups
-
-            return prime_implicants
-
-        def build_chart(minterms, prime_implicants):
-            chart = {pi: [] for pi in prime_implicants}
-            for minterm in minterms:
-                binary = to_binary(minterm, len(next(iter(prime_implicants))))
-                for pi in prime_implicants:
-                    if all(pi_bit == '-' or pi_bit == minterm_bit for pi_bit, minterm_bit in zip(pi, binary)):
-                        chart[pi].append(minterm)
-            return chart
-
-        def extract_essential_prime_implicants(chart):
-            essential_pis = []
-            covered_minterms = []
-
-            for pi, minterms in sorted(chart.items()):
-                uncovered = [m for m in minterms if m not in covered_minterms]
-                if len(uncovered) == 1:
-                    essential_pis.append(pi)
-                    covered_minterms.extend(minterms)
-            return essential_pis, covered_minterms
-
-        def iterative_reduction(chart, essential_pis):
-            covered_minterms = []
-            for pi in essential_pis:
-                covered_minterms.extend(chart[pi])
-            covered_minterms = list(set(covered_minterms))
-
-            remaining_chart = {}
-            for pi, minterms in chart.items():
-                remaining_minterms = [m for m in minterms if m not in covered_minterms]
-                if remaining_minterms:
-                    remaining_chart[pi] = remaining_minterms
-
-            while remaining_chart:
-                max_pi = max(remaining_chart, key=lambda pi: len(remaining_chart[pi]))
-                essential_pis.append(max_pi)
-                covered_minterms.extend(remaining_chart[max_pi])
-                covered_minterms = list(set(covered_minterms))
-
-                new_remaining_chart = {}
-                for pi, minterms in remaining_chart.items():
-                    remaining_minterms = [m for m in minterms if m not in covered_minterms]
-                    if remaining_minterms:
-                        new_remaining_chart[pi] = remaining_minterms
-                remaining_chart = new_remaining_chart
-
-            return essential_pis
-
-        def minimize_function(minterms, dont_cares, num_vars):
-            all_terms = minterms + dont_cares
-            prime_implicants = find_prime_implicants(all_terms, num_vars)
-            chart = build_chart(minterms, prime_implicants)
-
-            essential_pis, _ = extract_essential_prime_implicants(chart)
-            final_pis = iterative_reduction(chart, essential_pis)
-
-            return final_pis
-        
-
-        def sop_expression(prime_implicants):
-            # variables = ['A', 'B', 'C', 'D']  
-            terms = []
-
-            for pi in sorted(prime_implicants):
-                term = ''
-                for idx, bit in enumerate(pi):
-                    if bit == '0':
-                        term += f"{variables[idx]}'"
-                    elif bit == '1':
-                        term += f"{variables[idx]}"
-                terms.append(term)
-
-            return ' + '.join(sorted(terms))
-        
-
-        final_prime_implicants = minimize_function(minterms, dont_cares, len(variables))
-        final_expression = sop_expression(final_prime_implicants)
+                    self.status.set(f"Solving... {elapsed:.1f}s, {event.replace('_', ' ')} done")
+            elif message[0] == 'done':
+                self.stop_job()
+                minterms, dont_cares, _, num_vars = job['inputs']
+                self.cache.put(canonical_key(minterms, dont_cares, num_vars), message[1])
+                return self.show_answer(message[1], job['inputs'], elapsed)
+            else:
+                self.stop_job()
+                self.status.set("")
+                return self.report(message[1], message[2], job['live'], messagebox.showerror)
+        if not alive:
+            self.stop_job()
+            return self.report("Error!", "The solver stopped unexpectedly.", job['live'], messagebox.showerror)
+        self.root.after(POLL_INTERVAL_MS, self.poll, job)
+
+    def stop_job(self):
+        # terminating the process is the only way to interrupt a solve that is under way
+        if self.job['process'].is_alive():
+            self.job['process'].terminate()
+        self.job['process'].join()
+        self.job = None
+        self.cancel_button.state(['disabled'])
+
+    def cancel(self):
+        if self.job is not None:
+            self.stop_job()
+            self.status.set("Cancelled.")
+            print("Cancelled.")
+
+    def show_answer(self, final_prime_implicants, inputs, elapsed=None):
+        _, _, variables, num_vars = inputs
+        final_expression = sop_expression(final_prime_implicants, num_vars, variables)
 
         print("Minimized Boolean Function: F = ", final_expression)
         self.answer.set(f"F = {final_expression}")
+        self.status.set("" if elapsed is None else f"Solved in {elapsed:.2f}s")
 
 if __name__ == "__main__":
     root = tk.Tk()
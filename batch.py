@@ -0,0 +1,748 @@
+"""
+Streaming batch minimization: many functions per process, read from JSON Lines or Berkeley PLA input.
+
+Every stage is a generator, so only the record being solved is ever held in memory, however large the
+input is:
+
+    read_lines(paths) -> parse_records(lines, format) -> solve_records(records) -> write_results(results)
+
+JSON Lines input has one function per line:
+
+    {"id": "f1", "minterms": [1, 2, 5], "dont_cares": [7], "num_vars": 3, "variables": ["A", "B", "C"]}
+
+Only "minterms" is required; "id" defaults to the line number. PLA input may hold several functions, each
+ending at ".e"; every output column becomes its own record. Each result is written as one JSON line:
+
+    {"id": "f1", "expression": "A'B + BC'", "terms": ["01-", "-10"]}
+
+or {"id": "f1", "error": "..."} when that function could not be minimized.
+
+Several outputs over the same inputs can instead be minimized together, sharing product terms (see
+multi_output.py). A JSON line then lists them under "outputs", and PLA functions are kept whole with
+multi_output=True:
+
+    {"id": "adder", "num_vars": 3, "outputs": [{"name": "S", "minterms": [1, 2, 4, 7]}, {"name": "C", "minterms": [3, 5, 6, 7]}]}
+
+and the result has one expression per output plus the table of shared products:
+
+    {"id": "adder", "expressions": {"S": "...", "C": "..."}, "terms": [{"term": "-11", "outputs": ["C"]}, ...]}
+
+Functions can also be given as truth tables instead of minterm lists: "truth_table" in hex (the table as
+an integer, bit m for minterm m, so "e8" is the majority of three inputs) with an optional
+"dont_care_table", "bits" as a string of 0, 1 and - (don't care) with minterm 0 last, or "bitmap" and
+"dont_care_bitmap" as base64 packed bitmaps (see bitmaps.py). Raw bitmap files are read with
+bitmap_file_records instead of parse_records and mapped into memory by the worker that solves them:
+
+    {"id": "maj", "truth_table": "e8"}
+    {"id": "f2", "bits": "0110-001", "variables": ["A", "B", "C"]}
+
+solve_records_parallel is a drop-in replacement for solve_records that spreads records over a pool of
+worker processes, in chunks to amortize the inter-process traffic.
+"""
+import base64
+import binascii
+import json
+import os
+import signal
+import sqlite3
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import islice
+
+from bitmaps import (
+    bitmap_num_vars, check_bitmap, iter_bitmap_minterms, open_bitmap_file, parse_bit_table, parse_hex_table,
+)
+from cache import canonical_key, shared_cache
+from checkpoint import DEFAULT_CHECKPOINT_INTERVAL, Checkpoint
+from forms import cover_cost, form_expression, minimize_cheapest_form, off_set
+from lookup_table import lookup_cover
+from multi_output import minimize_multi_output, shared_terms
+from npn import minimize_npn
+from quine_mccluskey import (
+    MemoryBudgetExceeded, MinimizationStats, minimize_function, resolve_num_vars, sop_expression, timed, to_binary,
+)
+from verify import verify_cover
+
+# Records sent to a worker process per task
+DEFAULT_CHUNK_SIZE = 32
+
+# Options of minimize_function that minimize_multi_output also takes; the rest do not apply to it
+MULTI_OUTPUT_OPTIONS = ('memory_budget', 'cover', 'time_budget', 'node_budget')
+
+
+class ItemTimeout(Exception):
+    """
+    Raised inside a worker when a single record runs past its time limit.
+    """
+
+# Function to stream lines from files or stdin
+def read_lines(paths):
+    """
+    Yields the lines of each file in turn, reading stdin for '-'.
+
+    Args:
+        paths (list of str): File paths, '-' for stdin.
+
+    Yields:
+        tuple: (source name, line number, line) for every line.
+    """
+    for path in paths:
+        if path == '-':
+            for number, line in enumerate(sys.stdin, 1):
+                yield '<stdin>', number, line
+        else:
+            with open(path) as lines:
+                for number, line in enumerate(lines, 1):
+                    yield path, number, line
+
+# Function to parse the truth table of a JSON Lines record
+def parse_compact_table(data):
+    """
+    Parses the truth table fields of a JSON Lines record into bitmaps.
+
+    Args:
+        data (dict): The decoded JSON object, with truth_table, bits or bitmap.
+
+    Returns:
+        tuple: The on-set bitmap, the don't-care bitmap (None for none) and the number of variables.
+
+    Raises:
+        ValueError: If a field is malformed or the tables disagree on the number of variables.
+    """
+    num_vars = data.get('num_vars')
+    if num_vars is None and data.get('variables'):
+        num_vars = len(data['variables'])
+    if 'truth_table' in data:
+        on_set, num_vars = parse_hex_table(data['truth_table'], num_vars)
+        dont_cares = parse_hex_table(data['dont_care_table'], num_vars)[0] if 'dont_care_table' in data else None
+    elif 'bits' in data:
+        on_set, dont_cares, num_vars = parse_bit_table(data['bits'], num_vars)
+    else:
+        on_set = base64.b64decode(data['bitmap'], validate=True)
+        dont_cares = base64.b64decode(data['dont_care_bitmap'], validate=True) if 'dont_care_bitmap' in data else None
+        if num_vars is None:
+            num_vars = bitmap_num_vars(len(on_set))
+    for bitmap in (on_set, dont_cares):
+        if bitmap is not None:
+            check_bitmap(bitmap, num_vars)
+    return on_set, dont_cares, num_vars
+
+# Function to check the types of a JSON Lines record's fields
+def check_fields(data):
+    """
+    Checks the fields of a decoded JSON Lines record that the solver relies on the type of, so a record
+    with valid JSON but wrong types is reported instead of failing in the solver.
+
+    Args:
+        data (dict): The decoded JSON object.
+
+    Raises:
+        TypeError: If data is not an object, num_vars is not an int, variables is not a list of strings,
+            or minterms, dont_cares or an output's terms are not lists of ints.
+    """
+    if not isinstance(data, dict):
+        raise TypeError("a record must be a JSON object")
+    num_vars = data.get('num_vars')
+    if num_vars is not None and (not isinstance(num_vars, int) or isinstance(num_vars, bool)):
+        raise TypeError(f"num_vars must be an integer, got {num_vars!r}")
+    variables = data.get('variables')
+    if variables is not None and (not isinstance(variables, list)
+                                  or not all(isinstance(name, str) for name in variables)):
+        raise TypeError(f"variables must be a list of strings, got {variables!r}")
+    term_lists = [(name, data[name]) for name in ('minterms', 'dont_cares') if name in data]
+    if 'outputs' in data:
+        if not isinstance(data['outputs'], list) or not all(isinstance(output, dict) for output in data['outputs']):
+            raise TypeError("outputs must be a list of objects")
+        term_lists += [(name, output[name]) for output in data['outputs']
+                       for name in ('minterms', 'dont_cares') if name in output]
+    for name, terms in term_lists:
+        if not isinstance(terms, list) or not all(isinstance(term, int) and not isinstance(term, bool)
+                                                  for term in terms):
+            raise TypeError(f"{name} must be a list of integers, got {terms!r}")
+
+# Function to parse JSON Lines records
+def parse_jsonl(lines):
+    """
+    Parses one function per non-blank line of JSON.
+
+    Args:
+        lines (iterable of tuple): (source, line number, line) tuples as yielded by read_lines.
+
+    Yields:
+        dict: A record with id, minterms, dont_cares, num_vars and variables (outputs instead of minterms
+        and dont_cares for a multi-output line, bitmap and dont_care_bitmap as bytes for a truth table), or
+        with id and error if the line is not a valid record.
+    """
+    for source, number, line in lines:
+        if not line.strip():
+            continue
+        record_id = f"{source}:{number}"
+        try:
+            data = json.loads(line)
+            if isinstance(data, dict):
+                record_id = data.get('id', record_id)
+            check_fields(data)
+            if 'outputs' in data:
+                yield {
+                    'id': record_id,
+                    'outputs': [{
+                        'name': str(output.get('name', idx)),
+                        'minterms': [int(m) for m in output['minterms']],
+                        'dont_cares': [int(d) for d in output.get('dont_cares', [])],
+                    } for idx, output in enumerate(data['outputs'])],
+                    'num_vars': data.get('num_vars'),
+                    'variables': data.get('variables'),
+                }
+                continue
+            if 'minterms' not in data and ('truth_table' in data or 'bits' in data or 'bitmap' in data):
+                on_set, dont_cares, num_vars = parse_compact_table(data)
+                yield {
+                    'id': record_id,
+                    'bitmap': on_set,
+                    'dont_care_bitmap': dont_cares,
+                    'num_vars': num_vars,
+                    'variables': data.get('variables'),
+                }
+                continue
+            yield {
+                'id': record_id,
+                'minterms': [int(m) for m in data['minterms']],
+                'dont_cares': [int(d) for d in data.get('dont_cares', [])],
+                'num_vars': data.get('num_vars'),
+                'variables': data.get('variables'),
+            }
+        except (ValueError, TypeError, KeyError, AttributeError, binascii.Error) as error:
+            yield {'id': record_id, 'error': f"Invalid record: {error!r}"}
+
+# Function to make records of raw bitmap files
+def bitmap_file_records(paths, num_vars=None):
+    """
+    Makes one record per raw truth-table file (see open_bitmap_file). Only the path travels with the
+    record; the worker that solves it maps the file and reads the minterms from the mapping.
+
+    Args:
+        paths (list of str): The files.
+        num_vars (int or None): Number of variables of every file, or None to infer it from each file's
+            size (which then only holds an on-set).
+
+    Yields:
+        dict: A record with id, bitmap_file, num_vars and variables.
+    """
+    for path in paths:
+        yield {'id': path, 'bitmap_file': path, 'num_vars': num_vars, 'variables': None}
+
+# Function to read the minterms of a record
+def record_terms(record, num_vars):
+    """
+    Gets the minterms and don't cares of a single-output record, decoding them from its bitmaps (in
+    memory or mapped from its file) when it has no lists.
+
+    Args:
+        record (dict): A record as yielded by parse_records or bitmap_file_records.
+        num_vars (int or None): The record's number of variables, if known.
+
+    Returns:
+        tuple: The minterms, the don't cares and the number of variables (None if still unknown).
+
+    Raises:
+        ValueError: If a bitmap file cannot be read or does not hold a truth table of num_vars variables.
+    """
+    if 'bitmap_file' in record:
+        try:
+            on_set, dont_cares, num_vars = open_bitmap_file(record['bitmap_file'], num_vars)
+        except OSError as error:
+            raise ValueError(f"Cannot read {record['bitmap_file']}: {error.strerror}") from error
+    elif 'bitmap' in record:
+        on_set, dont_cares = record['bitmap'], record['dont_care_bitmap']
+    else:
+        return record['minterms'], record['dont_cares'], num_vars
+    minterms = list(iter_bitmap_minterms(on_set))
+    return minterms, [] if dont_cares is None else list(iter_bitmap_minterms(dont_cares)), num_vars
+
+# Function to list the minterms of a PLA input cube
+def pla_cube_minterms(cube):
+    """
+    Expands a PLA input cube such as '01-1' into the minterms it covers.
+
+    Args:
+        cube (str): The input part of a PLA line.
+
+    Returns:
+        list of int: The covered minterms.
+    """
+    value = int(cube.replace('-', '0'), 2)
+    free = int(''.join('1' if bit == '-' else '0' for bit in cube), 2)
+    minterms = []
+    sub = free
+    while True:
+        minterms.append(value | sub)
+        if not sub:
+            return minterms
+        sub = (sub - 1) & free
+
+# Function to turn one parsed PLA function into records
+def pla_records(function, multi_output=False):
+    """
+    Yields one record per output column of a parsed PLA function, or one multi-output record.
+
+    Args:
+        function (dict): The function as collected by parse_pla.
+        multi_output (bool): Yield all outputs as one record, to be minimized together.
+
+    Yields:
+        dict: A record per output, or a single record with id and error if the function is malformed.
+    """
+    name = f"{function['source']}:{function['index']}"
+    if function['error']:
+        yield {'id': name, 'error': function['error']}
+        return
+    cubes = function['cubes']
+    num_outputs = function['num_outputs'] or (len(cubes[0][1]) if cubes else 1)
+    output_labels = function['output_labels'] or [str(output) for output in range(num_outputs)]
+    if len(output_labels) != num_outputs or any(len(outputs) != num_outputs for _, outputs in cubes):
+        yield {'id': name, 'error': f"expected {num_outputs} outputs on every line and in .ob"}
+        return
+    columns = []
+    for output, label in enumerate(output_labels):
+        minterms = set()
+        dont_cares = set()
+        for inputs, outputs in cubes:
+            if outputs[output] == '1':
+                minterms.update(pla_cube_minterms(inputs))
+            elif outputs[output] in '-~2':
+                dont_cares.update(pla_cube_minterms(inputs))
+        columns.append({'name': label, 'minterms': sorted(minterms), 'dont_cares': sorted(dont_cares - minterms)})
+    if multi_output:
+        yield {'id': name, 'outputs': columns, 'num_vars': function['num_inputs'],
+               'variables': function['input_labels']}
+        return
+    for column in columns:
+        yield {
+            'id': f"{name}:{column['name']}",
+            'minterms': column['minterms'],
+            'dont_cares': column['dont_cares'],
+            'num_vars': function['num_inputs'],
+            'variables': function['input_labels'],
+        }
+
+# Function to parse Berkeley PLA records
+def parse_pla(lines, multi_output=False):
+    """
+    Parses Berkeley PLA functions (types f and fd). A function ends at '.e', '.end' or the end of its
+    file, and each output column is yielded as its own record named '<source>:<function>:<output>', or
+    with multi_output the whole function as one record named '<source>:<function>'.
+
+    Args:
+        lines (iterable of tuple): (source, line number, line) tuples as yielded by read_lines.
+        multi_output (bool): Yield each function as one multi-output record.
+
+    Yields:
+        dict: A record with id, minterms, dont_cares, num_vars and variables, or with id and error if the
+        function is malformed.
+    """
+    function = None
+    current_source = None
+    index = 0
+    for source, number, line in lines:
+        if source != current_source:
+            if function is not None:
+                yield from pla_records(function, multi_output)
+                function = None
+            current_source = source
+            index = 0
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if function is None:
+            function = {'source': source, 'index': index, 'num_inputs': None, 'num_outputs': None,
+                        'input_labels': None, 'output_labels': None, 'cubes': [], 'error': None}
+        fields = line.split()
+        keyword = fields[0]
+        if keyword in ('.e', '.end'):
+            yield from pla_records(function, multi_output)
+            function = None
+            index += 1
+        elif function['error']:
+            continue
+        elif keyword in ('.i', '.o', '.type') and (
+                len(fields) != 2 or keyword != '.type' and not fields[1].isdecimal()):
+            function['error'] = f"line {number}: malformed PLA directive {line!r}"
+        elif keyword == '.i':
+            function['num_inputs'] = int(fields[1])
+        elif keyword == '.o':
+            function['num_outputs'] = int(fields[1])
+        elif keyword == '.ilb':
+            function['input_labels'] = fields[1:]
+        elif keyword == '.ob':
+            function['output_labels'] = fields[1:]
+        elif keyword == '.type' and fields[1] not in ('f', 'fd'):
+            function['error'] = f"line {number}: unsupported PLA type {fields[1]!r}"
+        elif keyword.startswith('.'):
+            continue  # .p and other directives carry nothing the solver needs
+        elif len(fields) == 2 and len(fields[0]) == function['num_inputs'] and set(fields[0]) <= set('01-'):
+            function['cubes'].append((fields[0], fields[1]))
+        else:
+            function['error'] = f"line {number}: malformed PLA line {line!r}"
+    if function is not None:
+        yield from pla_records(function, multi_output)
+
+# Function to parse records in either format
+def parse_records(lines, format='jsonl', multi_output=False):
+    """
+    Parses records from lines in the given format.
+
+    Args:
+        lines (iterable of tuple): (source, line number, line) tuples as yielded by read_lines.
+        format (str): 'jsonl' or 'pla'.
+        multi_output (bool): Keep the outputs of each PLA function together in one record (JSON Lines
+            records are multi-output when they have "outputs").
+
+    Returns:
+        iterator of dict: The parsed records.
+    """
+    if format == 'jsonl':
+        return parse_jsonl(lines)
+    if format == 'pla':
+        return parse_pla(lines, multi_output)
+    raise ValueError(f"Unknown format {format!r}, expected 'jsonl' or 'pla'.")
+
+# Function to minimize a multi-output record
+def solve_multi_output_record(record, num_vars, verify=False, **options):
+    """
+    Minimizes the outputs of a record together with minimize_multi_output.
+
+    Args:
+        record (dict): A record with outputs, as yielded by parse_records.
+        num_vars (int): Number of variables.
+        verify (bool): Check every output's cover with verify_cover, as solve_record does; the cost is
+            that of the shared products.
+        **options: Keyword arguments for minimize_function; those not in MULTI_OUTPUT_OPTIONS are ignored.
+
+    Returns:
+        dict: The result with id, an expression per output name and the shared product terms.
+    """
+    names = [output['name'] for output in record['outputs']]
+    covers = minimize_multi_output(
+        [(output['minterms'], output['dont_cares']) for output in record['outputs']], num_vars,
+        **{name: value for name, value in options.items() if name in MULTI_OUTPUT_OPTIONS})
+    products = shared_terms(covers)
+    result = {
+        'id': record['id'],
+        'expressions': {name: sop_expression(cover, num_vars, record['variables'])
+                        for name, cover in zip(names, covers)},
+        'terms': [{'term': to_binary(term, num_vars), 'outputs': [names[output] for output in outputs]}
+                  for term, outputs in products],
+    }
+    if verify:
+        failures = {}
+        for name, output, cover in zip(names, record['outputs'], covers):
+            report = verify_cover(cover, output['minterms'], output['dont_cares'], num_vars)
+            if not report['passed']:
+                failures[name] = {'uncovered': report['uncovered'], 'wrong': report['wrong']}
+        result['verified'] = not failures
+        result['cost'] = cover_cost([term for term, _ in products])
+        if failures:
+            result['counterexamples'] = failures
+            result['error'] = f"Covers of {', '.join(failures)} failed verification."
+    return result
+
+# Function to minimize one set of terms with the table, NPN and cache shortcuts
+def solve_terms(minterms, dont_cares, num_vars, cache=None, npn=False, checkpoint=None,
+                checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL, checkpoint_levels=None, **options):
+    """
+    Minimizes a function the way solve_record does: through the lookup table when it has the answer,
+    otherwise through its NPN representative, the cache or minimize_function as asked.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int): Number of variables.
+        cache (bool, str or None): As for solve_record.
+        npn (bool): As for solve_record.
+        checkpoint (str or None): Directory to checkpoint the solve in (see checkpoint.py), one file per
+            function named after its canonical_key, so a rerun after preemption resumes it; None for none.
+        checkpoint_interval (float or None): Seconds between saves.
+        checkpoint_levels (int or None): Also save every this many levels of prime implicant generation.
+        **options: Extra keyword arguments for minimize_function; a MinimizationStats under 'stats' is
+            also marked lookup_table on a table hit.
+
+    Returns:
+        list of Implicant: The minimized prime implicants.
+    """
+    # functions of up to four variables are usually in the precomputed table
+    implicants = lookup_cover(minterms, dont_cares, num_vars)
+    if implicants is not None:
+        if options.get('stats'):
+            options['stats'].count(lookup_table=True)
+        return implicants
+    if checkpoint is not None:
+        options['checkpoint'] = Checkpoint(
+            os.path.join(checkpoint, f"{canonical_key(minterms, dont_cares, num_vars)}.qmck"),
+            checkpoint_interval, checkpoint_levels)
+    if npn:
+        return minimize_npn(minterms, dont_cares, num_vars,
+                            cache=shared_cache(None if cache in (None, True) else cache), **options)
+    if cache:
+        return shared_cache(None if cache is True else cache).minimize(minterms, dont_cares, num_vars, **options)
+    return minimize_function(minterms, dont_cares, num_vars, **options)
+
+# Function to minimize a single record
+def solve_record(record, cache=None, npn=False, stats=False, form='sop', verify=True, **options):
+    """
+    Minimizes one record, turning any failure into an error result instead of raising. Multi-output
+    records go to solve_multi_output_record, without the cache, NPN or lookup table.
+
+    Args:
+        record (dict): A record as yielded by parse_records.
+        cache (bool, str or None): True to memoize results in this process, a path to also share them
+            through that SQLite file (see cache.py), None for no caching.
+        npn (bool): Minimize through the function's NPN class representative (see npn.py), so functions
+            equal up to input permutation and input negation share one solve. Implies an
+            in-memory cache.
+        stats (bool): Add the solve's MinimizationStats to the result as 'stats'. A function answered by
+            the lookup table (marked lookup_table) or the cache has no phases to report. With form 'auto',
+            each side's stats are kept apart under 'sides' (see minimize_cheapest_form).
+        form (str): 'sop' for a sum of products, 'pos' for a product of sums from the off-set, 'auto' for
+            the cheaper of the two (see forms.py). With 'pos' or 'auto' the result also has the form and
+            its cost, and its terms are the off-set's implicants for a product of sums.
+        verify (bool): Check the cover with verify_cover and add verified and its cost to the result. A
+            cover that fails also gets counterexamples (see verify_cover) and an error, keeping its
+            expression for inspection.
+        **options: Extra keyword arguments for minimize_function.
+
+    Returns:
+        dict: The result with id, expression and terms (expressions and terms for a multi-output record),
+        or with id and error.
+    """
+    if 'error' in record:
+        return {'id': record['id'], 'error': record['error']}
+    if form not in ('sop', 'pos', 'auto'):
+        return {'id': record['id'], 'error': f"Unknown form {form!r}, expected 'sop', 'pos' or 'auto'."}
+    form_option = form
+    try:
+        variables = record['variables']
+        num_vars = record['num_vars']
+        if num_vars is None and variables:
+            num_vars = len(variables)
+        if 'outputs' in record:
+            terms = [term for output in record['outputs'] for term in output['minterms'] + output['dont_cares']]
+            num_vars = resolve_num_vars(terms, [], num_vars)
+        else:
+            minterms, dont_cares, num_vars = record_terms(record, num_vars)
+            num_vars = resolve_num_vars(minterms, dont_cares, num_vars)
+        if variables is not None and len(variables) != num_vars:
+            raise ValueError(f"Expected {num_vars} variable names, got {len(variables)}.")
+        if 'outputs' in record:
+            return solve_multi_output_record(record, num_vars, verify, **options)
+        if stats:
+            stats = options['stats'] = MinimizationStats()
+        solve = partial(solve_terms, cache=cache, npn=npn, **options)
+        if form == 'sop':
+            implicants = solve(minterms, dont_cares, num_vars)
+        elif form == 'pos':
+            implicants = solve(off_set(minterms, dont_cares, num_vars), dont_cares, num_vars)
+        else:
+            form, implicants, _ = minimize_cheapest_form(minterms, dont_cares, num_vars, solve=solve, **options)
+        result = {
+            'id': record['id'],
+            'expression': form_expression(form, implicants, num_vars, variables),
+            'terms': [to_binary(implicant, num_vars) for implicant in sorted(implicants)],
+        }
+        if form_option != 'sop':
+            result['form'] = form
+            result['cost'] = cover_cost(implicants)
+        if verify:
+            with timed(stats or None, 'verify'):
+                report = verify_cover(implicants, minterms, dont_cares, num_vars, form)
+            result['verified'] = report['passed']
+            result['cost'] = report['cost']
+            if not report['passed']:
+                result['counterexamples'] = {'uncovered': report['uncovered'], 'wrong': report['wrong']}
+                result['error'] = "Cover failed verification."
+        if stats:
+            result['stats'] = stats.as_dict()
+        return result
+    except (TypeError, ValueError, MemoryBudgetExceeded, OSError, sqlite3.Error) as error:
+        # errors from the checkpoint, lookup or cache files fail only this record, as in a parallel run
+        return {'id': record['id'], 'error': str(error)}
+
+# Function to minimize a single record within a time limit
+def solve_record_with_timeout(record, timeout=None, **options):
+    """
+    Minimizes one record like solve_record, giving up after timeout seconds. The limit relies on
+    SIGALRM, so it only applies on POSIX systems and in the main thread of a process.
+
+    Args:
+        record (dict): A record as yielded by parse_records.
+        timeout (float or None): Seconds allowed for the record, None for no limit.
+        **options: Extra keyword arguments for minimize_function.
+
+    Returns:
+        dict: The result with id, expression and terms, or with id and error.
+    """
+    if not timeout or not hasattr(signal, 'setitimer'):
+        return solve_record(record, **options)
+
+    def expire(signum, frame):
+        raise ItemTimeout()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return solve_record(record, **options)
+    except ItemTimeout:
+        return {'id': record['id'], 'error': f"Timed out after {timeout} seconds."}
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+# Function to minimize a chunk of records in a worker process
+def solve_chunk(records, timeout, options):
+    """
+    Minimizes a list of records; the unit of work sent to each worker process.
+
+    Args:
+        records (list of dict): Records as yielded by parse_records.
+        timeout (float or None): Seconds allowed per record, None for no limit.
+        options (dict): Extra keyword arguments for minimize_function.
+
+    Returns:
+        list of dict: One result per record, in the same order.
+    """
+    return [solve_record_with_timeout(record, timeout, **options) for record in records]
+
+# Function to minimize a stream of records
+def solve_records(records, timeout=None, **options):
+    """
+    Minimizes each record as it arrives.
+
+    Args:
+        records (iterable of dict): Records as yielded by parse_records.
+        timeout (float or None): Seconds allowed per record, None for no limit.
+        **options: Extra keyword arguments for minimize_function.
+
+    Yields:
+        dict: One result per record, in input order.
+    """
+    for record in records:
+        yield solve_record_with_timeout(record, timeout, **options)
+
+# Function to minimize a stream of records on a pool of worker processes
+def solve_records_parallel(records, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True, timeout=None,
+                           **options):
+    """
+    Minimizes records on a pool of worker processes. Records are read lazily and sent in chunks, with at
+    most two chunks per worker in flight, so memory stays flat however long the stream is.
+
+    If a worker process dies, the pool is restarted and every chunk it had in flight is re-run one
+    record at a time, so the record that brought it down gets an error result and the others are solved.
+    A chunk that raises is re-run the same way, on the same pool.
+
+    Args:
+        records (iterable of dict): Records as yielded by parse_records.
+        workers (int or None): Number of worker processes, None for one per CPU.
+        chunk_size (int): Records sent to a worker per task.
+        ordered (bool): Yield results in input order; otherwise as soon as each chunk completes.
+        timeout (float or None): Seconds allowed per record, None for no limit.
+        **options: Extra keyword arguments for minimize_function.
+
+    Yields:
+        dict: One result per record.
+    """
+    workers = workers or os.cpu_count() or 1
+    records = iter(records)
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+
+    # pending maps each future to (chunk number, offset in chunk, records); in ordered mode `waiting`
+    # holds the result slots of every chunk not yet yielded
+    pending = {}
+    waiting = {}
+    suspects = deque()
+    isolating = False
+    submitted = 0
+    next_chunk = 0
+    executor = ProcessPoolExecutor(workers)
+    try:
+        while True:
+            # records from a crashed pool run alone, so a second crash can only be their own
+            if not pending:
+                isolating = bool(suspects)
+                if isolating:
+                    number, offset, record = suspects.popleft()
+                    pending[executor.submit(solve_chunk, [record], timeout, options)] = (number, offset, [record])
+            while not isolating and len(pending) < 2 * workers:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                if ordered:
+                    waiting[submitted] = [None] * len(chunk)
+                pending[executor.submit(solve_chunk, chunk, timeout, options)] = (submitted, 0, chunk)
+                submitted += 1
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            completed = []
+            crashed = []
+            for future in finished:
+                number, offset, chunk = pending.pop(future)
+                try:
+                    completed.append((number, offset, future.result()))
+                except BrokenProcessPool:
+                    crashed.append((number, offset, chunk))
+                except Exception as error:
+                    # the pool is fine, but one record broke its chunk: re-run the chunk record by record
+                    if len(chunk) == 1:
+                        error_result = {'id': chunk[0]['id'], 'error': f"Solver failed: {error!r}"}
+                        completed.append((number, offset, [error_result]))
+                    else:
+                        for idx, record in enumerate(chunk):
+                            pending[executor.submit(solve_chunk, [record], timeout, options)] = (
+                                number, offset + idx, [record])
+
+            if crashed:
+                executor.shutdown(cancel_futures=True)
+                executor = ProcessPoolExecutor(workers)
+                if isolating:
+                    number, offset, chunk = crashed[0]
+                    completed.append((number, offset, [{'id': chunk[0]['id'], 'error': "Worker process crashed."}]))
+                else:
+                    # every future of a broken pool fails, so everything still in flight is suspect too
+                    crashed.extend(pending.values())
+                    pending.clear()
+                    for number, offset, chunk in crashed:
+                        suspects.extend((number, offset + idx, record) for idx, record in enumerate(chunk))
+
+            for number, offset, results in completed:
+                if ordered:
+                    waiting[number][offset:offset + len(results)] = results
+                else:
+                    yield from results
+            if ordered:
+                while next_chunk in waiting and None not in waiting[next_chunk]:
+                    yield from waiting.pop(next_chunk)
+                    next_chunk += 1
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+# Function to write results as JSON Lines
+def write_results(results, out):
+    """
+    Writes each result as one JSON line, flushing as it goes so downstream tools see results immediately.
+
+    Args:
+        results (iterable of dict): Results as yielded by solve_records.
+        out (file): A text file opened for writing.
+
+    Returns:
+        int: The number of results that carry an error.
+    """
+    errors = 0
+    for result in results:
+        errors += 'error' in result
+        out.write(json.dumps(result) + '\n')
+        out.flush()
+    return errors
@@ -0,0 +1,386 @@
+"""
+Reproducible benchmarks for the minimizer: seeded random functions over a range of variable counts and
+densities, plus structured families (adders, comparators, parity, decoders, a BCD to seven-segment
+decoder), each timed phase by phase with its peak memory and the cost of the cover it found.
+
+    python benchmark.py -o results.json
+    python benchmark.py --baseline results.json --threshold 0.25
+
+Results are written as JSON with the machine they ran on, so they can be kept as a baseline and compared
+on later runs: a case regresses when a phase time or its peak memory grows by more than the threshold, or
+when its cover gets more expensive at all. Exact covers that run out of their time budget depend on the
+machine's load, so their cover time and cost are only compared while both runs proved them optimal (a
+cover that stops being proven is a regression of its own). The exit status is 1 when anything regressed.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from multi_output import minimize_multi_output, shared_terms
+from quine_mccluskey import (
+    build_chart, exact_cover, extract_essential_prime_implicants, find_prime_implicants, implicant_cost,
+    iterative_reduction, numpy,
+)
+
+# Seed of the random corpus
+DEFAULT_SEED = 2024
+
+# Relative growth of a time or of peak memory reported as a regression
+DEFAULT_THRESHOLD = 0.2
+
+# Phases faster than this many seconds are too noisy to compare
+DEFAULT_MIN_TIME = 0.05
+
+# Search nodes allowed for the exact cover of multi-output cases, bounded by nodes rather than wall-clock
+# time so the cover found does not depend on how loaded the machine is
+MULTI_OUTPUT_NODE_BUDGET = 20000
+
+# Variable counts and on-set densities of the random corpus, with the quick corpus a subset
+RANDOM_VARS = (6, 8, 10, 12)
+QUICK_RANDOM_VARS = (6, 8)
+RANDOM_DENSITIES = (0.1, 0.3, 0.5)
+
+# Share of the off-set made don't cares in the random corpus
+RANDOM_DONT_CARE_DENSITY = 0.05
+
+# Segments a-g lit for each BCD digit 0-9
+SEVEN_SEGMENT_DIGITS = ('abcdef', 'bc', 'abdeg', 'abcdg', 'bcfg', 'acdfg', 'acdefg', 'abc', 'abcdefg', 'abcdfg')
+
+# Function to generate a seeded random function
+def random_function(rng, num_vars, density, dc_density=RANDOM_DONT_CARE_DENSITY):
+    """
+    Draws every minterm into the on-set with probability `density`, and each remaining one into the
+    don't cares with probability `dc_density`.
+
+    Args:
+        rng (random.Random): The seeded generator.
+        num_vars (int): Number of variables.
+        density (float): Share of minterms in the on-set.
+        dc_density (float): Share of the rest that are don't cares.
+
+    Returns:
+        tuple: The minterms and don't cares.
+    """
+    minterms = []
+    dont_cares = []
+    for minterm in range(1 << num_vars):
+        draw = rng.random()
+        if draw < density:
+            minterms.append(minterm)
+        elif draw < density + (1 - density) * dc_density:
+            dont_cares.append(minterm)
+    return minterms, dont_cares
+
+# Function to build the outputs of a ripple adder
+def adder_outputs(bits):
+    """
+    Builds the outputs of a `bits`-bit adder with inputs a then b, each most significant bit first.
+
+    Args:
+        bits (int): Width of each operand.
+
+    Returns:
+        list of tuple: (minterms, dont_cares) of each sum bit, least significant first, then the carry out.
+    """
+    outputs = [([], []) for _ in range(bits + 1)]
+    for a in range(1 << bits):
+        for b in range(1 << bits):
+            total = a + b
+            for bit in range(bits + 1):
+                if total >> bit & 1:
+                    outputs[bit][0].append(a << bits | b)
+    return outputs
+
+# Function to build a comparator
+def comparator(bits, relation):
+    """
+    Builds a comparison of two `bits`-bit operands a then b.
+
+    Args:
+        bits (int): Width of each operand.
+        relation (str): 'lt' for a < b, 'eq' for a == b.
+
+    Returns:
+        tuple: The minterms and (no) don't cares.
+    """
+    compare = (lambda a, b: a < b) if relation == 'lt' else (lambda a, b: a == b)
+    return [a << bits | b for a in range(1 << bits) for b in range(1 << bits) if compare(a, b)], []
+
+# Function to build a parity function
+def parity(num_vars):
+    """
+    Builds odd parity, the worst case for two-level minimization: no two minterms combine.
+
+    Args:
+        num_vars (int): Number of variables.
+
+    Returns:
+        tuple: The minterms and (no) don't cares.
+    """
+    return [minterm for minterm in range(1 << num_vars) if minterm.bit_count() & 1], []
+
+# Function to build the outputs of a decoder
+def decoder_outputs(bits):
+    """
+    Builds a `bits`-to-2**bits decoder with an active-high enable as its first input.
+
+    Args:
+        bits (int): Number of select inputs.
+
+    Returns:
+        list of tuple: (minterms, dont_cares) of each output.
+    """
+    return [([1 << bits | select], []) for select in range(1 << bits)]
+
+# Function to build the outputs of a BCD to seven-segment decoder
+def seven_segment_outputs():
+    """
+    Builds segments a-g of a BCD to seven-segment decoder, with inputs 10-15 as don't cares.
+
+    Returns:
+        list of tuple: (minterms, dont_cares) of each segment.
+    """
+    return [([digit for digit, lit in enumerate(SEVEN_SEGMENT_DIGITS) if segment in lit], list(range(10, 16)))
+            for segment in 'abcdefg']
+
+# Function to build the benchmark corpus
+def benchmark_corpus(seed=DEFAULT_SEED, quick=False):
+    """
+    Builds the benchmark cases. Single-output cases hold one function and are timed phase by phase;
+    multi-output ones are minimized together with minimize_multi_output.
+
+    Args:
+        seed (int): Seed of the random functions.
+        quick (bool): Use the small corpus, for a fast smoke run.
+
+    Returns:
+        list of dict: Cases with name, family, num_vars and functions as (minterms, dont_cares) pairs.
+    """
+    rng = random.Random(seed)
+    cases = []
+    for num_vars in QUICK_RANDOM_VARS if quick else RANDOM_VARS:
+        for density in RANDOM_DENSITIES:
+            cases.append({'name': f"random-{num_vars}-{density}", 'family': 'random', 'num_vars': num_vars,
+                          'functions': [random_function(rng, num_vars, density)]})
+
+    widths = (2, 3) if quick else (2, 3, 4)
+    for bits in widths:
+        outputs = adder_outputs(bits)
+        cases.append({'name': f"adder-{bits}-carry", 'family': 'adder', 'num_vars': 2 * bits,
+                      'functions': [outputs[-1]]})
+        cases.append({'name': f"adder-{bits}-all", 'family': 'adder', 'num_vars': 2 * bits, 'functions': outputs})
+        for relation in ('lt', 'eq'):
+            cases.append({'name': f"comparator-{bits}-{relation}", 'family': 'comparator', 'num_vars': 2 * bits,
+                          'functions': [comparator(bits, relation)]})
+    for num_vars in (4, 6) if quick else (4, 6, 8, 10):
+        cases.append({'name': f"parity-{num_vars}", 'family': 'parity', 'num_vars': num_vars,
+                      'functions': [parity(num_vars)]})
+    for bits in (2, 3) if quick else (2, 3, 4):
+        cases.append({'name': f"decoder-{bits}", 'family': 'decoder', 'num_vars': bits + 1,
+                      'functions': decoder_outputs(bits)})
+    cases.append({'name': 'seven-segment', 'family': 'decoder', 'num_vars': 4, 'functions': seven_segment_outputs()})
+    return cases
+
+# Function to run one case once
+def run_case(case, cover='exact'):
+    """
+    Minimizes a case, timing each phase of the pipeline.
+
+    Args:
+        case (dict): A case from benchmark_corpus.
+        cover (str): 'exact' or 'greedy', as in minimize_function.
+
+    Returns:
+        tuple: Seconds per phase (a dict) and the cover statistics (a dict with prime_implicants, optimal,
+        terms, literals and cost; multi-output cases count each shared product once). optimal is whether
+        the exact cover was proven minimal within its time budget; it is None for covers that do not
+        depend on the clock (greedy, and multi-output cases, which are bounded by nodes instead).
+    """
+    num_vars = case['num_vars']
+    if len(case['functions']) > 1:
+        start = time.perf_counter()
+        covers = minimize_multi_output(case['functions'], num_vars, cover=cover, time_budget=None,
+                                       node_budget=MULTI_OUTPUT_NODE_BUDGET)
+        phases = {'multi_output': time.perf_counter() - start}
+        products = [term for term, _ in shared_terms(covers)]
+        return phases, {'prime_implicants': None, 'optimal': None, 'terms': len(products),
+                        'literals': sum(term.care.bit_count() for term in products),
+                        'cost': sum(implicant_cost(term) for term in products)}
+
+    minterms, dont_cares = case['functions'][0]
+    phases = {}
+    start = time.perf_counter()
+    prime_implicants = find_prime_implicants(set(minterms).union(dont_cares), num_vars)
+    phases['find_prime_implicants'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chart = build_chart(minterms, prime_implicants, num_vars)
+    phases['build_chart'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    essential_pis, _ = extract_essential_prime_implicants(chart)
+    phases['extract_essential_prime_implicants'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if cover == 'exact':
+        final_pis, optimal = exact_cover(chart, essential_pis)
+    else:
+        final_pis = iterative_reduction(chart, essential_pis)
+        optimal = None
+    phases['cover'] = time.perf_counter() - start
+
+    return phases, {'prime_implicants': len(prime_implicants), 'optimal': optimal, 'terms': len(final_pis),
+                    'literals': sum(pi.care.bit_count() for pi in final_pis),
+                    'cost': sum(implicant_cost(pi) for pi in final_pis)}
+
+# Function to benchmark one case
+def benchmark_case(case, cover='exact', repeat=3):
+    """
+    Runs a case `repeat` times keeping the fastest time of each phase, then once more under
+    tracemalloc for its peak memory, so tracing does not distort the times.
+
+    Args:
+        case (dict): A case from benchmark_corpus.
+        cover (str): 'exact' or 'greedy'.
+        repeat (int): Timed runs.
+
+    Returns:
+        dict: The case's result: name, family, size, phases, total, peak_memory and cover statistics.
+    """
+    best = None
+    proven = True
+    for _ in range(max(repeat, 1)):
+        phases, stats = run_case(case, cover)
+        best = phases if best is None else {phase: min(best[phase], phases[phase]) for phase in phases}
+        proven = proven and stats['optimal'] is not False
+    if not proven:
+        # a cover cut off in any run is not a reliable cost or time
+        stats['optimal'] = False
+
+    tracemalloc.start()
+    try:
+        run_case(case, cover)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'name': case['name'],
+        'family': case['family'],
+        'num_vars': case['num_vars'],
+        'outputs': len(case['functions']),
+        'minterms': sum(len(minterms) for minterms, _ in case['functions']),
+        'dont_cares': sum(len(dont_cares) for _, dont_cares in case['functions']),
+        'phases': best,
+        'total': sum(best.values()),
+        'peak_memory': peak_memory,
+        **stats,
+    }
+
+# Function to compare results against a baseline
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD, min_time=DEFAULT_MIN_TIME):
+    """
+    Lists the regressions of a run against a baseline run. Cases missing from either side are skipped.
+
+    Args:
+        results (dict): This run, as written by main.
+        baseline (dict): The baseline run.
+        threshold (float): Relative growth of a time or of peak memory that counts as a regression.
+        min_time (float): Times below this many seconds on both sides are not compared.
+
+    Returns:
+        list of str: One line per regression.
+    """
+    before = {case['name']: case for case in baseline['cases']}
+    regressions = []
+    for case in results['cases']:
+        old = before.get(case['name'])
+        if old is None:
+            continue
+        # a cover cut off by its time budget takes about the budget and costs whatever it had found by
+        # then, so neither its time nor its cost says anything about the code
+        proven = case.get('optimal') is not False and old.get('optimal') is not False
+        if old.get('optimal') and case.get('optimal') is False:
+            regressions.append(f"{case['name']}: cover no longer proven optimal within its time budget")
+        timings = list(case['phases'].items()) + [('total', case['total'])]
+        for phase, seconds in timings:
+            if not proven and phase in ('cover', 'total'):
+                continue
+            old_seconds = old['total'] if phase == 'total' else old['phases'].get(phase)
+            if old_seconds is None or max(seconds, old_seconds) < min_time:
+                continue
+            if seconds > old_seconds * (1 + threshold):
+                regressions.append(f"{case['name']}: {phase} took {seconds:.4f}s, baseline {old_seconds:.4f}s")
+        if case['peak_memory'] > old['peak_memory'] * (1 + threshold):
+            regressions.append(
+                f"{case['name']}: peak memory {case['peak_memory']} bytes, baseline {old['peak_memory']} bytes")
+        if proven and case['cost'] > old['cost']:
+            regressions.append(f"{case['name']}: cover cost {case['cost']}, baseline {old['cost']}")
+    return regressions
+
+# Function to describe the machine a run is on
+def environment():
+    """
+    Describes the machine and settings of a run, for reading results side by side.
+
+    Returns:
+        dict: Python version, platform, CPU count, whether numpy is available and the time of the run.
+    """
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': numpy is not None,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the minimizer on seeded random and structured functions.")
+    parser.add_argument('--output', '-o', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="compare against results previously written with --output")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"relative slowdown or memory growth reported as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help=f"do not compare times below this many seconds (default: {DEFAULT_MIN_TIME})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f"seed of the random corpus (default: {DEFAULT_SEED})")
+    parser.add_argument('--cover', choices=['exact', 'greedy'], default='exact', help="cover selection (default: exact)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case, the fastest is kept (default: 3)")
+    parser.add_argument('--quick', action='store_true', help="run the small corpus only")
+    parser.add_argument('--family', action='append', help="only run this family (repeatable)")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in benchmark_corpus(args.seed, args.quick) if not args.family or case['family'] in args.family]
+    results = {'environment': environment(),
+               'settings': {'seed': args.seed, 'cover': args.cover, 'repeat': args.repeat, 'quick': args.quick},
+               'cases': []}
+    for case in cases:
+        result = benchmark_case(case, args.cover, args.repeat)
+        results['cases'].append(result)
+        print(f"{result['name']:<24} {result['total']:9.4f}s {result['peak_memory'] / 1024:10.1f} KiB "
+              f"{result['terms']:5d} terms  cost {result['cost']}{'' if result['optimal'] is not False else ' (not proven)'}",
+              file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as out:
+            json.dump(results, out, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare_results(results, baseline, args.threshold, args.min_time)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Compact truth-table inputs: functions given as bitmaps instead of lists of decimal minterms.
+
+A bitmap is a bytes-like object with bit m set when minterm m is in the set, in little bit order (bit
+m is bit m & 7 of byte m >> 3), 2**num_vars / 8 bytes long (one byte below three variables). This is
+the layout of to_bitset and of the packed numpy chart, and it can be read straight out of a file:
+
+    on_set, dont_cares, num_vars = open_bitmap_file('function.bin')
+    implicants = minimize_bitmap(on_set, dont_cares, num_vars)
+
+Text forms parse into the same bitmaps: hex truth tables such as 'e8' (the truth table as an integer,
+so the last digit holds minterms 0-3) and bitstrings such as '1110-000' read the same way, with '-' for
+don't cares.
+"""
+import mmap
+import os
+
+from quine_mccluskey import minimize_function, numpy
+
+# Bytes of a bitmap decoded at a time with numpy
+DECODE_BLOCK_BYTES = 1 << 20
+
+# Hex truth tables may leave out leading zero digits up to this many variables; wider ones must give
+# every digit, so a short table cannot ask for a huge bitmap
+MAX_PADDED_HEX_VARS = 20
+
+# Function to get the size of a bitmap
+def bitmap_size(num_vars):
+    """
+    Number of bytes of a bitmap over num_vars variables.
+
+    Args:
+        num_vars (int): Number of variables.
+
+    Returns:
+        int: The size in bytes.
+    """
+    return max((1 << num_vars) >> 3, 1)
+
+# Function to enumerate the minterms of a bitmap
+def iter_bitmap_minterms(bitmap):
+    """
+    Yields the set bits of a bitmap, lowest first, reading the buffer in place. With numpy, blocks of
+    DECODE_BLOCK_BYTES are unpacked at a time; without it, zero bytes are skipped whole.
+
+    Args:
+        bitmap (bytes-like): The bitmap.
+
+    Yields:
+        int: Each minterm in the bitmap.
+    """
+    view = memoryview(bitmap).cast('B')
+    if numpy is not None:
+        for start in range(0, len(view), DECODE_BLOCK_BYTES):
+            block = numpy.frombuffer(view[start:start + DECODE_BLOCK_BYTES], dtype=numpy.uint8)
+            bits = numpy.flatnonzero(numpy.unpackbits(block, bitorder='little'))
+            yield from (bits + (start << 3)).tolist()
+        return
+    for index, byte in enumerate(view):
+        if byte:
+            base = index << 3
+            while byte:
+                low = byte & -byte
+                yield base + low.bit_length() - 1
+                byte ^= low
+
+# Function to check a bitmap's size against a variable count
+def check_bitmap(bitmap, num_vars, name='bitmap'):
+    """
+    Checks that a bitmap has the size of num_vars variables.
+
+    Args:
+        bitmap (bytes-like): The bitmap.
+        num_vars (int): Number of variables.
+        name (str): What the bitmap is, for the error message.
+
+    Raises:
+        ValueError: If the size is wrong.
+    """
+    size = memoryview(bitmap).nbytes
+    if size != bitmap_size(num_vars):
+        raise ValueError(f"The {name} has {size} bytes, expected {bitmap_size(num_vars)} for {num_vars} variables.")
+
+# Function to infer a variable count from a bitmap size
+def bitmap_num_vars(size):
+    """
+    Infers the number of variables of a bitmap from its size.
+
+    Args:
+        size (int): The size in bytes.
+
+    Returns:
+        int: The number of variables (3 for a single byte).
+
+    Raises:
+        ValueError: If the size is not a power of two.
+    """
+    if size < 1 or size & (size - 1):
+        raise ValueError(f"A bitmap of {size} bytes does not hold a truth table; its size must be a power of two.")
+    return size.bit_length() + 2
+
+# Function to parse a hex truth table
+def parse_hex_table(text, num_vars=None):
+    """
+    Parses a hex truth table, read as an integer whose bit m is minterm m.
+
+    Args:
+        text (str): Hex digits, optionally prefixed with '0x'.
+        num_vars (int or None): Number of variables, or None to infer it from the number of digits.
+
+    Returns:
+        tuple: The on-set bitmap (bytes) and the number of variables.
+
+    Raises:
+        ValueError: If the text is not hex, does not fit in num_vars variables, or leaves out more leading
+            zeros than MAX_PADDED_HEX_VARS allows.
+    """
+    digits = text.strip().lower().removeprefix('0x')
+    table = int(digits, 16)
+    given_vars = max((len(digits) * 4 - 1).bit_length(), 1)
+    if num_vars is None:
+        num_vars = given_vars
+    elif num_vars > max(given_vars, MAX_PADDED_HEX_VARS):
+        raise ValueError(
+            f"A truth table of {len(digits)} hex digits is too short for {num_vars} variables; "
+            f"tables over {MAX_PADDED_HEX_VARS} variables must give every digit."
+        )
+    if table >> (1 << num_vars):
+        raise ValueError(f"Truth table {text!r} does not fit in {num_vars} variables.")
+    return table.to_bytes(bitmap_size(num_vars), 'little'), num_vars
+
+# Function to parse a bitstring truth table
+def parse_bit_table(text, num_vars=None):
+    """
+    Parses a truth table written as one character per minterm, the highest minterm first as in a
+    binary number: '1' for the on-set, '0' for the off-set and '-' for don't cares.
+
+    Args:
+        text (str): The bitstring.
+        num_vars (int or None): Number of variables, or None to infer it from the length.
+
+    Returns:
+        tuple: The on-set bitmap, the don't-care bitmap (None without don't cares) and the number of
+        variables.
+
+    Raises:
+        ValueError: If the text has other characters or a length that is not 2**num_vars.
+    """
+    text = text.strip()
+    if num_vars is None:
+        num_vars = max((len(text) - 1).bit_length(), 1)
+    if len(text) != 1 << num_vars or not set(text) <= set('01-'):
+        raise ValueError(f"A bitstring truth table over {num_vars} variables is {1 << num_vars} characters of 0, 1 and -.")
+    size = bitmap_size(num_vars)
+    on_set = int(text.replace('-', '0'), 2).to_bytes(size, 'little')
+    if '-' not in text:
+        return on_set, None, num_vars
+    dont_cares = int(text.replace('1', '0').replace('-', '1'), 2).to_bytes(size, 'little')
+    return on_set, dont_cares, num_vars
+
+# Function to map a raw bitmap file
+def open_bitmap_file(path, num_vars=None):
+    """
+    Maps a raw truth-table file into memory: the on-set bitmap, optionally followed by a don't-care
+    bitmap of the same size. The bitmaps are views of the mapping, so nothing is copied until minterms
+    are read from them.
+
+    Args:
+        path (str): The file.
+        num_vars (int or None): Number of variables, or None to infer it from the size of a file that
+            holds only the on-set.
+
+    Returns:
+        tuple: The on-set bitmap, the don't-care bitmap (None if the file has none) and the number of
+        variables.
+
+    Raises:
+        ValueError: If the file size does not match.
+    """
+    size = os.path.getsize(path)
+    if num_vars is None:
+        num_vars = bitmap_num_vars(size)
+    expected = bitmap_size(num_vars)
+    if size not in (expected, 2 * expected):
+        raise ValueError(f"{path} has {size} bytes, expected {expected} or {2 * expected} for {num_vars} variables.")
+    with open(path, 'rb') as file:
+        mapped = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    dont_cares = mapped[expected:] if size == 2 * expected else None
+    return mapped[:expected], dont_cares, num_vars
+
+# Function to minimize a function given as bitmaps
+def minimize_bitmap(on_set, dont_cares=None, num_vars=None, **options):
+    """
+    minimize_function for a function given as bitmaps: the minterms are read straight from the buffers
+    into the solver, without a decimal list in between.
+
+    Args:
+        on_set (bytes-like): The on-set bitmap.
+        dont_cares (bytes-like or None): The don't-care bitmap, None for none.
+        num_vars (int or None): Number of variables, or None to infer it from the bitmap size.
+        **options: Keyword arguments for minimize_function.
+
+    Returns:
+        list of Implicant: The minimized prime implicants.
+
+    Raises:
+        ValueError: If a bitmap does not have the size of num_vars variables.
+    """
+    if num_vars is None:
+        num_vars = bitmap_num_vars(memoryview(on_set).nbytes)
+    check_bitmap(on_set, num_vars, 'on-set bitmap')
+    if dont_cares is not None:
+        check_bitmap(dont_cares, num_vars, "don't-care bitmap")
+    return minimize_function(iter_bitmap_minterms(on_set),
+                             [] if dont_cares is None else iter_bitmap_minterms(dont_cares), num_vars, **options)
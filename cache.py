@@ -0,0 +1,237 @@
+"""
+Memoization in front of minimize_function: an in-memory LRU, optionally backed by a SQLite file that
+several processes can share.
+
+Functions are keyed on a canonical form, so the same function given with minterms in another order,
+repeated, or also listed as don't cares hits the same entry:
+
+    cache = ResultCache(path='results.sqlite')
+    implicants = cache.minimize([5, 1, 2, 7], [], 3)
+    cache.stats()  # {'hits': 0, 'misses': 1, 'hit_rate': 0.0, 'memory_entries': 1, 'disk_entries': 1, ...}
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+from quine_mccluskey import DEFAULT_COVER_TIME_BUDGET, Implicant, minimize_function, resolve_num_vars
+
+# Default number of results kept in memory
+DEFAULT_MAX_ENTRIES = 4096
+
+# Options of minimize_function that change which cover comes back, and so belong in the key. The others
+# (memory budget, numpy, workers, spilling) only change how fast it is found or whether it fails.
+KEYED_OPTIONS = {'method': 'qm', 'cover': 'exact'}
+
+# Budgets of the exact cover, which returns its best cover so far when one runs out: a result found under a
+# budget is not the answer to a request with a larger one, so for exact covers they are keyed too
+EXACT_COVER_OPTIONS = {'time_budget': DEFAULT_COVER_TIME_BUDGET, 'node_budget': None}
+
+# Disk entries are expired every this many stores rather than on each one
+EVICT_EVERY = 256
+
+# Function to compute the canonical key of a function
+def canonical_key(minterms, dont_cares, num_vars=None, **options):
+    """
+    Builds the cache key of a function: a hash of its sorted, deduplicated minterms, its don't cares
+    that are not also minterms, its variable count and the options that change the result.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+        **options: Keyword arguments for minimize_function.
+
+    Returns:
+        str: The key, as a hex digest.
+
+    Raises:
+        ValueError: If a term does not fit in num_vars variables.
+    """
+    num_vars = resolve_num_vars(minterms, dont_cares, num_vars)
+    on_set = sorted(set(minterms))
+    dc_set = sorted(set(dont_cares).difference(on_set))
+    keyed = [options.get(name, default) for name, default in sorted(KEYED_OPTIONS.items())]
+    if keyed == ['exact', 'qm']:
+        keyed += [options.get(name, default) for name, default in sorted(EXACT_COVER_OPTIONS.items())]
+    canonical = json.dumps([num_vars, keyed, on_set, dc_set], separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of minimization results: a bounded in-memory LRU, and optionally a SQLite file shared
+    by every process that opens it. Disk entries are evicted when older than max_age seconds since last
+    use, and the least recently used ones go once there are more than max_disk_entries.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, path=None, max_age=None, max_disk_entries=None):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.max_disk_entries = max_disk_entries
+        self.memory = OrderedDict()
+        self.counts = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self.stores = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, implicants TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self.db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self.evict()
+
+    def get(self, key):
+        """
+        Looks a key up in memory, then on disk, promoting disk hits into memory.
+
+        Args:
+            key (str): A key from canonical_key.
+
+        Returns:
+            list of Implicant or None: The cached result, or None on a miss.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.counts['memory_hits'] += 1
+            return list(self.memory[key])
+        if self.db is not None:
+            row = self.db.execute("SELECT implicants FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                implicants = [Implicant(value, care) for value, care in json.loads(row[0])]
+                self.remember(key, implicants)
+                self.counts['disk_hits'] += 1
+                return implicants
+        self.counts['misses'] += 1
+        return None
+
+    def put(self, key, implicants):
+        """
+        Stores a result in memory and, if there is one, on disk.
+
+        Args:
+            key (str): A key from canonical_key.
+            implicants (list of Implicant): The result of minimize_function.
+        """
+        self.remember(key, implicants)
+        if self.db is not None:
+            now = time.time()
+            self.db.execute(
+                "INSERT OR REPLACE INTO results (key, implicants, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps([list(implicant) for implicant in implicants]), now, now),
+            )
+            self.stores += 1
+            if not self.stores % EVICT_EVERY:
+                self.evict()
+
+    def remember(self, key, implicants):
+        """
+        Stores a result in the in-memory LRU, dropping the least recently used entries beyond max_entries.
+
+        Args:
+            key (str): A key from canonical_key.
+            implicants (list of Implicant): The result of minimize_function.
+        """
+        self.memory[key] = tuple(implicants)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def evict(self):
+        """
+        Removes disk entries unused for longer than max_age and the least recently used ones beyond
+        max_disk_entries.
+        """
+        if self.db is None:
+            return
+        if self.max_age is not None:
+            self.db.execute("DELETE FROM results WHERE accessed < ?", (time.time() - self.max_age,))
+        if self.max_disk_entries is not None:
+            self.db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+
+    def minimize(self, minterms, dont_cares, num_vars=None, **options):
+        """
+        minimize_function with memoization: returns the cached result when there is one, otherwise
+        minimizes and stores the result.
+
+        Args:
+            minterms (list of int): List of minterms.
+            dont_cares (list of int): List of don't-care conditions.
+            num_vars (int or None): Number of variables, or None to infer it from the largest term.
+            **options: Keyword arguments for minimize_function.
+
+        Returns:
+            list of Implicant: The minimized prime implicants.
+        """
+        key = canonical_key(minterms, dont_cares, num_vars, **options)
+        implicants = self.get(key)
+        if implicants is None:
+            implicants = minimize_function(minterms, dont_cares, num_vars, **options)
+            self.put(key, implicants)
+        return implicants
+
+    def stats(self):
+        """
+        Reports hit counts and sizes.
+
+        Returns:
+            dict: hits, memory_hits, disk_hits, misses, hit_rate, memory_entries and disk_entries
+            (None without a disk tier).
+        """
+        hits = self.counts['memory_hits'] + self.counts['disk_hits']
+        lookups = hits + self.counts['misses']
+        disk_entries = None
+        if self.db is not None:
+            disk_entries = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            'hits': hits,
+            **self.counts,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'memory_entries': len(self.memory),
+            'disk_entries': disk_entries,
+        }
+
+    def clear(self):
+        """
+        Empties both tiers and resets the counters.
+        """
+        self.memory.clear()
+        self.counts = dict.fromkeys(self.counts, 0)
+        if self.db is not None:
+            self.db.execute("DELETE FROM results")
+
+    def close(self):
+        """
+        Closes the disk tier, if any.
+        """
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+# Caches opened by shared_cache in this process, by path
+open_caches = {}
+
+# Function to get this process's cache for a path
+def shared_cache(path=None):
+    """
+    Returns one ResultCache per path and process, opening it on first use. Batch worker processes use
+    this so each keeps its own LRU and connection while sharing the SQLite file.
+
+    Args:
+        path (str or None): SQLite file of the disk tier, None for a memory-only cache.
+
+    Returns:
+        ResultCache: The cache.
+    """
+    if path not in open_caches:
+        open_caches[path] = ResultCache(path=path)
+    return open_caches[path]
@@ -0,0 +1,294 @@
+"""
+Checkpoint and resume for long minimizations: the state of minimize_function is saved to a compact
+binary file every so often, and a later run of the same function picks up from the last save instead of
+starting over.
+
+    checkpoint = Checkpoint('f1.qmck', interval=60)
+    implicants = minimize_function(minterms, dont_cares, num_vars, checkpoint=checkpoint)
+
+Two phases are saved. While prime implicants are generated, a checkpoint holds the level about to be
+merged (its care groups) and the prime implicants found so far. Once they are all found, it holds them
+and the partial cover picked so far by the greedy cover. The exact cover is bounded by its own time budget
+and is simply re-run. A save happens once interval seconds have passed since the last one, or every levels
+levels, whichever comes first; the file is replaced atomically, so a run killed mid-save leaves the
+previous checkpoint intact. The file is removed once the minimization completes.
+
+The file starts with a header (magic, format version, phase, variable count, level and the canonical_key
+of the function, so resuming the wrong function fails loudly), followed by counted runs of terms. Terms
+are stored as fixed-width little-endian integers, packed and unpacked a run at a time with array.
+"""
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from collections import namedtuple
+from itertools import islice
+
+from cache import canonical_key
+from quine_mccluskey import Implicant
+
+# Default seconds between saves
+DEFAULT_CHECKPOINT_INTERVAL = 60.0
+
+# First bytes of every checkpoint file, and the version of the layout after them
+MAGIC = b'QMCK'
+FORMAT_VERSION = 1
+
+# Phases of a minimization, as stored in the header
+PHASES = ('levels', 'cover')
+
+# Header: magic, format version, phase, number of variables, level, canonical key (a sha256 digest)
+HEADER = struct.Struct('<4sBBHI32s')
+
+# Counts preceding each run of terms
+COUNT = struct.Struct('<Q')
+
+# array typecodes by item size, used for the term widths they cover
+ARRAY_TYPECODES = {array(code).itemsize: code for code in 'BHIQ'}
+
+# Terms packed or unpacked per write or read
+RUN_TERMS = 1 << 16
+
+# Saved state of a minimization: its phase ('levels' or 'cover'), the level being merged, that level's
+# terms (care mask to set of values, empty in the cover phase), the prime implicants found so far (all of
+# them in the cover phase) and the partial cover picked so far.
+CheckpointState = namedtuple('CheckpointState', ['phase', 'level', 'groups', 'prime_implicants', 'cover'])
+
+# Function to choose the stored width of a term
+def term_width(num_vars):
+    """
+    Bytes per stored term: the smallest array item that holds num_vars bits, or just enough bytes for
+    wider functions.
+
+    Args:
+        num_vars (int): Number of variables.
+
+    Returns:
+        int: The width in bytes.
+    """
+    needed = (num_vars + 7) // 8 or 1
+    return min((size for size in ARRAY_TYPECODES if size >= needed), default=needed)
+
+# Function to write a run of terms
+def write_terms(out, terms, width):
+    """
+    Writes terms as fixed-width little-endian integers, RUN_TERMS at a time.
+
+    Args:
+        out (file): The binary file.
+        terms (iterable of int): The terms.
+        width (int): Bytes per term, as from term_width.
+    """
+    terms = iter(terms)
+    while True:
+        run = list(islice(terms, RUN_TERMS))
+        if not run:
+            return
+        if width in ARRAY_TYPECODES:
+            packed = array(ARRAY_TYPECODES[width], run)
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            out.write(packed.tobytes())
+        else:
+            out.write(b''.join(term.to_bytes(width, 'little') for term in run))
+
+# Function to read a run of terms
+def read_terms(file, count, width):
+    """
+    Reads count terms written by write_terms.
+
+    Args:
+        file (file): The binary file.
+        count (int): Number of terms.
+        width (int): Bytes per term.
+
+    Returns:
+        list of int: The terms.
+
+    Raises:
+        ValueError: If the file ends early.
+    """
+    data = file.read(count * width)
+    if len(data) != count * width:
+        raise ValueError("Checkpoint is truncated.")
+    if width in ARRAY_TYPECODES:
+        unpacked = array(ARRAY_TYPECODES[width])
+        unpacked.frombytes(data)
+        if sys.byteorder == 'big':
+            unpacked.byteswap()
+        return unpacked.tolist()
+    return [int.from_bytes(data[start:start + width], 'little') for start in range(0, len(data), width)]
+
+# Function to read a count
+def read_count(file):
+    """
+    Reads the count preceding a run of terms.
+
+    Args:
+        file (file): The binary file.
+
+    Returns:
+        int: The count.
+
+    Raises:
+        ValueError: If the file ends early.
+    """
+    data = file.read(COUNT.size)
+    if len(data) != COUNT.size:
+        raise ValueError("Checkpoint is truncated.")
+    return COUNT.unpack(data)[0]
+
+# Function to write a list of implicants
+def write_implicants(out, implicants, width):
+    """
+    Writes a count, then the values, then the care masks of some implicants.
+
+    Args:
+        out (file): The binary file.
+        implicants (list of Implicant): The implicants.
+        width (int): Bytes per term.
+    """
+    out.write(COUNT.pack(len(implicants)))
+    write_terms(out, (implicant.value for implicant in implicants), width)
+    write_terms(out, (implicant.care for implicant in implicants), width)
+
+# Function to read a list of implicants
+def read_implicants(file, width):
+    """
+    Reads implicants written by write_implicants.
+
+    Args:
+        file (file): The binary file.
+        width (int): Bytes per term.
+
+    Returns:
+        list of Implicant: The implicants, in the order written.
+    """
+    count = read_count(file)
+    values = read_terms(file, count, width)
+    return [Implicant(value, care) for value, care in zip(values, read_terms(file, count, width))]
+
+
+class Checkpoint:
+    """
+    Periodic snapshots of one minimization in a file, given to minimize_function as `checkpoint`. The
+    solver calls start once its inputs are known, asks due at each level or cover pick, saves when it is,
+    and calls clear when it is done.
+    """
+
+    def __init__(self, path, interval=DEFAULT_CHECKPOINT_INTERVAL, levels=None):
+        self.path = path
+        self.interval = interval
+        self.levels = levels
+        self.key = None
+        self.num_vars = None
+        self.state = None
+        self.saved_at = None
+        self.saved_level = 0
+        self.saves = 0
+
+    def start(self, minterms, dont_cares, num_vars):
+        """
+        Loads the saved state of a function, if the file exists, and starts counting the interval.
+
+        Args:
+            minterms (list of int): The function's minterms.
+            dont_cares (iterable of int): Its don't-care conditions.
+            num_vars (int): Number of variables.
+
+        Returns:
+            CheckpointState or None: The saved state, None when there is nothing to resume.
+
+        Raises:
+            ValueError: If the file is not a checkpoint of this function or is truncated.
+        """
+        self.key = bytes.fromhex(canonical_key(minterms, dont_cares, num_vars))
+        self.num_vars = num_vars
+        self.state = self.load() if os.path.exists(self.path) else None
+        self.saved_at = time.monotonic()
+        self.saved_level = 0 if self.state is None else self.state.level
+        return self.state
+
+    def due(self, level=None):
+        """
+        Tells whether it is time to save: interval seconds since the last save, or levels levels.
+
+        Args:
+            level (int or None): The level about to be merged, None outside the level loop.
+
+        Returns:
+            bool: True to save now.
+        """
+        if self.interval is not None and time.monotonic() - self.saved_at >= self.interval:
+            return True
+        return level is not None and self.levels is not None and level - self.saved_level >= self.levels
+
+    def save(self, phase, level=0, groups=None, prime_implicants=(), cover=()):
+        """
+        Writes the state to a temporary file next to the checkpoint and moves it into place.
+
+        Args:
+            phase (str): 'levels' or 'cover'.
+            level (int): The level about to be merged.
+            groups (dict or None): That level, mapping each care mask to its set of values.
+            prime_implicants (list of Implicant): The prime implicants found so far.
+            cover (list of Implicant): The partial cover picked so far.
+        """
+        width = term_width(self.num_vars)
+        groups = groups or {}
+        fd, temporary = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(self.path) or None)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                out.write(HEADER.pack(MAGIC, FORMAT_VERSION, PHASES.index(phase), self.num_vars, level, self.key))
+                out.write(COUNT.pack(len(groups)))
+                write_terms(out, groups, width)
+                for values in groups.values():
+                    out.write(COUNT.pack(len(values)))
+                    write_terms(out, values, width)
+                write_implicants(out, prime_implicants, width)
+                write_implicants(out, cover, width)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.saved_at = time.monotonic()
+        self.saved_level = level
+        self.saves += 1
+
+    def load(self):
+        """
+        Reads the checkpoint file.
+
+        Returns:
+            CheckpointState: The saved state.
+
+        Raises:
+            ValueError: If the file is not a checkpoint of the started function or is truncated.
+        """
+        with open(self.path, 'rb') as file:
+            header = file.read(HEADER.size)
+            if len(header) != HEADER.size or header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a checkpoint file.")
+            _, version, phase, num_vars, level, key = HEADER.unpack(header)
+            if version != FORMAT_VERSION or phase >= len(PHASES):
+                raise ValueError(f"{self.path} has an unsupported checkpoint format.")
+            if key != self.key or num_vars != self.num_vars:
+                raise ValueError(f"{self.path} is a checkpoint of a different function.")
+            width = term_width(num_vars)
+            cares = read_terms(file, read_count(file), width)
+            groups = {care: set(read_terms(file, read_count(file), width)) for care in cares}
+            prime_implicants = read_implicants(file, width)
+            cover = read_implicants(file, width)
+        return CheckpointState(PHASES[phase], level, groups, prime_implicants, cover)
+
+    def clear(self):
+        """
+        Removes the checkpoint file, once the minimization it was for has completed.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.state = None
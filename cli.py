@@ -1,163 +1,168 @@
-def to_binary(num, num_vars):
-    return f"{num:0{num_vars}b}"
-
-def count_ones(binary):
-    return binary.count('1')
-
-def combine_terms(term1, term2):
-    diff_count = 0
-    combined = []
-    for bit1, bit2 in zip(term1, term2):
-        if bit1 != bit2:
-            diff_count += 1
-            combined.append('-')
-        else:
-            combined.append(bit1)
-    return ''.join(combined) if diff_count == 1 else None
-
-def find_prime_implicants(minterms, num_vars):
-    groups = {i: [] for i in range(num_vars + 1)}
-    for minterm in minterms:
-        binary = to_binary(minterm, num_vars)
-        groups[count_ones(binary)].append(binary)
-
-    prime_implicants = []
-    checked = []
-    while any(groups.values()):
-        next_groups = {i: [] for i in range(num_vars + 1)}
-        for i in range(num_vars):
-            for term1 in groups[i]:
-                for term2 in groups[i + 1]:
-                    combined = combine_terms(term1, term2)
-                    if combined:
-                        checked.append(term1)
-                        checked.append(term2)
-                        next_groups[count_ones(combined)].append(combined)
-        prime_implicants.extend([term for group in groups.values() for term in group if term not in checked])
-        groups = next_groups
-
-    return prime_implicants
-
-def build_chart(minterms, prime_implicants):
-    chart = {pi: [] for pi in prime_implicants}
-    for minterm in minterms:
-        binary = to_binary(minterm, len(next(iter(prime_implicants))))
-        for pi in prime_implicants:
-            if all(pi_bit == '-' or pi_bit == minterm_bit for pi_bit, minterm_bit in zip(pi, binary)):
-                chart[pi].append(minterm)
-    return chart
-
-def extract_essential_prime_implicants(chart):
-    essential_pis = []
-    covered_minterms = []
-
-    for pi, minterms in sorted(chart.items()):
-        uncovered = [m for m in minterms if m not in covered_minterms]
-        if len(uncovered) == 1:
-            essential_pis.append(pi)
-            covered_minterms.extend(minterms)
-    return essential_pis, covered_minterms
-
-def iterative_reduction(chart, essential_pis):
-    covered_minterms = []
-    for pi in essential_pis:
-        covered_minterms.extend(chart[pi])
-    covered_minterms = list(set(covered_minterms))
-
-    remaining_chart = {}
-    for pi, minterms in chart.items():
-        remaining_minterms = [m for m in minterms if m not in covered_minterms]
-        if remaining_minterms:
-            remaining_chart[pi] = remaining_minterms
-
-    while remaining_chart:
-        max_pi = max(remaining_chart, key=lambda pi: len(remaining_chart[pi]))
-        essential_pis.append(max_pi)
-        covered_minterms.extend(remaining_chart[max_pi])
-        covered_minterms = list(set(covered_minterms))
-
-        new_remaining_chart = {}
-        for pi, minterms in remaining_chart.items():
-            remaining_minterms = [m for m in minterms if m not in covered_minterms]
-            if remaining_minterms:
-                new_remaining_chart[pi] = remaining_minterms
-        remaining_chart = new_remaining_chart
-
-    return essential_pis
-
-def minimize_function(minterms, dont_cares, num_vars):
-    all_terms = minterms + dont_cares
-    prime_implicants = find_prime_implicants(all_terms, num_vars)
-    chart = build_chart(minterms, prime_implicants)
-
-    essential_pis, _ = extract_essential_prime_implicants(chart)
-    final_pis = iterative_reduction(chart, essential_pis)
-
-    return final_pis
-
-def sop_expression(prime_implicants):
-    # variables = ['A', 'B', 'C', 'D']  
-    terms = []
-
-    for pi in sorted(prime_implicants):
-        term = ''
-        for idx, bit in enumerate(pi):
-            if bit == '0':
-                term += f"{variables[idx]}'"
-            elif bit == '1':
-                term += f"{variables[idx]}"
-        terms.append(term)
-
-    return ' + '.join(sorted(terms))
-
-
-print("############################################################################################")
-print("Welcome to Zigla's Quine McCluskey Solver!")
-print("############################################################################################")
-print("Press Enter if you don't want to change default variables or input don't cares.")
-print("############################################################################################")
-
-minterms = input("Enter minterms (e.g., 0, 1, 2): ")
-dont_cares = input("Enter optional don't cares (e.g., 3, 4): ")
-variables = input("Enter variables to change default (e.g., A, B, C, D): ")
-num_vars = 3
-
-# remove all white spaces and excess commas and remove all characters which are not numbers
-minterms = minterms.replace(" ", "").strip(',')
-minterms = [int(x) for x in minterms.split(',') if x.isdigit()]
-
-
-if not dont_cares:
-    dont_cares = []
-else:
-    dont_cares = dont_cares.replace(" ", "").strip(',')
-    dont_cares = [int(x) for x in dont_cares.split(',') if x.isdigit()]
-
-if not variables:
-    variables = ['A', 'B', 'C', 'D']
-    if int(max(minterms)) < 4:
-        num_vars  = 2
-    elif int(max(minterms)) < 8:
-        num_vars = 3
+import argparse
+import json
+import os
+import sys
+
+from batch import DEFAULT_CHUNK_SIZE, bitmap_file_records, parse_records, read_lines, solve_records, solve_records_parallel, write_results
+from checkpoint import DEFAULT_CHECKPOINT_INTERVAL
+from forms import cover_cost, form_expression, minimize_cheapest_form, off_set
+from lookup_table import lookup_cover
+from quine_mccluskey import (
+    DEFAULT_COVER_TIME_BUDGET, MemoryBudgetExceeded, MinimizationStats, minimize_function, resolve_num_vars,
+    variable_names,
+)
+
+
+def interactive(show_stats=False, form='sop'):
+    print("############################################################################################")
+    print("Welcome to Zigla's Quine McCluskey Solver!")
+    print("############################################################################################")
+    print("Press Enter if you don't want to change default variables or input don't cares.")
+    print("############################################################################################")
+
+    minterms = input("Enter minterms (e.g., 0, 1, 2): ")
+    dont_cares = input("Enter optional don't cares (e.g., 3, 4): ")
+    variables = input("Enter variables to change default (e.g., A, B, C, D): ")
+
+    # remove all white spaces and excess commas and remove all characters which are not numbers
+    minterms = minterms.replace(" ", "").strip(',')
+    minterms = [int(x) for x in minterms.split(',') if x.isdigit()]
+
+
+    if not dont_cares:
+        dont_cares = []
     else:
-        num_vars = 4
-
-else:
-    variables = variables.split(',')
-    num_vars = len(variables)
-
+        dont_cares = dont_cares.replace(" ", "").strip(',')
+        dont_cares = [int(x) for x in dont_cares.split(',') if x.isdigit()]
 
-# limiting the max minterm to just four variables
-if int(max(minterms)) > 15:
-    print("Minterm greater than expected!")
+    if not minterms:
+        sys.exit("Please input numbers for minterms!")
 
-minterms.sort()
-print(f"Minterms: {minterms}")
-print(f"Don't Cares: {dont_cares}")
-print(f"Variables: {variables}")
-print(f"Number of variables: {num_vars}")
-
-final_prime_implicants = minimize_function(minterms, dont_cares, num_vars)
-final_expression = sop_expression(final_prime_implicants)
+    try:
+        if not variables:
+            # at least two variables, as before, otherwise just enough to hold the largest term
+            num_vars = max(resolve_num_vars(minterms, dont_cares), 2)
+            variables = variable_names(num_vars)
+        else:
+            variables = variables.replace(" ", "").strip(',').split(',')
+            num_vars = resolve_num_vars(minterms, dont_cares, len(variables))
+    except ValueError as error:
+        sys.exit(str(error))
+
+    minterms.sort()
+    print(f"Minterms: {minterms}")
+    print(f"Don't Cares: {dont_cares}")
+    print(f"Variables: {variables}")
+    print(f"Number of variables: {num_vars}")
+
+    stats = MinimizationStats() if show_stats else None
+    try:
+        if form == 'auto':
+            form, final_prime_implicants, _ = minimize_cheapest_form(minterms, dont_cares, num_vars, stats=stats)
+        else:
+            terms = minterms if form == 'sop' else off_set(minterms, dont_cares, num_vars)
+            # the lookup table has nothing to measure, so --stats always runs the solver
+            final_prime_implicants = None if show_stats else lookup_cover(terms, dont_cares, num_vars)
+            if final_prime_implicants is None:
+                final_prime_implicants = minimize_function(terms, dont_cares, num_vars, stats=stats)
+    except MemoryBudgetExceeded as error:
+        sys.exit(str(error))
+    final_expression = form_expression(form, final_prime_implicants, num_vars, variables)
+
+    print("Minimized Boolean Function: F = ", final_expression)
+    if form != 'sop' or show_stats:
+        cost = cover_cost(final_prime_implicants)
+        print(f"Form: {form.upper()}, {cost['terms']} terms, {cost['literals']} literals, {cost['gate_inputs']} gate inputs")
+    if stats is not None:
+        print("Stats:", json.dumps(stats.as_dict(), indent=2))
+
+
+def batch(args):
+    # PLA and bitmap files are recognised by extension, everything else (and stdin) is JSON Lines unless --format says otherwise
+    format = args.format
+    for extension, implied in (('.pla', 'pla'), ('.bin', 'bitmap')):
+        if format is None and all(path.endswith(extension) for path in args.inputs):
+            format = implied
+    format = format or 'jsonl'
+    options = {'method': args.method, 'cover': args.cover, 'time_budget': args.time_budget, 'merge_workers': args.pi_workers,
+               'cache': args.cache, 'npn': args.npn, 'stats': args.stats, 'spill': args.spill or False, 'form': args.form,
+               'verify': not args.no_verify}
+    if args.checkpoint:
+        os.makedirs(args.checkpoint, exist_ok=True)
+        options.update(checkpoint=args.checkpoint, checkpoint_interval=args.checkpoint_interval,
+                       checkpoint_levels=args.checkpoint_levels)
+    if args.memory_budget is not None:
+        options['memory_budget'] = args.memory_budget << 20
+    if format == 'bitmap':
+        records = bitmap_file_records(args.inputs, args.num_vars)
+    else:
+        records = parse_records(read_lines(args.inputs), format, args.multi_output)
+    if args.workers == 1:
+        results = solve_records(records, timeout=args.timeout, **options)
+    else:
+        results = solve_records_parallel(records, workers=args.workers or None, chunk_size=args.chunk_size,
+                                         ordered=not args.unordered, timeout=args.timeout, **options)
 
-print("Minimized Boolean Function: F = ", final_expression)
\ No newline at end of file
+    if args.output:
+        with open(args.output, 'w') as out:
+            errors = write_results(results, out)
+    else:
+        errors = write_results(results, sys.stdout)
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Zigla's Quine McCluskey Solver. Without inputs it prompts for a single function; "
+                    "with inputs it minimizes every function in them and writes one JSON result per line.")
+    parser.add_argument('inputs', nargs='*', help="JSON Lines, PLA or raw bitmap files to minimize, '-' for stdin")
+    parser.add_argument('--format', choices=['jsonl', 'pla', 'bitmap'],
+                        help="input format (default: pla for .pla files, bitmap for .bin files, else jsonl)")
+    parser.add_argument('--num-vars', type=int,
+                        help="number of variables of bitmap files (default: from the file size, on-set only)")
+    parser.add_argument('--output', '-o', help="write results to this file instead of stdout")
+    parser.add_argument('--method', choices=['qm', 'espresso'], default='qm', help="minimization method (default: qm)")
+    parser.add_argument('--cover', choices=['exact', 'greedy'], default='exact', help="cover selection (default: exact)")
+    parser.add_argument('--time-budget', type=float, default=DEFAULT_COVER_TIME_BUDGET,
+                        help=f"seconds allowed per function for the exact cover (default: {DEFAULT_COVER_TIME_BUDGET})")
+    parser.add_argument('--timeout', type=float, help="give up on a function after this many seconds (POSIX only)")
+    parser.add_argument('--workers', '-j', type=int, default=1,
+                        help="worker processes for batch runs, 0 for one per CPU (default: 1, no pool)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"functions sent to a worker at a time (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--unordered', action='store_true', help="write results as they complete instead of in input order")
+    parser.add_argument('--cache', nargs='?', const=True, metavar='FILE',
+                        help="reuse results for repeated functions, sharing them across runs through FILE (SQLite) if given")
+    parser.add_argument('--npn', action='store_true',
+                        help="solve functions equal up to input permutation and negation only once")
+    parser.add_argument('--multi-output', action='store_true',
+                        help="minimize the outputs of each PLA function together, sharing product terms")
+    parser.add_argument('--form', choices=['sop', 'pos', 'auto'], default='sop',
+                        help="sum of products, product of sums from the off-set, or whichever is cheaper (default: sop)")
+    parser.add_argument('--stats', action='store_true',
+                        help="report per-phase times and counters with each result")
+    parser.add_argument('--no-verify', action='store_true',
+                        help="skip checking each result's cover against its function (see verify.py)")
+    parser.add_argument('--memory-budget', type=int, metavar='MIB',
+                        help="memory allowed for prime implicant generation per function, in MiB (default: 1024)")
+    parser.add_argument('--spill', nargs='?', const=True, metavar='DIR',
+                        help="spill prime implicant levels over the memory budget to temporary files (in DIR if given) "
+                             "instead of failing (the chart is not spilled)")
+    parser.add_argument('--checkpoint', metavar='DIR',
+                        help="save the state of long solves in DIR and resume them from there when rerun")
+    parser.add_argument('--checkpoint-interval', type=float, default=DEFAULT_CHECKPOINT_INTERVAL, metavar='SECONDS',
+                        help=f"seconds between checkpoints (default: {DEFAULT_CHECKPOINT_INTERVAL:g})")
+    parser.add_argument('--checkpoint-levels', type=int, metavar='N',
+                        help="also checkpoint every N levels of prime implicant generation")
+    parser.add_argument('--pi-workers', type=int,
+                        help="worker processes for prime implicant generation within each large function (default: none)")
+    args = parser.parse_args(argv)
+
+    if not args.inputs:
+        interactive(args.stats, args.form)
+        return 0
+    return batch(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
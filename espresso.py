@@ -0,0 +1,200 @@
+"""
+Espresso-style heuristic minimization, for functions too wide for the full Quine-McCluskey method.
+
+Instead of enumerating every prime implicant, a cover of cubes is improved in place by repeating the
+three Espresso steps until its cost stops dropping:
+
+- expand: grow each cube one literal at a time while it stays inside the on-set plus don't cares,
+  dropping cubes whose minterms the grown cube already covers;
+- irredundant: remove cubes whose on-set minterms are all covered by other cubes;
+- reduce: shrink each cube to the smallest cube holding the minterms only it covers, so the next
+  expand can grow it in a different direction.
+
+Cubes are (value, care) pairs of ints as in quine_mccluskey.Implicant. Use it through
+minimize_function(..., method='espresso') so results render with sop_expression like any other.
+"""
+
+# Default number of reduce/expand/irredundant rounds after the first expand
+DEFAULT_MAX_ITERATIONS = 20
+
+# Function to enumerate the points of a cube
+def cube_points(value, free):
+    """
+    Yields every minterm inside a cube.
+
+    Args:
+        value (int): The fixed bits of the cube (0 in every free position).
+        free (int): Mask of the don't-care positions of the cube.
+
+    Yields:
+        int: Each minterm of the cube.
+    """
+    sub = free
+    while True:
+        yield value | sub
+        if not sub:
+            return
+        sub = (sub - 1) & free
+
+# Function to compute the cost of a cover
+def cover_cost(cubes):
+    """
+    Cost of a cover as gate inputs: one per literal plus one per cube, as quine_mccluskey.implicant_cost.
+
+    Args:
+        cubes (list of tuple): The cover as (value, care) pairs.
+
+    Returns:
+        int: The cost.
+    """
+    return sum(care.bit_count() + 1 for _, care in cubes)
+
+# Function to grow every cube of a cover
+def expand(cubes, on_set, allowed, full_care, order):
+    """
+    Grows each cube by raising literals, in the given bit order, while it stays inside the allowed set.
+    Cubes with fewer literals go first, and a cube whose on-set minterms are all already covered by an
+    expanded cube is dropped.
+
+    Args:
+        cubes (list of tuple): The cover as (value, care) pairs.
+        on_set (set of int): The minterms.
+        allowed (set of int): The minterms and don't cares.
+        full_care (int): Care mask with every variable set.
+        order (list of int): Single-bit masks in the order literals are tried.
+
+    Returns:
+        list of tuple: The expanded cover.
+    """
+    covered = set()
+    expanded = []
+    for value, care in sorted(cubes, key=lambda cube: cube[1].bit_count()):
+        free = full_care & ~care
+        if all(point in covered for point in cube_points(value, free) if point in on_set):
+            continue
+        for bit in order:
+            if not care & bit:
+                continue
+            # the cube itself is inside the allowed set, so only the mirrored half needs checking
+            if all(point in allowed for point in cube_points(value ^ bit, free)):
+                value &= ~bit
+                care &= ~bit
+                free |= bit
+        expanded.append((value, care))
+        covered.update(point for point in cube_points(value, free) if point in on_set)
+    return expanded
+
+# Function to list the on-set minterms of every cube
+def on_set_points(cubes, on_set, full_care):
+    """
+    Lists the on-set minterms of every cube and counts how many cubes cover each minterm.
+
+    Args:
+        cubes (list of tuple): The cover as (value, care) pairs.
+        on_set (set of int): The minterms.
+        full_care (int): Care mask with every variable set.
+
+    Returns:
+        tuple: A list of minterm lists, one per cube, and a dict of cover counts per minterm.
+    """
+    points = []
+    counts = {}
+    for value, care in cubes:
+        inside = [point for point in cube_points(value, full_care & ~care) if point in on_set]
+        points.append(inside)
+        for point in inside:
+            counts[point] = counts.get(point, 0) + 1
+    return points, counts
+
+# Function to remove redundant cubes
+def irredundant(cubes, on_set, full_care):
+    """
+    Removes cubes whose on-set minterms are all covered by other cubes, trying the costliest cubes first.
+
+    Args:
+        cubes (list of tuple): The cover as (value, care) pairs.
+        on_set (set of int): The minterms.
+        full_care (int): Care mask with every variable set.
+
+    Returns:
+        list of tuple: The cover without redundant cubes.
+    """
+    points, counts = on_set_points(cubes, on_set, full_care)
+    kept = []
+    for idx in sorted(range(len(cubes)), key=lambda idx: -cubes[idx][1].bit_count()):
+        if all(counts[point] > 1 for point in points[idx]):
+            for point in points[idx]:
+                counts[point] -= 1
+        else:
+            kept.append(cubes[idx])
+    return kept
+
+# Function to shrink every cube of a cover
+def reduce(cubes, on_set, full_care):
+    """
+    Shrinks each cube in turn to the smallest cube holding the on-set minterms that no other cube covers.
+    Cubes left with no such minterm are dropped.
+
+    Args:
+        cubes (list of tuple): The cover as (value, care) pairs.
+        on_set (set of int): The minterms.
+        full_care (int): Care mask with every variable set.
+
+    Returns:
+        list of tuple: The reduced cover.
+    """
+    points, counts = on_set_points(cubes, on_set, full_care)
+    reduced = []
+    for idx in sorted(range(len(cubes)), key=lambda idx: cubes[idx][1].bit_count()):
+        unique = [point for point in points[idx] if counts[point] == 1]
+        for point in points[idx]:
+            counts[point] -= 1
+        if not unique:
+            continue
+        ones = 0
+        zeros = 0
+        for point in unique:
+            ones |= point
+            zeros |= ~point & full_care
+        care = full_care & ~(ones & zeros)
+        value = ones & care
+        reduced.append((value, care))
+        for point in cube_points(value, full_care & ~care):
+            if point in on_set:
+                counts[point] = counts.get(point, 0) + 1
+    return reduced
+
+# Function to minimize a Boolean function heuristically
+def espresso(minterms, dont_cares, num_vars, max_iterations=DEFAULT_MAX_ITERATIONS):
+    """
+    Minimizes a Boolean function with Espresso-style expand/irredundant/reduce iterations. The result is
+    an irredundant cover of prime cubes, usually close to minimal but not guaranteed to be.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int): Number of variables.
+        max_iterations (int): Maximum number of reduce/expand/irredundant rounds after the first expand.
+
+    Returns:
+        list of tuple: The cover as sorted (value, care) pairs.
+    """
+    full_care = (1 << num_vars) - 1
+    on_set = set(minterms)
+    allowed = on_set.union(dont_cares)
+    bits = [1 << idx for idx in range(num_vars)]
+
+    cover = irredundant(expand([(m, full_care) for m in on_set], on_set, allowed, full_care, bits), on_set, full_care)
+    cost = cover_cost(cover)
+    for iteration in range(1, max_iterations + 1):
+        # start raising literals from a different variable each round to escape local minima
+        shift = iteration % max(num_vars, 1)
+        order = bits[shift:] + bits[:shift]
+        candidate = reduce(cover, on_set, full_care)
+        candidate = irredundant(expand(candidate, on_set, allowed, full_care, order), on_set, full_care)
+        candidate_cost = cover_cost(candidate)
+        if candidate_cost >= cost:
+            break
+        cover, cost = candidate, candidate_cost
+
+    return sorted(cover)
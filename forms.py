@@ -0,0 +1,202 @@
+"""
+Sum-of-products or product-of-sums: a function can be built from its on-set (SOP) or from its off-set
+(POS, whose clauses are the complements of the off-set's implicants). For dense functions the off-set
+is the small side, cheaper both to minimize and as hardware.
+
+    form, implicants, cost = minimize_cheapest_form([0, 1, 2, 3, 4, 5, 6], [], 3)
+    form                                         # 'pos'
+    form_expression(form, implicants, 3)         # "(A' + B' + C')"
+    cost                                         # {'terms': 1, 'literals': 3, 'gate_inputs': 4}
+
+Both sides are minimized in full with the same options and the cheaper cover is kept, so 'auto' costs
+about as much as the two solves together; a side too large for the memory budget is skipped. With
+workers, both sides are minimized at once. Each side is measured separately when stats are asked for.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from quine_mccluskey import (
+    BYTES_PER_TERM, DEFAULT_MEMORY_BUDGET, MemoryBudgetExceeded, MinimizationStats, implicant_cost,
+    minimize_function, resolve_num_vars, sop_expression, to_binary, variable_names,
+)
+
+# Function to list the off-set of a function
+def off_set(minterms, dont_cares, num_vars):
+    """
+    Lists the terms that are neither minterms nor don't cares.
+
+    Args:
+        minterms (iterable of int): The minterms.
+        dont_cares (iterable of int): The don't-care conditions.
+        num_vars (int): Number of variables.
+
+    Returns:
+        list of int: The off-set, sorted.
+    """
+    allowed = set(minterms).union(dont_cares)
+    return [term for term in range(1 << num_vars) if term not in allowed]
+
+# Function to price a cover
+def cover_cost(implicants):
+    """
+    Prices a two-level cover, the same for an SOP over the on-set or a POS over the off-set.
+
+    Args:
+        implicants (list of Implicant): The cover.
+
+    Returns:
+        dict: terms (products or clauses), literals, and gate_inputs (see implicant_cost).
+    """
+    return {
+        'terms': len(implicants),
+        'literals': sum(implicant.care.bit_count() for implicant in implicants),
+        'gate_inputs': sum(implicant_cost(implicant) for implicant in implicants),
+    }
+
+# Function to generate a POS expression from implicants of the off-set
+def pos_expression(implicants, num_vars, variables=None):
+    """
+    Converts implicants of the off-set to a Product of Sums (POS) expression: each becomes the clause
+    that is false exactly on it.
+
+    Args:
+        implicants (list of Implicant): A cover of the off-set.
+        num_vars (int): Number of variables.
+        variables (list of str or None): Variable names, most significant first; generated when None.
+
+    Returns:
+        str: The POS expression, '1' for an empty cover and '0' when the off-set is everything.
+    """
+    if variables is None:
+        variables = variable_names(num_vars)
+    if not implicants:
+        return '1'
+    clauses = []
+
+    for implicant in sorted(implicants):
+        literals = []
+        for idx, bit in enumerate(to_binary(implicant, num_vars)):
+            if bit == '0':
+                literals.append(f"{variables[idx]}")
+            elif bit == '1':
+                literals.append(f"{variables[idx]}'")
+        if not literals:
+            return '0'
+        clauses.append(f"({' + '.join(literals)})")
+
+    return ''.join(sorted(clauses))
+
+# Function to render a cover in its form
+def form_expression(form, implicants, num_vars, variables=None):
+    """
+    Renders a cover as sop_expression or pos_expression.
+
+    Args:
+        form (str): 'sop' for a cover of the on-set, 'pos' for a cover of the off-set.
+        implicants (list of Implicant): The cover.
+        num_vars (int): Number of variables.
+        variables (list of str or None): Variable names, most significant first; generated when None.
+
+    Returns:
+        str: The expression.
+    """
+    render = sop_expression if form == 'sop' else pos_expression
+    return render(implicants, num_vars, variables)
+
+# Function to minimize one side of a function with its own stats
+def solve_side(solve, terms, dont_cares, num_vars, stats=None):
+    """
+    Calls solve on one side, handing it stats when given, and returns the stats along with the cover
+    so they also come back from a worker process.
+
+    Args:
+        solve (callable): The solver, as for minimize_cheapest_form.
+        terms (list of int): The side's terms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int): Number of variables.
+        stats (MinimizationStats or None): This side's stats.
+
+    Returns:
+        tuple: The cover and the stats.
+    """
+    if stats is None:
+        return solve(terms, dont_cares, num_vars), None
+    return solve(terms, dont_cares, num_vars, stats=stats), stats
+
+# Function to minimize the cheaper of the two forms
+def minimize_cheapest_form(minterms, dont_cares, num_vars=None, solve=None, workers=None, stats=None, **options):
+    """
+    Minimizes the on-set and the off-set (both with the don't cares) and keeps the cheaper cover, by
+    gate inputs and then literals; SOP wins a tie. Each side is solved in full, whatever the other costs:
+    which side is cheaper is only known once prime implicant generation, most of the work, is done for
+    both. A side whose terms alone exceed the memory budget, or whose solve raises MemoryBudgetExceeded,
+    is skipped.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+        solve (callable or None): Called as solve(minterms, dont_cares, num_vars) for each side instead
+            of minimize_function with options, e.g. a cached or table-backed solver; with stats, it is also
+            passed stats=.
+        workers (int or None): 2 to minimize both sides at once in worker processes (solve must then be
+            picklable), None or 1 for one after the other.
+        stats (MinimizationStats or None): Each side solved is measured in a MinimizationStats of its own
+            (without the callback in worker processes), and they are recorded here as the counter sides,
+            mapping 'sop' and 'pos' to their as_dict.
+        **options: Keyword arguments for minimize_function.
+
+    Returns:
+        tuple: The form ('sop' or 'pos'), its cover and cover_cost of the cover.
+
+    Raises:
+        ValueError: If a term does not fit in num_vars variables.
+        MemoryBudgetExceeded: If neither side fits in the memory budget.
+    """
+    minterms = sorted(set(minterms))
+    dont_cares = sorted(set(dont_cares).difference(minterms))
+    num_vars = resolve_num_vars(minterms, dont_cares, num_vars)
+    memory_budget = options.get('memory_budget', DEFAULT_MEMORY_BUDGET)
+    sizes = {'sop': len(minterms), 'pos': (1 << num_vars) - len(minterms) - len(dont_cares)}
+    sides = [form for form in sorted(sizes, key=sizes.get)
+             if memory_budget is None or sizes[form] * BYTES_PER_TERM <= memory_budget]
+    if not sides:
+        raise MemoryBudgetExceeded(f"Neither the on-set nor the off-set of {num_vars} variables fits in "
+                                   f"{memory_budget} bytes; raise the memory budget or reduce the function.")
+    if solve is None:
+        solve = partial(minimize_function, **options)
+
+    inputs = {'sop': minterms}
+    if 'pos' in sides:
+        inputs['pos'] = off_set(minterms, dont_cares, num_vars)
+    covers = {}
+    side_stats = {}
+    failure = None
+    if workers and workers > 1 and len(sides) > 1:
+        with ProcessPoolExecutor(min(workers, len(sides))) as executor:
+            futures = {form: executor.submit(solve_side, solve, inputs[form], dont_cares, num_vars,
+                                             None if stats is None else MinimizationStats())
+                       for form in sides}
+            for form, future in futures.items():
+                try:
+                    covers[form], side_stats[form] = future.result()
+                except MemoryBudgetExceeded as error:
+                    failure = error
+    else:
+        for form in sides:
+            try:
+                covers[form], side_stats[form] = solve_side(
+                    solve, inputs[form], dont_cares, num_vars,
+                    None if stats is None else MinimizationStats(stats.callback))
+            except MemoryBudgetExceeded as error:
+                failure = error
+    if stats is not None:
+        stats.count(sides={form: side.as_dict() for form, side in side_stats.items()})
+    if not covers:
+        raise failure
+
+    def price(form):
+        cost = cover_cost(covers[form])
+        return cost['gate_inputs'], cost['literals'], form != 'sop'
+    form = min(covers, key=price)
+    return form, covers[form], cover_cost(covers[form])
@@ -0,0 +1,449 @@
+"""
+Incremental minimization: a function edited a few terms at a time keeps its prime implicants and chart
+between edits, so each edit costs work near the changed term instead of a full solve.
+
+    minimizer = IncrementalMinimizer([1, 3, 5, 7], [], 4)
+    minimizer.add_minterm(9)         # returns the new cover
+    minimizer.set_dont_care(15)
+    minimizer.remove_minterm(3)
+
+A term entering the on-set plus don't cares can only create prime implicants that contain it, and only
+old primes one step away from it can stop being prime. A term leaving it removes exactly the primes
+that contain it, whose largest sub-cubes avoiding it are the only candidates to replace them. The chart
+is kept as coverage maps, and covering is re-run only on the connected components of the chart (columns
+linked by a shared row) that the edit touched; every other component keeps its previous cover, which is
+still optimal for it. When the touched components hold more than REPAIR_MIN_COLUMNS minterms, the
+previous cover is repaired instead: rows that survive are kept, the minterms left uncovered are covered
+greedily and rows made redundant are dropped. Repaired covers are valid but may drift from minimal over
+many edits; resolve() re-runs covering on the whole chart.
+"""
+from quine_mccluskey import (
+    DEFAULT_COVER_TIME_BUDGET, DEFAULT_MEMORY_BUDGET, Implicant, build_chart, exact_cover,
+    extract_essential_prime_implicants, find_prime_implicants, iterative_reduction, resolve_num_vars,
+)
+
+# Touched chart components with more minterms than this get their cover repaired instead of re-solved
+REPAIR_MIN_COLUMNS = 128
+
+
+class IncrementalMinimizer:
+    """
+    A minimized function that can be edited term by term. Every edit returns a cover of the edited
+    function from its current prime implicants, minimal as minimize_function's unless it was repaired.
+    """
+
+    def __init__(self, minterms, dont_cares, num_vars=None, memory_budget=DEFAULT_MEMORY_BUDGET, use_numpy=None,
+                 cover='exact', time_budget=DEFAULT_COVER_TIME_BUDGET, node_budget=None):
+        """
+        Minimizes the starting function.
+
+        Args:
+            minterms (iterable of int): The starting minterms.
+            dont_cares (iterable of int): The starting don't-care conditions.
+            num_vars (int or None): Number of variables, or None to infer it from the largest term. Later
+                edits must fit in it.
+            memory_budget (int or None): Maximum estimated size of the starting implicant tables, and of
+                each chart of a region being re-covered, in bytes, None for no limit.
+            use_numpy (bool or None): As for build_chart.
+            cover (str): 'exact' or 'greedy', as for minimize_function.
+            time_budget (float or None): Seconds allowed for each exact cover, None for no limit.
+            node_budget (int or None): Search nodes allowed for each exact cover, None for no limit.
+
+        Raises:
+            ValueError: If a term does not fit in num_vars variables, or cover is unknown.
+            MemoryBudgetExceeded: If the starting implicant tables or chart would exceed memory_budget.
+        """
+        if cover not in ('exact', 'greedy'):
+            raise ValueError(f"Unknown cover {cover!r}, expected 'exact' or 'greedy'.")
+        self.minterms = set(minterms)
+        self.dont_cares = set(dont_cares) - self.minterms
+        self.num_vars = resolve_num_vars(self.minterms, self.dont_cares, num_vars)
+        self.full_care = (1 << self.num_vars) - 1
+        self.use_numpy = use_numpy
+        self.memory_budget = memory_budget
+        self.cover_method = cover
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.allowed = self.minterms | self.dont_cares
+        # the chart as coverage maps, so rows and columns come and go without renumbering
+        self.rows = {}
+        self.columns = {minterm: set() for minterm in self.minterms}
+        self.selected = set()
+        affected = set()
+        for pi in find_prime_implicants(self.allowed, self.num_vars, memory_budget):
+            affected |= self.add_row(pi)
+        self.recover(affected, repair=False)
+
+    def cover(self):
+        """
+        Returns the current cover.
+
+        Returns:
+            list of Implicant: The minimized prime implicants, sorted.
+        """
+        return sorted(self.selected)
+
+    def resolve(self):
+        """
+        Re-runs covering on the whole chart, undoing any drift left by repaired covers.
+
+        Returns:
+            list of Implicant: The new cover.
+        """
+        self.recover(set(self.columns), repair=False)
+        return self.cover()
+
+    def prime_implicants(self):
+        """
+        Returns every prime implicant of the current on-set plus don't cares.
+
+        Returns:
+            list of Implicant: The prime implicants, sorted.
+        """
+        return sorted(self.rows)
+
+    def add_minterm(self, minterm):
+        """
+        Puts a term in the on-set, taking it out of the don't cares if it was one.
+
+        Args:
+            minterm (int): The term.
+
+        Returns:
+            list of Implicant: The new cover.
+
+        Raises:
+            ValueError: If the term does not fit in num_vars variables.
+        """
+        self.check_term(minterm)
+        if minterm in self.minterms:
+            return self.cover()
+        affected = set() if minterm in self.allowed else self.allow(minterm)
+        self.dont_cares.discard(minterm)
+        self.minterms.add(minterm)
+        affected |= self.add_column(minterm)
+        self.recover(affected)
+        return self.cover()
+
+    def remove_minterm(self, minterm):
+        """
+        Puts a term in the off-set, whether it was a minterm or a don't care.
+
+        Args:
+            minterm (int): The term.
+
+        Returns:
+            list of Implicant: The new cover.
+
+        Raises:
+            ValueError: If the term does not fit in num_vars variables.
+        """
+        self.check_term(minterm)
+        if minterm not in self.allowed:
+            return self.cover()
+        affected = set()
+        if minterm in self.minterms:
+            self.minterms.discard(minterm)
+            affected |= self.remove_column(minterm)
+        self.dont_cares.discard(minterm)
+        affected |= self.disallow(minterm)
+        self.recover(affected)
+        return self.cover()
+
+    def set_dont_care(self, minterm, dont_care=True):
+        """
+        Makes a term a don't care, or puts a don't care back in the off-set.
+
+        Args:
+            minterm (int): The term.
+            dont_care (bool): True to make it a don't care (from the on-set or the off-set), False to move
+                a don't care to the off-set; a minterm is left alone then.
+
+        Returns:
+            list of Implicant: The new cover.
+
+        Raises:
+            ValueError: If the term does not fit in num_vars variables.
+        """
+        self.check_term(minterm)
+        if not dont_care:
+            return self.remove_minterm(minterm) if minterm in self.dont_cares else self.cover()
+        if minterm in self.dont_cares:
+            return self.cover()
+        affected = set()
+        if minterm in self.minterms:
+            self.minterms.discard(minterm)
+            affected |= self.remove_column(minterm)
+        else:
+            affected |= self.allow(minterm)
+        self.dont_cares.add(minterm)
+        self.recover(affected)
+        return self.cover()
+
+    def check_term(self, minterm):
+        """
+        Checks that a term fits in the function's variables.
+
+        Args:
+            minterm (int): The term.
+
+        Raises:
+            ValueError: If it does not.
+        """
+        resolve_num_vars([minterm], [], self.num_vars)
+
+    def cube_allowed(self, value, care):
+        """
+        Tells whether every term of a cube is in the on-set or the don't cares.
+
+        Args:
+            value (int): The cube's fixed bits.
+            care (int): The cube's care mask.
+
+        Returns:
+            bool: True if the cube is an implicant.
+        """
+        free = self.full_care & ~care
+        sub = free
+        while True:
+            if value | sub not in self.allowed:
+                return False
+            if not sub:
+                return True
+            sub = (sub - 1) & free
+
+    def is_prime(self, pi):
+        """
+        Tells whether an implicant is prime: it is unless freeing one of its care bits still gives an
+        implicant, which any larger implicant containing it would.
+
+        Args:
+            pi (Implicant): An implicant of the current function.
+
+        Returns:
+            bool: True if it is prime.
+        """
+        bits = pi.care
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            if self.cube_allowed(pi.value ^ bit, pi.care):
+                return False
+        return True
+
+    def allow(self, term):
+        """
+        Adds a term to the on-set plus don't cares and updates the prime implicants: the new ones are
+        the largest implicants containing the term, and the old ones they swallow go.
+
+        Args:
+            term (int): The term.
+
+        Returns:
+            set of int: The chart columns of every row added or removed.
+        """
+        self.allowed.add(term)
+        # an old prime can only grow into a cube containing the term, i.e. one whose mirror across a care bit holds it
+        grown = [pi for pi in self.rows
+                 if ((term & pi.care) ^ pi.value).bit_count() == 1 and not self.is_prime(pi)]
+
+        # free masks F for which the cube around the term with F free is an implicant, grown one bit at a time
+        implicants = {0}
+        level = [0]
+        while level:
+            next_level = set()
+            for free in level:
+                spare = self.full_care & ~free
+                while spare:
+                    bit = spare & -spare
+                    spare ^= bit
+                    wider = free | bit
+                    if wider in next_level:
+                        continue
+                    # every smaller cube must be an implicant, then only the new half needs checking
+                    rest = wider
+                    complete = True
+                    while rest and complete:
+                        low = rest & -rest
+                        rest ^= low
+                        complete = wider ^ low in implicants
+                    if complete and self.cube_allowed((term ^ bit) & ~free, self.full_care & ~free):
+                        next_level.add(wider)
+            implicants |= next_level
+            level = next_level
+
+        affected = set()
+        for pi in grown:
+            affected |= self.remove_row(pi)
+        for free in implicants:
+            spare = self.full_care & ~free
+            while spare and free | (spare & -spare) not in implicants:
+                spare &= spare - 1
+            if not spare:
+                affected |= self.add_row(Implicant(term & ~free, self.full_care & ~free))
+        return affected
+
+    def disallow(self, term):
+        """
+        Removes a term from the on-set plus don't cares and updates the prime implicants: the ones
+        containing it go, replaced by whichever of their largest sub-cubes avoiding it are prime.
+
+        Args:
+            term (int): The term.
+
+        Returns:
+            set of int: The chart columns of every row added or removed.
+        """
+        self.allowed.discard(term)
+        lost = [pi for pi in self.rows if term & pi.care == pi.value]
+        candidates = set()
+        for pi in lost:
+            free = self.full_care & ~pi.care
+            while free:
+                bit = free & -free
+                free ^= bit
+                candidates.add(Implicant(pi.value | (bit & ~term), pi.care | bit))
+
+        affected = set()
+        for pi in lost:
+            affected |= self.remove_row(pi)
+        for pi in candidates:
+            if self.is_prime(pi):
+                affected |= self.add_row(pi)
+        return affected
+
+    def add_row(self, pi):
+        """
+        Adds a prime implicant to the chart.
+
+        Args:
+            pi (Implicant): The prime implicant.
+
+        Returns:
+            set of int: The minterms it covers.
+        """
+        free = self.full_care & ~pi.care
+        if 1 << free.bit_count() <= len(self.minterms):
+            covered = set()
+            sub = free
+            while True:
+                if pi.value | sub in self.minterms:
+                    covered.add(pi.value | sub)
+                if not sub:
+                    break
+                sub = (sub - 1) & free
+        else:
+            covered = {minterm for minterm in self.minterms if minterm & pi.care == pi.value}
+        self.rows[pi] = covered
+        for minterm in covered:
+            self.columns[minterm].add(pi)
+        return set(covered)
+
+    def remove_row(self, pi):
+        """
+        Removes a prime implicant from the chart and the cover.
+
+        Args:
+            pi (Implicant): The prime implicant.
+
+        Returns:
+            set of int: The minterms it covered.
+        """
+        covered = self.rows.pop(pi)
+        for minterm in covered:
+            self.columns[minterm].discard(pi)
+        self.selected.discard(pi)
+        return covered
+
+    def add_column(self, minterm):
+        """
+        Adds a minterm to the chart; its rows must already be there.
+
+        Args:
+            minterm (int): The minterm.
+
+        Returns:
+            set of int: The minterm.
+        """
+        self.columns[minterm] = {pi for pi in self.rows if minterm & pi.care == pi.value}
+        for pi in self.columns[minterm]:
+            self.rows[pi].add(minterm)
+        return {minterm}
+
+    def remove_column(self, minterm):
+        """
+        Removes a minterm from the chart.
+
+        Args:
+            minterm (int): The minterm.
+
+        Returns:
+            set of int: The other minterms of the rows that covered it.
+        """
+        affected = set()
+        for pi in self.columns.pop(minterm):
+            self.rows[pi].discard(minterm)
+            affected |= self.rows[pi]
+            if not self.rows[pi]:
+                self.selected.discard(pi)
+        return affected
+
+    def recover(self, affected, repair=True):
+        """
+        Re-runs covering on the chart components holding the affected minterms, or repairs the cover
+        there when they are larger than REPAIR_MIN_COLUMNS.
+
+        Args:
+            affected (set of int): Minterms whose rows changed; ones no longer in the on-set are ignored.
+            repair (bool): Allow repairing; False always re-runs covering.
+        """
+        affected = {minterm for minterm in affected if minterm in self.columns}
+        region = set(affected)
+        rows = set()
+        frontier = list(region)
+        while frontier:
+            minterm = frontier.pop()
+            for pi in self.columns[minterm]:
+                if pi not in rows:
+                    rows.add(pi)
+                    for other in self.rows[pi]:
+                        if other not in region:
+                            region.add(other)
+                            frontier.append(other)
+            if repair and len(region) > REPAIR_MIN_COLUMNS:
+                return self.repair(affected)
+        if not region:
+            return
+
+        self.selected -= rows
+        chart = build_chart(sorted(region), sorted(rows), self.num_vars, self.use_numpy, self.memory_budget)
+        essential_pis, _ = extract_essential_prime_implicants(chart)
+        if self.cover_method == 'exact':
+            final_pis, _ = exact_cover(chart, essential_pis, self.time_budget, self.node_budget)
+        else:
+            final_pis = iterative_reduction(chart, essential_pis)
+        self.selected.update(final_pis)
+
+    def repair(self, affected):
+        """
+        Fixes the cover around the affected minterms: covers those left uncovered with the rows covering
+        most of them (fewest literals on a tie), then drops selected rows there that others make redundant,
+        trying the costliest first.
+
+        Args:
+            affected (set of int): Minterms in the on-set whose rows changed.
+        """
+        uncovered = {minterm for minterm in affected if not self.columns[minterm] & self.selected}
+        added = set()
+        while uncovered:
+            candidates = set().union(*(self.columns[minterm] for minterm in uncovered))
+            best = max(candidates, key=lambda pi: (len(self.rows[pi] & uncovered), -pi.care.bit_count(), pi))
+            self.selected.add(best)
+            added.add(best)
+            uncovered -= self.rows[best]
+
+        touched = affected.union(*(self.rows[pi] for pi in added))
+        nearby = set().union(*(self.columns[minterm] & self.selected for minterm in touched))
+        for pi in sorted(nearby, key=lambda pi: (-pi.care.bit_count(), pi)):
+            if all(len(self.columns[minterm] & self.selected) > 1 for minterm in self.rows[pi]):
+                self.selected.discard(pi)
@@ -0,0 +1,161 @@
+"""
+Precomputed minimal covers of every 4-variable function, so the common GUI case is a table lookup
+instead of a Quine-McCluskey run.
+
+Build the table once with
+
+    python lookup_table.py [covers4.bin]
+
+The file holds a short header followed by one fixed-size record per function, indexed by its 16-bit truth
+table (bit m set when minterm m is in the on-set). A record is up to MAX_CUBES bytes, one per implicant
+with the value in the low nibble and the care mask in the high nibble, padded with PADDING. It is read
+through mmap, so only the pages that are looked up are ever loaded.
+
+lookup_cover also answers functions of fewer variables, and ones with a few don't cares by looking up
+every way of assigning them and keeping the cheapest cover. Anything else, or a missing table file, returns None so the caller falls back
+to the solver.
+"""
+import mmap
+import os
+import sys
+
+from quine_mccluskey import Implicant, bit_indices, implicant_cost, minimize_function, to_bitset
+
+# Number of variables the table covers
+TABLE_VARS = 4
+
+# Largest minimal cover of a 4-variable function (the parity functions need 8 implicants)
+MAX_CUBES = 8
+
+# Fills the unused bytes of a record: value 15 with care 0 is not a valid implicant
+PADDING = 0x0F
+
+# Identifies the file format
+HEADER = b'QMLUT4\x00\x01'
+
+# Default location of the table, next to this module
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'covers4.bin')
+
+# Don't cares beyond this many fall back to the solver instead of 2**n lookups
+MAX_LOOKUP_DONT_CARES = 6
+
+# Tables mapped in this process, by path
+open_tables = {}
+
+# Function to encode the cover of one function
+def encode_cover(implicants):
+    """
+    Encodes a cover as one table record.
+
+    Args:
+        implicants (list of Implicant): A cover of a 4-variable function.
+
+    Returns:
+        bytes: The record, MAX_CUBES bytes long.
+
+    Raises:
+        ValueError: If the cover has more than MAX_CUBES implicants.
+    """
+    if len(implicants) > MAX_CUBES:
+        raise ValueError(f"A cover of {len(implicants)} implicants does not fit in a record of {MAX_CUBES}.")
+    record = bytes(implicant.care << 4 | implicant.value for implicant in sorted(implicants))
+    return record + bytes([PADDING]) * (MAX_CUBES - len(record))
+
+# Function to decode one table record
+def decode_cover(record):
+    """
+    Decodes a table record.
+
+    Args:
+        record (bytes): A record from encode_cover.
+
+    Returns:
+        list of Implicant: The cover.
+    """
+    return [Implicant(byte & 0x0F, byte >> 4) for byte in record if byte != PADDING]
+
+# Function to build the lookup table
+def build_table(path=DEFAULT_TABLE_PATH):
+    """
+    Minimizes every 4-variable function and writes the table file.
+
+    Args:
+        path (str): Where to write the table.
+    """
+    with open(path, 'wb') as out:
+        out.write(HEADER)
+        for table in range(1 << (1 << TABLE_VARS)):
+            out.write(encode_cover(minimize_function(bit_indices(table), [], TABLE_VARS)))
+
+# Function to map the lookup table into memory
+def load_table(path=DEFAULT_TABLE_PATH):
+    """
+    Maps a table file into memory, once per path and process.
+
+    Args:
+        path (str): The table file.
+
+    Returns:
+        mmap.mmap or None: The mapped table, or None if the file does not exist.
+
+    Raises:
+        ValueError: If the file is not a lookup table.
+    """
+    if path not in open_tables:
+        try:
+            with open(path, 'rb') as file:
+                table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        if table[:len(HEADER)] != HEADER or len(table) != len(HEADER) + (MAX_CUBES << (1 << TABLE_VARS)):
+            table.close()
+            raise ValueError(f"{path} is not a 4-variable lookup table; rebuild it with lookup_table.py.")
+        open_tables[path] = table
+    return open_tables[path]
+
+# Function to look up the minimal cover of a function of up to 4 variables
+def lookup_cover(minterms, dont_cares, num_vars, path=DEFAULT_TABLE_PATH):
+    """
+    Looks up a minimal cover of a function of up to 4 variables. Narrower functions are looked up as the
+    4-variable function that ignores the extra leading variables, whose prime implicants never mention
+    them. With don't cares, every way of assigning them is looked up and the cheapest cover kept, which is
+    as minimal as solving with the don't cares.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int): Number of variables.
+        path (str): The table file.
+
+    Returns:
+        list of Implicant or None: The cover, or None when the function has to go to the solver (more
+        than 4 variables, more than MAX_LOOKUP_DONT_CARES don't cares, or no table file).
+    """
+    if num_vars > TABLE_VARS:
+        return None
+    on_table = to_bitset(minterms, 1 << num_vars)
+    free = bit_indices(to_bitset(dont_cares, 1 << num_vars) & ~on_table)
+    if len(free) > MAX_LOOKUP_DONT_CARES:
+        return None
+    table = load_table(path)
+    if table is None:
+        return None
+
+    # copies of the truth table side by side, one per value of the ignored variables
+    repeat = sum(1 << (copy << num_vars) for copy in range(1 << (TABLE_VARS - num_vars)))
+    best = None
+    for assignment in range(1 << len(free)):
+        index = on_table
+        for position, minterm in enumerate(free):
+            if assignment >> position & 1:
+                index |= 1 << minterm
+        offset = len(HEADER) + index * repeat * MAX_CUBES
+        cover = decode_cover(table[offset:offset + MAX_CUBES])
+        cost = sum(implicant_cost(implicant) for implicant in cover)
+        if best is None or cost < best[0]:
+            best = (cost, cover)
+    return best[1]
+
+
+if __name__ == "__main__":
+    build_table(*sys.argv[1:2])
@@ -0,0 +1,219 @@
+"""
+Multi-output minimization: several functions of the same inputs share one set of product terms, as in a PLA,
+so a product needed by more than one output is built only once.
+
+Prime implicants are generated once for all outputs, each tagged with the set of outputs (a bitmask) it is
+an implicant of. A term stays prime when no larger term has the same tag, so a product that only one
+output could grow larger is still offered to the outputs it serves together. One covering problem is then
+solved over every (output, minterm) pair, counting each product once however many outputs use it. Here
+the second output gives up the smaller A'B' to reuse the first output's A'B'C', three products instead
+of four:
+
+    covers = minimize_multi_output([([0, 3], []), ([0, 1, 5], [])], 3)
+    [sop_expression(cover, 3) for cover in covers]  # ["A'B'C' + A'BC", "A'B'C' + B'C"]
+    shared_terms(covers)  # [(Implicant(value=0, care=7), [0, 1]), (Implicant(value=1, care=3), [1]), ...]
+"""
+from quine_mccluskey import (
+    BYTES_PER_TERM, DEFAULT_COVER_TIME_BUDGET, DEFAULT_MEMORY_BUDGET, Chart, Implicant, MemoryBudgetExceeded,
+    chart_size, exact_cover, extract_essential_prime_implicants, greedy_cover, resolve_num_vars,
+)
+
+# Function to find the prime implicants of several outputs at once
+def find_multi_output_primes(functions, num_vars, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Finds the multi-output prime implicants of several functions with the Quine-McCluskey method, each
+    term carrying the outputs whose on-set plus don't cares contain it. Two terms combine when they
+    differ by one bit and share an output; the result keeps the shared outputs, and a term is only
+    absorbed by a combination that keeps all of its outputs.
+
+    Args:
+        functions (list of tuple): (minterms, dont_cares) of each output.
+        num_vars (int): Number of variables.
+        memory_budget (int or None): Maximum estimated size of the implicant tables in bytes, None for no limit.
+
+    Returns:
+        dict: Each prime implicant mapped to the bitmask of outputs it is an implicant of.
+
+    Raises:
+        MemoryBudgetExceeded: If the implicant tables would exceed memory_budget.
+    """
+    max_terms = None if memory_budget is None else memory_budget // BYTES_PER_TERM
+    tags = {}
+    for output, (minterms, dont_cares) in enumerate(functions):
+        for term in set(minterms).union(dont_cares):
+            tags[term] = tags.get(term, 0) | 1 << output
+    groups = {(1 << num_vars) - 1: tags}
+
+    prime_implicants = {}
+    while groups:
+        next_groups = {}
+        for care, values in groups.items():
+            absorbed = set()
+            for value, tag in values.items():
+                free = care & ~value
+                while free:
+                    bit = free & -free
+                    free ^= bit
+                    partner_tag = values.get(value | bit)
+                    if partner_tag is None or not tag & partner_tag:
+                        continue
+                    shared = tag & partner_tag
+                    next_groups.setdefault(care & ~bit, {})[value] = shared
+                    if shared == tag:
+                        absorbed.add(value)
+                    if shared == partner_tag:
+                        absorbed.add(value | bit)
+            for value, tag in values.items():
+                if value not in absorbed:
+                    prime_implicants[Implicant(value, care)] = tag
+        live_terms = len(prime_implicants) + sum(len(values) for values in next_groups.values())
+        if max_terms is not None and live_terms > max_terms:
+            raise MemoryBudgetExceeded(
+                f"Implicant table for {num_vars} variables needs more than {memory_budget} bytes; "
+                "raise the memory budget or reduce the function."
+            )
+        groups = next_groups
+
+    return prime_implicants
+
+# Function to build the shared prime implicant chart
+def build_multi_output_chart(on_sets, prime_implicants, num_vars):
+    """
+    Constructs the chart of the shared covering problem: one column per (output, minterm) pair of the
+    on-sets, and one row per prime implicant covering the pairs of the outputs in its tag.
+
+    Args:
+        on_sets (list of list of int): The sorted minterms of each output.
+        prime_implicants (dict): Prime implicants mapped to their output bitmasks.
+        num_vars (int): Number of variables.
+
+    Returns:
+        Chart: The chart; its minterms are (output, minterm) pairs.
+    """
+    full_care = (1 << num_vars) - 1
+    pairs = [(output, minterm) for output, minterms in enumerate(on_sets) for minterm in minterms]
+    column_of = {pair: col for col, pair in enumerate(pairs)}
+    pis = sorted(prime_implicants)
+    rows = []
+    columns = [0] * len(pairs)
+    for row, pi in enumerate(pis):
+        free = full_care & ~pi.care
+        covered = 0
+        for output, minterms in enumerate(on_sets):
+            if not prime_implicants[pi] >> output & 1:
+                continue
+            if 1 << free.bit_count() <= len(minterms):
+                sub = free
+                while True:
+                    col = column_of.get((output, pi.value | sub))
+                    if col is not None:
+                        covered |= 1 << col
+                    if not sub:
+                        break
+                    sub = (sub - 1) & free
+            else:
+                for minterm in minterms:
+                    if minterm & pi.care == pi.value:
+                        covered |= 1 << column_of[output, minterm]
+        rows.append(covered)
+        while covered:
+            bit = covered & -covered
+            covered ^= bit
+            columns[bit.bit_length() - 1] |= 1 << row
+    return Chart(pairs, pis, rows, columns)
+
+# Function to drop products an output does not need
+def output_cover(minterms, products):
+    """
+    Picks the products one output uses out of the shared cover: those in its tag that cover one of its
+    minterms, less any whose minterms are all covered by the others, trying the costliest first.
+
+    Args:
+        minterms (list of int): The output's minterms.
+        products (list of Implicant): Selected products whose tag includes the output.
+
+    Returns:
+        list of Implicant: The output's cover, sorted.
+    """
+    points = [[m for m in minterms if m & pi.care == pi.value] for pi in products]
+    counts = {}
+    for inside in points:
+        for minterm in inside:
+            counts[minterm] = counts.get(minterm, 0) + 1
+    kept = []
+    for idx in sorted(range(len(products)), key=lambda idx: -products[idx].care.bit_count()):
+        if all(counts[minterm] > 1 for minterm in points[idx]):
+            for minterm in points[idx]:
+                counts[minterm] -= 1
+        else:
+            kept.append(products[idx])
+    return sorted(kept)
+
+# Function to minimize several outputs together
+def minimize_multi_output(functions, num_vars=None, memory_budget=DEFAULT_MEMORY_BUDGET, cover='exact',
+                          time_budget=DEFAULT_COVER_TIME_BUDGET, node_budget=None):
+    """
+    Minimizes several functions of the same inputs together, choosing products to minimize the number of
+    distinct products across all outputs, then the number of literals in them.
+
+    Args:
+        functions (list of tuple): (minterms, dont_cares) of each output.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+        memory_budget (int or None): Maximum estimated size of the implicant tables, and of the shared chart,
+            in bytes, None for no limit.
+        cover (str): 'exact' for a minimum cover found within the budgets (see exact_cover), 'greedy' for
+            the fast greedy cover.
+        time_budget (float or None): Seconds allowed for the exact cover, None for no limit.
+        node_budget (int or None): Search nodes allowed for the exact cover, None for no limit.
+
+    Returns:
+        list of list of Implicant: The cover of each output, in the order given.
+
+    Raises:
+        ValueError: If a term does not fit in num_vars variables, or cover is unknown.
+        MemoryBudgetExceeded: If the implicant tables or the chart would exceed memory_budget.
+    """
+    if cover not in ('exact', 'greedy'):
+        raise ValueError(f"Unknown cover {cover!r}, expected 'exact' or 'greedy'.")
+    num_vars = resolve_num_vars([m for minterms, _ in functions for m in minterms],
+                                [d for _, dont_cares in functions for d in dont_cares], num_vars)
+    on_sets = [sorted(set(minterms)) for minterms, _ in functions]
+    prime_implicants = find_multi_output_primes(functions, num_vars, memory_budget)
+    num_pairs = sum(len(minterms) for minterms in on_sets)
+    if memory_budget is not None and (chart_size(num_pairs, len(prime_implicants))
+                                      + len(prime_implicants) * BYTES_PER_TERM > memory_budget):
+        raise MemoryBudgetExceeded(
+            f"Chart of {len(prime_implicants)} prime implicants by {num_pairs} output minterms needs more "
+            f"than {memory_budget} bytes; raise the memory budget or reduce the function."
+        )
+    chart = build_multi_output_chart(on_sets, prime_implicants, num_vars)
+
+    essential_pis, covered = extract_essential_prime_implicants(chart)
+    if cover == 'exact':
+        # a product outweighs every literal a cover could hold, so fewer products always wins
+        weight = num_vars * len(chart.minterms) + 1
+        costs = [weight + pi.care.bit_count() for pi in chart.prime_implicants]
+        selected, _ = exact_cover(chart, essential_pis, time_budget, node_budget, costs)
+    else:
+        uncovered = ((1 << len(chart.minterms)) - 1) & ~covered
+        selected = essential_pis + [chart.prime_implicants[row] for row in greedy_cover(chart, uncovered)]
+
+    return [output_cover(minterms, [pi for pi in selected if prime_implicants[pi] >> output & 1])
+            for output, minterms in enumerate(on_sets)]
+
+# Function to list the products of a multi-output cover
+def shared_terms(covers):
+    """
+    Lists every distinct product of a multi-output cover with the outputs that use it.
+
+    Args:
+        covers (list of list of Implicant): The covers from minimize_multi_output.
+
+    Returns:
+        list of tuple: (Implicant, list of output indices) for each product, sorted by product.
+    """
+    users = {}
+    for output, cover in enumerate(covers):
+        for pi in cover:
+            users.setdefault(pi, []).append(output)
+    return sorted(users.items())
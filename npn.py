@@ -0,0 +1,223 @@
+"""
+NPN canonicalization: functions equal up to input permutation and input negation share one class
+representative, so a batch only has to minimize each class once.
+
+A function is held as truth tables, ints with bit x set when minterm x is in the on-set (or don't-care
+set). npn_canonical picks the transform that maps it to its class representative; the representative is
+minimized (through a ResultCache, so each class is solved once) and the cover is mapped back with
+untransform_implicant, ready for sop_expression with the caller's own variable names.
+
+The representative is chosen by fixing input phases from cofactor ones-counts and ordering inputs by
+those counts, trying every tie-break up to MAX_CANDIDATES. Functions with more ties than that may land
+on different representatives of the same class, which only costs a cache miss.
+
+Output negation is left out, so the classes are really NP classes: a cover of f's on-set is no use for
+~f, whose cover is one of f's off-set, so f and ~f would need a solve each anyway.
+"""
+from collections import namedtuple
+from itertools import islice, permutations, product
+
+from quine_mccluskey import Implicant, bit_indices, minimize_function, resolve_num_vars, to_bitset
+
+# Truth tables beyond this many inputs are too large to canonicalize; such functions are minimized directly
+NPN_MAX_VARS = 16
+
+# Tie-breaks tried when looking for the representative
+MAX_CANDIDATES = 1024
+
+# The transform taking a function to its representative: every input in the input_negations mask is
+# complemented, then input i of the representative is input permutation[i] of the function.
+Transform = namedtuple('Transform', ['input_negations', 'permutation'])
+
+# Function to build a truth table
+def truth_table(minterms, num_vars):
+    """
+    Builds the truth table of a set of minterms.
+
+    Args:
+        minterms (iterable of int): The minterms.
+        num_vars (int): Number of variables.
+
+    Returns:
+        int: The truth table, bit x set for every minterm x.
+    """
+    return to_bitset(minterms, 1 << num_vars)
+
+# Function to build the mask of truth table positions with an input at 0
+def low_half_mask(var, num_vars):
+    """
+    Builds the mask of truth table positions whose minterm has bit `var` clear.
+
+    Args:
+        var (int): The input, as a bit position of the minterm.
+        num_vars (int): Number of variables.
+
+    Returns:
+        int: The mask.
+    """
+    width = 1 << var
+    mask = (1 << width) - 1
+    period = width * 2
+    while period < 1 << num_vars:
+        mask |= mask << period
+        period *= 2
+    return mask
+
+# Function to complement one input of a truth table
+def negate_input(table, var, masks):
+    """
+    Complements input `var`: the result holds bit x ^ (1 << var) for every bit x of the table.
+
+    Args:
+        table (int): A truth table.
+        var (int): The input to complement.
+        masks (list of int): low_half_mask of every input.
+
+    Returns:
+        int: The transformed truth table.
+    """
+    shift = 1 << var
+    return ((table & masks[var]) << shift) | ((table >> shift) & masks[var])
+
+# Function to exchange two inputs of a truth table
+def swap_inputs(table, low, high, masks):
+    """
+    Exchanges inputs `low` and `high` (low < high) of a truth table with a delta swap.
+
+    Args:
+        table (int): A truth table.
+        low (int): The lower input.
+        high (int): The higher input.
+        masks (list of int): low_half_mask of every input.
+
+    Returns:
+        int: The transformed truth table.
+    """
+    shift = (1 << high) - (1 << low)
+    # positions with the low input set and the high one clear trade places with their mirror image
+    moving = ~masks[low] & masks[high] & ((1 << (1 << len(masks))) - 1)
+    return (table & ~(moving | moving << shift)) | ((table & moving) << shift) | ((table >> shift) & moving)
+
+# Function to apply the input part of a transform to a truth table
+def transform_table(table, transform, masks):
+    """
+    Applies the input negations and permutation of a transform to a truth table.
+
+    Args:
+        table (int): A truth table.
+        transform (Transform): The transform.
+        masks (list of int): low_half_mask of every input.
+
+    Returns:
+        int: The transformed truth table.
+    """
+    for var in range(len(masks)):
+        if transform.input_negations >> var & 1:
+            table = negate_input(table, var, masks)
+    order = list(range(len(masks)))
+    for target, source in enumerate(transform.permutation):
+        current = order.index(source)
+        if current != target:
+            table = swap_inputs(table, target, current, masks)
+            order[target], order[current] = order[current], order[target]
+    return table
+
+# Function to find the NPN class representative of a function
+def npn_canonical(on_table, dc_table, num_vars):
+    """
+    Finds the class representative of a function and the transform that maps the function to it.
+
+    Args:
+        on_table (int): Truth table of the on-set.
+        dc_table (int): Truth table of the don't cares.
+        num_vars (int): Number of variables.
+
+    Returns:
+        tuple: The representative's on-set and don't-care truth tables, and the Transform.
+    """
+    masks = [low_half_mask(var, num_vars) for var in range(num_vars)]
+
+    # complement each input whose 1-half holds fewer ones than its 0-half; inputs left tied get both phases
+    negations = 0
+    tied = []
+    signatures = []
+    for var in range(num_vars):
+        low = ((on_table & masks[var]).bit_count(), (dc_table & masks[var]).bit_count())
+        high = ((on_table & ~masks[var]).bit_count(), (dc_table & ~masks[var]).bit_count())
+        if high < low:
+            negations |= 1 << var
+        elif high == low:
+            tied.append(var)
+        signatures.append(max(low, high))
+
+    # order inputs by signature; inputs with equal signatures may come in any order
+    ranked = sorted(range(num_vars), key=lambda var: signatures[var], reverse=True)
+    blocks = []
+    for var in ranked:
+        if blocks and signatures[blocks[-1][0]] == signatures[var]:
+            blocks[-1].append(var)
+        else:
+            blocks.append([var])
+
+    best = None
+    choices = product(product((0, 1), repeat=len(tied)), product(*(permutations(block) for block in blocks)))
+    for flips, orders in islice(choices, MAX_CANDIDATES):
+        mask = negations
+        for var, flip in zip(tied, flips):
+            mask |= flip << var
+        # representative input i is input permutation[i]: the highest ranked input becomes the top bit
+        permutation = tuple(reversed([var for order in orders for var in order]))
+        transform = Transform(mask, permutation)
+        candidate = (transform_table(on_table, transform, masks), transform_table(dc_table, transform, masks))
+        if best is None or candidate < best[0]:
+            best = (candidate, transform)
+
+    (rep_on, rep_dc), transform = best
+    return rep_on, rep_dc, transform
+
+# Function to map an implicant of the representative back to the original function
+def untransform_implicant(implicant, transform):
+    """
+    Maps an implicant over the representative's inputs back to the original function's inputs.
+
+    Args:
+        implicant (Implicant): An implicant of the representative.
+        transform (Transform): The transform from npn_canonical.
+
+    Returns:
+        Implicant: The matching implicant of the original function.
+    """
+    value = 0
+    care = 0
+    for target, source in enumerate(transform.permutation):
+        value |= (implicant.value >> target & 1) << source
+        care |= (implicant.care >> target & 1) << source
+    return Implicant(value ^ (transform.input_negations & care), care)
+
+# Function to minimize a function through its NPN class representative
+def minimize_npn(minterms, dont_cares, num_vars=None, cache=None, **options):
+    """
+    minimize_function through the function's class representative: the representative is minimized
+    (through `cache`, so every function of the class after the first is a cache hit) and the cover mapped
+    back. Functions with more than NPN_MAX_VARS inputs are minimized directly.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+        cache (ResultCache or None): Cache for the representatives' results, None to always minimize.
+        **options: Keyword arguments for minimize_function.
+
+    Returns:
+        list of Implicant: The minimized prime implicants of the original function.
+    """
+    num_vars = resolve_num_vars(minterms, dont_cares, num_vars)
+    solve = minimize_function if cache is None else cache.minimize
+    if num_vars > NPN_MAX_VARS or not minterms:
+        return solve(minterms, dont_cares, num_vars, **options)
+
+    on_table = truth_table(minterms, num_vars)
+    dc_table = truth_table(dont_cares, num_vars) & ~on_table
+    rep_on, rep_dc, transform = npn_canonical(on_table, dc_table, num_vars)
+    implicants = solve(bit_indices(rep_on), bit_indices(rep_dc), num_vars, **options)
+    return sorted(untransform_implicant(implicant, transform) for implicant in implicants)
@@ -0,0 +1,1255 @@
+"""
+Quine-McCluskey minimization shared by the command line interface (cli.py) and the desktop app (app.py).
+
+Both front ends import from here, so this module is also the documented reference for each step of the
+algorithm. Any number of variables is accepted; names are generated automatically when none are given.
+"""
+import heapq
+import os
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from string import ascii_uppercase
+
+from espresso import espresso
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, the pure Python chart is used without it
+    numpy = None
+
+# Rough cost of one implicant held in the working tables (set slot plus int object), used to enforce
+# the memory budget without having to measure the real process size.
+BYTES_PER_TERM = 96
+
+# Rough cost of one row or column of the prime implicant chart (int object header), on top of the two bits
+# each cell takes in its row and its column, used to count the chart toward the memory budget.
+BYTES_PER_CHART_LINE = 32
+
+# Default memory budget for the implicant tables: 1 GiB.
+DEFAULT_MEMORY_BUDGET = 1 << 30
+
+# Charts with at least this many cells (minterms x prime implicants) are built with numpy when it is
+# installed, and the coverage matrix is computed in blocks of about NUMPY_BLOCK_CELLS cells.
+NUMPY_MIN_CELLS = 1 << 16
+NUMPY_BLOCK_CELLS = 1 << 24
+
+# Levels of prime implicant generation with at least this many terms are merged on worker processes
+# when find_prime_implicants is given more than one worker; smaller ones are not worth the overhead.
+PARALLEL_MIN_TERMS = 1 << 15
+
+# Records sorted in memory at least, however small the budget, when a level is spilled to disk, and
+# most run files merged at once
+SPILL_MIN_SORT_ITEMS = 1 << 12
+SPILL_MAX_RUNS = 64
+
+# Default wall-clock budget in seconds for proving a cover minimal; the best cover found so far is used
+# once it runs out.
+DEFAULT_COVER_TIME_BUDGET = 1.0
+
+# Search nodes of the exact cover with at most this many rows left are reduced again (see reduce_cover);
+# on larger ones the quadratic dominance checks cost more than the nodes they save.
+NODE_REDUCTION_MAX_ROWS = 256
+
+# An implicant is a pair of ints: bits set in `care` are fixed to the matching bit of
+# `value`, bits clear in `care` are the '-' positions (and are always 0 in `value`).
+Implicant = namedtuple('Implicant', ['value', 'care'])
+
+# A prime implicant chart: `rows[i]` is an int bitset of the columns (positions in `minterms`) covered by
+# `prime_implicants[i]`, `columns[j]` is an int bitset of the rows covering `minterms[j]`. Charts built
+# with numpy also keep `matrix`, the same rows packed as a uint8 array (bit j of row i is bit j & 7 of
+# byte j >> 3).
+Chart = namedtuple('Chart', ['minterms', 'prime_implicants', 'rows', 'columns', 'matrix'], defaults=(None,))
+
+class MemoryBudgetExceeded(MemoryError):
+    """
+    Raised when the implicant tables or the prime implicant chart would grow beyond the configured memory
+    budget.
+    """
+
+
+class MinimizationStats:
+    """
+    Opt-in instrumentation of one minimization: wall time per phase, term counts per level of prime
+    implicant generation, and counters of the chart and cover steps. Pass an instance as `stats` to
+    minimize_function; without one nothing is measured.
+
+    `callback`, if given, is called as callback(event, data) when a phase ends (event is the phase name,
+    data its counters with 'seconds') and after each level (event 'level', data that level's counters),
+    so the numbers can be shipped to a metrics system as they are produced.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.phases = {}
+        self.levels = []
+        self.counters = {}
+        self.pending = {}
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the enclosed block as phase `name`, adding to earlier time of the same phase.
+
+        Args:
+            name (str): The phase name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+            if self.callback is not None:
+                self.callback(name, {'seconds': seconds, **self.pending})
+            self.pending = {}
+
+    def add_level(self, **counts):
+        """
+        Records the counters of one level of prime implicant generation.
+
+        Args:
+            **counts: The level's counters.
+        """
+        self.levels.append(counts)
+        if self.callback is not None:
+            self.callback('level', counts)
+
+    def count(self, **counts):
+        """
+        Sets counters, reported to the callback with the phase they are set in.
+
+        Args:
+            **counts: Counter names and values.
+        """
+        self.counters.update(counts)
+        self.pending.update(counts)
+
+    def as_dict(self):
+        """
+        Returns everything recorded, ready for json.dumps.
+
+        Returns:
+            dict: phases (seconds by name), levels (a list of counter dicts) and the counters.
+        """
+        return {'phases': dict(self.phases), 'levels': list(self.levels), **self.counters}
+
+# Function to time a phase when instrumentation is on
+def timed(stats, name):
+    """
+    Returns stats.phase(name), or a context that does nothing when stats is None.
+
+    Args:
+        stats (MinimizationStats or None): Where to record the phase.
+        name (str): The phase name.
+
+    Returns:
+        context manager: The timer.
+    """
+    return nullcontext() if stats is None else stats.phase(name)
+
+# Function to price an implicant in hardware terms
+def implicant_cost(implicant):
+    """
+    Cost of an implicant as gate inputs: one per literal on its AND gate, plus its input on the OR gate.
+
+    Args:
+        implicant (Implicant): An implicant.
+
+    Returns:
+        int: The cost.
+    """
+    return implicant.care.bit_count() + 1
+
+# Function to generate default variable names
+def variable_names(num_vars):
+    """
+    Generates default variable names: A, B, C, ... for up to 26 variables, x0, x1, ... beyond that.
+
+    Args:
+        num_vars (int): The number of variables.
+
+    Returns:
+        list of str: The variable names, most significant first.
+    """
+    if num_vars <= len(ascii_uppercase):
+        return list(ascii_uppercase[:num_vars])
+    return [f"x{idx}" for idx in range(num_vars)]
+
+# Function to work out and check the number of variables
+def resolve_num_vars(minterms, dont_cares, num_vars=None):
+    """
+    Checks that every term fits in the given number of variables, or infers the smallest count that fits.
+
+    Args:
+        minterms (list of int): List of minterms.
+        dont_cares (list of int): List of don't-care conditions.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+
+    Returns:
+        int: The number of variables.
+
+    Raises:
+        ValueError: If num_vars or a term is negative, or a term does not fit in num_vars variables.
+    """
+    smallest = min(min(minterms, default=0), min(dont_cares, default=0))
+    if smallest < 0:
+        raise ValueError("Minterms and don't cares must not be negative.")
+    largest = max(max(minterms, default=0), max(dont_cares, default=0))
+    if num_vars is None:
+        return max(largest.bit_length(), 1)
+    if num_vars < 0:
+        raise ValueError(f"The number of variables must not be negative, got {num_vars}.")
+    if largest >= 1 << num_vars:
+        raise ValueError(f"Term {largest} does not fit in {num_vars} variables (maximum is {(1 << num_vars) - 1}).")
+    return num_vars
+
+# Function to convert an implicant to its binary string form
+def to_binary(implicant, num_vars):
+    """
+    Converts an implicant to its binary string representation, using '-' for don't-care positions.
+    Only used when rendering; the rest of the pipeline works on the integer form.
+
+    Args:
+        implicant (Implicant): The implicant to convert.
+        num_vars (int): The number of binary digits (variables).
+
+    Returns:
+        str: Binary representation of the implicant with leading zeros, e.g. '01-1'.
+    """
+    bits = []
+    for idx in range(num_vars - 1, -1, -1):
+        if not (implicant.care >> idx) & 1:
+            bits.append('-')
+        else:
+            bits.append('1' if (implicant.value >> idx) & 1 else '0')
+    return ''.join(bits)
+
+# Function to combine all implicants sharing one dash pattern
+def combine_terms(care, values, probes=None):
+    """
+    Combines every pair of implicants with the same don't-care positions that differ by exactly one bit.
+    Instead of comparing all pairs, each value looks up its partner directly by setting one of its
+    0 bits in a hash set, so each pair is found exactly once. Results are deduplicated.
+
+    Args:
+        care (int): The care mask shared by all the values.
+        values (set of int): The values of the implicants with that care mask.
+        probes (iterable of int or None): Only look up partners for these values, None for all of them.
+            Pairs are found from their lower value, so splitting the values into probe slices splits
+            the work without missing or repeating a pair.
+
+    Returns:
+        tuple: A set of combined implicants and the set of values that were combined at least once.
+    """
+    combined = set()
+    merged = set()
+    for value in values if probes is None else probes:
+        free = care & ~value
+        while free:
+            bit = free & -free
+            free ^= bit
+            if value | bit in values:
+                combined.add(Implicant(value, care & ~bit))
+                merged.add(value)
+                merged.add(value | bit)
+    return combined, merged
+
+# Level being merged, as seen by each worker process of merge_level_parallel
+merge_groups = None
+
+# Function to hand the level being merged to a worker process
+def init_merge_worker(groups):
+    """
+    Pool initializer for merge_level_parallel. With the fork start method the level is inherited
+    rather than copied, so every worker sees the full hash sets at no cost.
+
+    Args:
+        groups (dict): The level, mapping each care mask to its set of values.
+    """
+    global merge_groups
+    merge_groups = groups
+
+# Function to merge one slice of a level in a worker process
+def merge_slice(care, probes):
+    """
+    Runs combine_terms for a slice of one care group against the whole group.
+
+    Args:
+        care (int): The care mask of the group.
+        probes (list of int): The slice of values to look up partners for.
+
+    Returns:
+        tuple: The care mask, the set of combined implicants and the set of values combined at least once.
+    """
+    combined, merged = combine_terms(care, merge_groups[care], probes)
+    return care, combined, merged
+
+# Function to merge one level of implicants on a pool of worker processes
+def merge_level_parallel(groups, workers):
+    """
+    Merges one level with every care group split into slices of probe values, spread over worker
+    processes. Slices of the same group may report the same combined implicant; the caller's sets
+    deduplicate them.
+
+    Args:
+        groups (dict): The level, mapping each care mask to its set of values.
+        workers (int): Number of worker processes.
+
+    Yields:
+        tuple: (care, combined, merged) for each slice, as returned by merge_slice.
+    """
+    with ProcessPoolExecutor(workers, initializer=init_merge_worker, initargs=(groups,)) as executor:
+        futures = []
+        for care, values in groups.items():
+            probes = list(values)
+            step = max(len(probes) // (4 * workers), 1024)
+            for start in range(0, len(probes), step):
+                futures.append(executor.submit(merge_slice, care, probes[start:start + step]))
+        for future in futures:
+            yield future.result()
+
+# Function to find all prime implicants
+def find_prime_implicants(minterms, num_vars, memory_budget=DEFAULT_MEMORY_BUDGET, merge_workers=None, stats=None,
+                          checkpoint=None):
+    """
+    Finds all prime implicants from a given list of minterms using the Quine-McCluskey method.
+    Terms are grouped by their dash pattern, since only terms sharing one can ever combine.
+
+    Args:
+        minterms (list of int): List of minterms to minimize.
+        num_vars (int): The number of variables in the Boolean function.
+        memory_budget (int or None): Maximum estimated size of the implicant tables in bytes, None for no limit.
+        merge_workers (int or None): Worker processes for levels of at least PARALLEL_MIN_TERMS terms (see
+            merge_level_parallel), None or 1 to merge every level in this process.
+        stats (MinimizationStats or None): Records the counters of every level when given.
+        checkpoint (Checkpoint or None): Saves the level about to be merged and the primes found so far
+            whenever it is due, and resumes from its loaded state in the 'levels' phase (see checkpoint.py).
+
+    Returns:
+        list of Implicant: A sorted list of prime implicants.
+
+    Raises:
+        MemoryBudgetExceeded: If the implicant tables would exceed memory_budget.
+    """
+    max_terms = None if memory_budget is None else memory_budget // BYTES_PER_TERM
+    groups = {(1 << num_vars) - 1: set(minterms)}
+
+    prime_implicants = []
+    depth = 0
+    if checkpoint is not None and checkpoint.state is not None and checkpoint.state.phase == 'levels':
+        groups = checkpoint.state.groups
+        prime_implicants = list(checkpoint.state.prime_implicants)
+        depth = checkpoint.state.level
+    while groups:
+        if checkpoint is not None and checkpoint.due(depth):
+            checkpoint.save('levels', depth, groups, prime_implicants)
+        level_terms = sum(len(values) for values in groups.values())
+        live_terms = len(prime_implicants) + level_terms
+        if merge_workers and merge_workers > 1 and level_terms >= PARALLEL_MIN_TERMS:
+            level = merge_level_parallel(groups, merge_workers)
+        else:
+            level = ((care,) + combine_terms(care, values) for care, values in groups.items())
+
+        next_groups = {}
+        merged_values = {care: set() for care in groups}
+        for care, combined, merged in level:
+            for term in combined:
+                next_groups.setdefault(term.care, set()).add(term.value)
+            merged_values[care] |= merged
+            live_terms += len(combined)
+            if max_terms is not None and live_terms > max_terms:
+                raise MemoryBudgetExceeded(
+                    f"Implicant table for {num_vars} variables needs more than {memory_budget} bytes; "
+                    "raise the memory budget or reduce the function."
+                )
+        primes_before = len(prime_implicants)
+        for care, values in groups.items():
+            prime_implicants.extend(Implicant(value, care) for value in values - merged_values[care])
+        if stats is not None:
+            # every combined term with k dashes is found once per dash, from the group without it
+            combined_terms = sum(len(values) for values in next_groups.values())
+            merges = (depth + 1) * combined_terms
+            stats.add_level(
+                level=depth,
+                terms=level_terms,
+                care_groups=len(groups),
+                comparisons=sum((care & ~value).bit_count() for care, values in groups.items() for value in values),
+                merges=merges,
+                duplicates=merges - combined_terms,
+                prime_implicants=len(prime_implicants) - primes_before,
+            )
+        groups = next_groups
+        depth += 1
+
+    return sorted(prime_implicants)
+
+# Function to encode a term as a fixed-width record
+def term_record(value, care, width):
+    """
+    Encodes a term as bytes that sort like (care, value), so sorted files keep each care group together.
+
+    Args:
+        value (int): The value of the term.
+        care (int): The care mask of the term.
+        width (int): Bytes per field, enough for num_vars bits.
+
+    Returns:
+        bytes: The record, 2 * width bytes long.
+    """
+    return care.to_bytes(width, 'big') + value.to_bytes(width, 'big')
+
+# Function to decode a fixed-width record
+def record_term(record, width):
+    """
+    Decodes a record written by term_record.
+
+    Args:
+        record (bytes): The record.
+        width (int): Bytes per field.
+
+    Returns:
+        Implicant: The term.
+    """
+    return Implicant(int.from_bytes(record[width:], 'big'), int.from_bytes(record[:width], 'big'))
+
+# Function to write records to a temporary file
+def write_records(records, spill_dir=None):
+    """
+    Writes records to a new temporary file, in the order given.
+
+    Args:
+        records (iterable of bytes): The records.
+        spill_dir (str or None): Directory of the file, None for the system default.
+
+    Returns:
+        tuple: The path of the file and the number of records written.
+    """
+    fd, path = tempfile.mkstemp(suffix='.qm', dir=spill_dir)
+    count = 0
+    with os.fdopen(fd, 'wb') as out:
+        for record in records:
+            out.write(record)
+            count += 1
+    return path, count
+
+# Function to stream fixed-width records from a file
+def read_records(path, size):
+    """
+    Yields the records of a file written by write_records, reading it in large chunks.
+
+    Args:
+        path (str): The file.
+        size (int): Bytes per record.
+
+    Yields:
+        bytes: Each record.
+    """
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(size * 8192)
+            if not chunk:
+                return
+            for start in range(0, len(chunk), size):
+                yield chunk[start:start + size]
+
+# Function to sort records with bounded memory
+def external_sort(records, size, max_items, spill_dir=None):
+    """
+    Sorts records holding at most max_items in memory: every full buffer is sorted and written out as a
+    run, and the runs are merged as they are read back, at most SPILL_MAX_RUNS files at a time. Input
+    that fits in one buffer never touches disk.
+
+    Args:
+        records (iterable of bytes): The records, in any order.
+        size (int): Bytes per record.
+        max_items (int): Records held in memory at once.
+        spill_dir (str or None): Directory of the run files, None for the system default.
+
+    Yields:
+        bytes: The records in sorted order, duplicates included.
+    """
+    runs = []
+    try:
+        buffer = []
+        for record in records:
+            buffer.append(record)
+            if len(buffer) >= max_items:
+                buffer.sort()
+                runs.append(write_records(buffer, spill_dir)[0])
+                buffer = []
+        buffer.sort()
+        if not runs:
+            yield from buffer
+            return
+        runs.append(write_records(buffer, spill_dir)[0])
+        del buffer
+        # merge the oldest runs into one until few enough are left to read back at once
+        while len(runs) > SPILL_MAX_RUNS:
+            merging = runs[:SPILL_MAX_RUNS]
+            runs.append(write_records(heapq.merge(*(read_records(run, size) for run in merging)), spill_dir)[0])
+            del runs[:SPILL_MAX_RUNS]
+            for run in merging:
+                os.remove(run)
+        yield from heapq.merge(*(read_records(run, size) for run in runs))
+    finally:
+        for run in runs:
+            os.remove(run)
+
+# Function to build the next level of a spilled level
+def spill_next_level(level_path, num_vars, width, max_items, spill_dir=None):
+    """
+    Builds the next level of a level held in a sorted file, without holding either in memory. Every term
+    proposes the combined term it would form with its neighbour across each care bit; a combined term
+    with k dashes exists exactly when all 2k of its halves are in the level, so after an external sort
+    it is kept when it was proposed 2k times.
+
+    Args:
+        level_path (str): Sorted file of the level.
+        num_vars (int): Number of variables.
+        width (int): Bytes per record field.
+        max_items (int): Records held in memory at once while sorting.
+        spill_dir (str or None): Directory of the temporary files.
+
+    Returns:
+        tuple: The path of the next level's sorted file and its number of terms.
+    """
+    full_care = (1 << num_vars) - 1
+
+    def proposals():
+        for record in read_records(level_path, 2 * width):
+            value, care = record_term(record, width)
+            bits = care
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                yield term_record(value & ~bit, care & ~bit, width)
+
+    def complete(records):
+        previous = None
+        count = 0
+        for record in records:
+            if record == previous:
+                count += 1
+                continue
+            if previous is not None and count == 2 * (full_care & ~record_term(previous, width).care).bit_count():
+                yield previous
+            previous, count = record, 1
+        if previous is not None and count == 2 * (full_care & ~record_term(previous, width).care).bit_count():
+            yield previous
+
+    return write_records(complete(external_sort(proposals(), 2 * width, max_items, spill_dir)), spill_dir)
+
+# Function to list the prime implicants of a spilled level
+def spill_primes(level_path, next_path, num_vars, width, max_items, spill_dir=None):
+    """
+    Yields the terms of a spilled level that are not half of any term of the next level, by merging the
+    level against the sorted halves of the next level's terms.
+
+    Args:
+        level_path (str): Sorted file of the level.
+        next_path (str): Sorted file of the next level.
+        num_vars (int): Number of variables.
+        width (int): Bytes per record field.
+        max_items (int): Records held in memory at once while sorting.
+        spill_dir (str or None): Directory of the temporary files.
+
+    Yields:
+        Implicant: Each prime implicant of the level, in (care, value) order.
+    """
+    full_care = (1 << num_vars) - 1
+
+    def halves():
+        for record in read_records(next_path, 2 * width):
+            value, care = record_term(record, width)
+            dashes = full_care & ~care
+            while dashes:
+                bit = dashes & -dashes
+                dashes ^= bit
+                yield term_record(value, care | bit, width)
+                yield term_record(value | bit, care | bit, width)
+
+    absorbed = external_sort(halves(), 2 * width, max_items, spill_dir)
+    current = next(absorbed, None)
+    for record in read_records(level_path, 2 * width):
+        while current is not None and current < record:
+            current = next(absorbed, None)
+        if current != record:
+            yield record_term(record, width)
+    absorbed.close()
+
+# Function to stream prime implicants with bounded memory
+def iter_prime_implicants(minterms, num_vars, memory_budget=DEFAULT_MEMORY_BUDGET, spill_dir=None):
+    """
+    Yields the prime implicants level by level, keeping memory under memory_budget: a level is freed as
+    soon as the next one is built, primes are yielded rather than kept, and a level too large to merge in
+    memory is spilled to a sorted temporary file and merged with external sorts (see spill_next_level
+    and spill_primes) until the levels shrink back under the budget.
+
+    Args:
+        minterms (iterable of int): Minterms and don't cares to minimize.
+        num_vars (int): The number of variables in the Boolean function.
+        memory_budget (int or None): Estimated bytes the working tables may hold, None to never spill.
+        spill_dir (str or None): Directory for the temporary files, None for the system default.
+
+    Yields:
+        Implicant: Each prime implicant, in no particular order.
+    """
+    max_terms = None if memory_budget is None else memory_budget // BYTES_PER_TERM
+    sort_items = None if max_terms is None else max(max_terms // 2, SPILL_MIN_SORT_ITEMS)
+    # a spilled level comes back into memory only when it leaves room for the level it merges into
+    reload_terms = None if max_terms is None else max_terms // 4
+    width = (num_vars + 7) // 8 or 1
+    groups = {(1 << num_vars) - 1: set(minterms)}
+    level_path = next_path = None
+    try:
+        while groups or level_path:
+            if groups:
+                level_terms = sum(len(values) for values in groups.values())
+                next_groups = {}
+                merged_values = {care: set() for care in groups}
+                live_terms = level_terms
+                for care, values in groups.items():
+                    if max_terms is not None and live_terms > max_terms:
+                        break
+                    combined, merged = combine_terms(care, values)
+                    for term in combined:
+                        next_groups.setdefault(term.care, set()).add(term.value)
+                    merged_values[care] = merged
+                    live_terms += len(combined)
+                else:
+                    if max_terms is None or live_terms <= max_terms:
+                        for care, values in groups.items():
+                            for value in values - merged_values[care]:
+                                yield Implicant(value, care)
+                        groups = next_groups
+                        continue
+
+                # too large for memory: drop the partial next level and spill this one
+                next_groups = merged_values = None
+                records = (term_record(value, care, width) for care, values in groups.items() for value in values)
+                level_path, _ = write_records(external_sort(records, 2 * width, sort_items, spill_dir), spill_dir)
+                groups = None
+
+            next_path, next_terms = spill_next_level(level_path, num_vars, width, sort_items, spill_dir)
+            yield from spill_primes(level_path, next_path, num_vars, width, sort_items, spill_dir)
+            os.remove(level_path)
+            level_path, next_path = next_path, None
+            if not next_terms:
+                os.remove(level_path)
+                level_path = None
+            elif next_terms <= reload_terms:
+                groups = {}
+                for record in read_records(level_path, 2 * width):
+                    term = record_term(record, width)
+                    groups.setdefault(term.care, set()).add(term.value)
+                os.remove(level_path)
+                level_path = None
+    finally:
+        # the caller may stop early, in the middle of a spilled level
+        for path in (level_path, next_path):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+# Function to build an int bitset from bit positions
+def to_bitset(indices, size):
+    """
+    Builds an arbitrary-precision int with the given bits set, in one pass over a byte buffer.
+
+    Args:
+        indices (iterable of int): Positions of the bits to set.
+        size (int): Number of bits in the bitset.
+
+    Returns:
+        int: The bitset.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for idx in indices:
+        buffer[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(buffer, 'little')
+
+# Function to list the set bits of an int bitset
+def bit_indices(bitset):
+    """
+    Lists the positions of the set bits of an int bitset, lowest first.
+
+    Args:
+        bitset (int): A non-negative int bitset.
+
+    Returns:
+        list of int: Positions of the set bits.
+    """
+    return [idx for idx, bit in enumerate(bin(bitset)[:1:-1]) if bit == '1']
+
+# Function to decide whether a chart is built with numpy
+def use_numpy_chart(num_minterms, num_prime_implicants, num_vars, use_numpy=None):
+    """
+    Decides whether the numpy backend should be used for a chart.
+
+    Args:
+        num_minterms (int): Number of minterm columns.
+        num_prime_implicants (int): Number of prime implicant rows.
+        num_vars (int): Number of variables.
+        use_numpy (bool or None): Force the backend on or off, or None to use numpy for large charts when installed.
+
+    Returns:
+        bool: True to build the chart with numpy.
+
+    Raises:
+        ImportError: If use_numpy is True but numpy is not installed.
+    """
+    if use_numpy and numpy is None:
+        raise ImportError("numpy is required for use_numpy=True.")
+    if num_vars > 62:  # minterms must fit in int64
+        return False
+    if use_numpy is None:
+        return numpy is not None and num_minterms * num_prime_implicants >= NUMPY_MIN_CELLS
+    return use_numpy
+
+# Function to estimate the size of a prime implicant chart
+def chart_size(num_minterms, num_prime_implicants, use_numpy=False):
+    """
+    Estimates the bytes a chart takes: a bit per cell in its rows and again in its columns, an int object
+    per row and column, and with numpy the packed matrix as well.
+
+    Args:
+        num_minterms (int): Number of minterm columns.
+        num_prime_implicants (int): Number of prime implicant rows.
+        use_numpy (bool): Whether the chart is built with numpy.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    cell_bytes = (num_minterms + 7) // 8 * num_prime_implicants
+    size = 2 * cell_bytes + (num_minterms + num_prime_implicants) * BYTES_PER_CHART_LINE
+    return size + cell_bytes if use_numpy else size
+
+# Function to build a prime implicant chart
+def build_chart(minterms, prime_implicants, num_vars, use_numpy=None, memory_budget=None):
+    """
+    Constructs a prime implicant chart as int bitsets: one row per prime implicant with a bit per
+    minterm it covers, and one column per minterm with a bit per prime implicant covering it.
+
+    Each prime implicant either enumerates the points it covers and looks them up in the minterm
+    index, or tests every minterm, whichever is fewer operations. Large charts are built with numpy
+    instead when it is installed (see build_chart_numpy).
+
+    Args:
+        minterms (list of int): The list of minterms to cover; their order fixes the column positions.
+        prime_implicants (list of Implicant): List of prime implicants; their order fixes the row positions.
+        num_vars (int): Number of variables.
+        use_numpy (bool or None): Force the numpy backend on or off, or None to pick it automatically.
+        memory_budget (int or None): Maximum estimated size of the chart and the prime implicants it is
+            built from in bytes, None for no limit.
+
+    Returns:
+        Chart: The chart, with rows and columns as lists of int bitsets.
+
+    Raises:
+        MemoryBudgetExceeded: If the chart would exceed memory_budget.
+    """
+    numpy_chart = use_numpy_chart(len(minterms), len(prime_implicants), num_vars, use_numpy)
+    if memory_budget is not None:
+        size = chart_size(len(minterms), len(prime_implicants), numpy_chart)
+        if size + len(prime_implicants) * BYTES_PER_TERM > memory_budget:
+            raise MemoryBudgetExceeded(
+                f"Chart of {len(prime_implicants)} prime implicants by {len(minterms)} minterms needs more "
+                f"than {memory_budget} bytes; raise the memory budget or reduce the function."
+            )
+    if numpy_chart:
+        return build_chart_numpy(minterms, prime_implicants)
+
+    full_care = (1 << num_vars) - 1
+    column_of = {minterm: col for col, minterm in enumerate(minterms)}
+    row_indices = []
+    column_indices = [[] for _ in minterms]
+    for row, pi in enumerate(prime_implicants):
+        free = full_care & ~pi.care
+        if 1 << free.bit_count() <= len(minterms):
+            covered = []
+            sub = free
+            while True:
+                col = column_of.get(pi.value | sub)
+                if col is not None:
+                    covered.append(col)
+                if not sub:
+                    break
+                sub = (sub - 1) & free
+        else:
+            covered = [col for col, minterm in enumerate(minterms) if minterm & pi.care == pi.value]
+        row_indices.append(covered)
+        for col in covered:
+            column_indices[col].append(row)
+
+    rows = [to_bitset(covered, len(minterms)) for covered in row_indices]
+    columns = [to_bitset(covering, len(prime_implicants)) for covering in column_indices]
+    return Chart(list(minterms), list(prime_implicants), rows, columns)
+
+# Function to build a prime implicant chart with numpy
+def build_chart_numpy(minterms, prime_implicants):
+    """
+    Constructs the same chart as build_chart, computing coverage for all prime implicants at once with
+    a broadcast `(minterms & care) == value`. The boolean matrix is built in blocks of minterm columns
+    and packed to bits straight away, so only one block is ever held unpacked.
+
+    Args:
+        minterms (list of int): The list of minterms to cover; their order fixes the column positions.
+        prime_implicants (list of Implicant): List of prime implicants; their order fixes the row positions.
+
+    Returns:
+        Chart: The chart, also holding the packed coverage matrix in `matrix`.
+    """
+    points = numpy.fromiter(minterms, dtype=numpy.int64, count=len(minterms))
+    values = numpy.fromiter((pi.value for pi in prime_implicants), dtype=numpy.int64, count=len(prime_implicants))
+    cares = numpy.fromiter((pi.care for pi in prime_implicants), dtype=numpy.int64, count=len(prime_implicants))
+
+    # blocks are a multiple of 8 columns wide so the packed row blocks line up when concatenated
+    step = max(NUMPY_BLOCK_CELLS // max(len(prime_implicants), 1) // 8 * 8, 8)
+    row_blocks = []
+    columns = []
+    for start in range(0, len(minterms), step):
+        block = (points[None, start:start + step] & cares[:, None]) == values[:, None]
+        row_blocks.append(numpy.packbits(block, axis=1, bitorder='little'))
+        packed_columns = numpy.ascontiguousarray(numpy.packbits(block, axis=0, bitorder='little').T)
+        columns.extend(int.from_bytes(column.tobytes(), 'little') for column in packed_columns)
+
+    matrix = numpy.concatenate(row_blocks, axis=1)
+    rows = [int.from_bytes(row.tobytes(), 'little') for row in matrix]
+    return Chart(list(minterms), list(prime_implicants), rows, columns, matrix)
+
+# Function to extract essential prime implicants
+def extract_essential_prime_implicants(chart):
+    """
+    Identifies and extracts essential prime implicants from the chart: those that are the only
+    cover of some minterm, i.e. the single bit of a column with a popcount of one.
+
+    Args:
+        chart (Chart): A prime implicant chart.
+
+    Returns:
+        tuple: A list of essential prime implicants and the bitset of minterm columns they cover.
+    """
+    essential_rows = 0
+    for column in chart.columns:
+        if column and not column & (column - 1):
+            essential_rows |= column
+
+    essential_pis = []
+    covered = 0
+    for row in bit_indices(essential_rows):
+        essential_pis.append(chart.prime_implicants[row])
+        covered |= chart.rows[row]
+    return essential_pis, covered
+
+# Function for iterative reduction of remaining implicants
+def iterative_reduction(chart, essential_pis, checkpoint=None):
+    """
+    Performs iterative reduction to select additional prime implicants and ensure all minterms are covered.
+
+    Args:
+        chart (Chart): A prime implicant chart.
+        essential_pis (list of Implicant): List of already identified essential prime implicants.
+        checkpoint (Checkpoint or None): Saves the partial cover whenever it is due, and resumes from the
+            partial cover of its loaded state. The greedy picks depend only on what is left uncovered, so
+            a resumed cover is the one an uninterrupted run would have picked.
+
+    Returns:
+        list of Implicant: The final list of prime implicants covering all minterms.
+    """
+    row_of = {pi: row for row, pi in enumerate(chart.prime_implicants)}
+    selected = list(essential_pis)
+    if checkpoint is not None and checkpoint.state is not None and checkpoint.state.cover:
+        # a saved partial cover starts with the essentials
+        selected = list(checkpoint.state.cover)
+    uncovered = (1 << len(chart.minterms)) - 1
+    for pi in selected:
+        uncovered &= ~chart.rows[row_of[pi]]
+
+    on_pick = None
+    if checkpoint is not None:
+        def on_pick(picks):
+            if checkpoint.due():
+                checkpoint.save('cover', prime_implicants=chart.prime_implicants,
+                                cover=selected + [chart.prime_implicants[row] for row in picks])
+    return selected + [chart.prime_implicants[row] for row in greedy_cover(chart, uncovered, on_pick)]
+
+# Function to greedily cover a set of minterm columns
+def greedy_cover(chart, uncovered, on_pick=None):
+    """
+    Greedily picks the prime implicant covering the most uncovered minterms, the one with fewer literals
+    on a tie, until all are covered. After each pick only the scores of rows sharing a newly covered
+    column are updated.
+
+    Args:
+        chart (Chart): A prime implicant chart.
+        uncovered (int): Bitset of the minterm columns to cover.
+        on_pick (callable or None): Called with the rows picked so far after each pick.
+
+    Returns:
+        list of int: The rows picked, in order.
+    """
+    if chart.matrix is not None:
+        return greedy_cover_numpy(chart, uncovered, on_pick)
+
+    scores = [(row & uncovered).bit_count() for row in chart.rows]
+    literals = [pi.care.bit_count() for pi in chart.prime_implicants]
+    picks = []
+    while uncovered:
+        best = max(range(len(scores)), key=lambda row: (scores[row], -literals[row]))
+        newly_covered = chart.rows[best] & uncovered
+        uncovered &= ~newly_covered
+        picks.append(best)
+        for col in bit_indices(newly_covered):
+            for row in bit_indices(chart.columns[col]):
+                scores[row] -= 1
+        if on_pick is not None:
+            on_pick(picks)
+
+    return picks
+
+# Function to greedily cover a set of minterm columns on a numpy chart
+def greedy_cover_numpy(chart, uncovered, on_pick=None):
+    """
+    The greedy loop of greedy_cover on a chart built with numpy. Scores start as a vectorized popcount
+    of every packed row against the uncovered columns, and after each pick the newly covered columns
+    are summed out of all rows at once.
+
+    Args:
+        chart (Chart): A prime implicant chart with a packed `matrix`.
+        uncovered (int): Bitset of the minterm columns to cover.
+        on_pick (callable or None): Called with the rows picked so far after each pick.
+
+    Returns:
+        list of int: The rows picked, in order.
+    """
+    matrix = chart.matrix
+    popcounts = numpy.array([bin(byte).count('1') for byte in range(256)], dtype=numpy.int64)
+    uncovered_bytes = numpy.frombuffer(uncovered.to_bytes(matrix.shape[1], 'little'), dtype=numpy.uint8)
+    scores = popcounts[matrix & uncovered_bytes].sum(axis=1)
+    # literal counts are at most 62, so this orders by score first and fewer literals second
+    literals = numpy.fromiter((pi.care.bit_count() for pi in chart.prime_implicants), dtype=numpy.int64)
+    picks = []
+    while uncovered:
+        best = int((scores * 64 - literals).argmax())
+        newly_covered = chart.rows[best] & uncovered
+        uncovered &= ~newly_covered
+        picks.append(best)
+        cols = numpy.array(bit_indices(newly_covered), dtype=numpy.int64)
+        scores -= ((matrix[:, cols >> 3] >> (cols & 7).astype(numpy.uint8)) & 1).sum(axis=1, dtype=numpy.int64)
+        if on_pick is not None:
+            on_pick(picks)
+
+    return picks
+
+# Function to reduce a covering problem
+def reduce_cover(chart, costs, uncovered, active, deadline=None):
+    """
+    Simplifies a covering problem until nothing changes: rows that are the only remaining cover of a
+    column are selected, rows covering a subset of another row's columns at no lower cost are dropped, and
+    columns whose covering rows are a superset of another column's are dropped (covering the other one
+    covers them). Every minimum cost cover of what is left, plus the selected rows, is one of the original.
+
+    Args:
+        chart (Chart): A prime implicant chart.
+        costs (list of int): Cost of each row of the chart.
+        uncovered (int): Bitset of the columns to cover.
+        active (int): Bitset of the rows that may be used.
+        deadline (float or None): time.monotonic() value to stop at, None for no limit.
+
+    Returns:
+        tuple: The selected rows, the columns and rows left, and True if the deadline passed first.
+    """
+    rows = chart.rows
+    columns = chart.columns
+    selected = []
+    changed = True
+    while changed and uncovered:
+        changed = False
+        for col in bit_indices(uncovered):
+            covering = columns[col] & active
+            # a column with no covering row is left for the caller to find
+            if uncovered >> col & 1 and covering and not covering & (covering - 1):
+                row = covering.bit_length() - 1
+                selected.append(row)
+                uncovered &= ~rows[row]
+                active &= ~covering
+                changed = True
+        for row in bit_indices(active):
+            if not rows[row] & uncovered:
+                active &= ~(1 << row)
+
+        kept = []
+        for row in sorted(bit_indices(active), key=lambda row: (-(rows[row] & uncovered).bit_count(), costs[row])):
+            covered = rows[row] & uncovered
+            if any(not covered & ~rows[other] and costs[other] <= costs[row] for other in kept):
+                active &= ~(1 << row)
+                changed = True
+            else:
+                kept.append(row)
+            if deadline is not None and time.monotonic() > deadline:
+                return selected, uncovered, active, True
+
+        kept = []
+        for col in sorted(bit_indices(uncovered), key=lambda col: (columns[col] & active).bit_count()):
+            covering = columns[col] & active
+            if any(not other & ~covering for other in kept):
+                uncovered &= ~(1 << col)
+                changed = True
+            else:
+                kept.append(covering)
+            if deadline is not None and time.monotonic() > deadline:
+                return selected, uncovered, active, True
+    return selected, uncovered, active, False
+
+# Function to find a minimum cost cover of the remaining minterms
+def exact_cover(chart, essential_pis, time_budget=DEFAULT_COVER_TIME_BUDGET, node_budget=None, costs=None,
+                stats=None):
+    """
+    Selects prime implicants covering all minterms at minimum total cost, implicant_cost unless given.
+
+    The chart is first reduced (see reduce_cover). What is left is searched depth first, branching on the
+    minterm with the fewest covering rows, reducing again at every node with at most
+    NODE_REDUCTION_MAX_ROWS rows left, and pruned with a lower bound from minterms that share no covering
+    row, picked fewest covering rows first. The greedy cover is the
+    starting solution, so when the time or node budget runs out the best cover found so far is returned.
+    The time budget runs from the call, so it covers the reduction and the greedy cover as well.
+
+    Args:
+        chart (Chart): A prime implicant chart.
+        essential_pis (list of Implicant): List of already identified essential prime implicants.
+        time_budget (float or None): Seconds allowed for reduction, the greedy cover and search, None for no
+            limit.
+        node_budget (int or None): Search nodes allowed, None for no limit.
+        costs (list of int or None): Cost of each row of the chart, None for the implicant_cost of each.
+        stats (MinimizationStats or None): Records the size of the reduced chart and of the search when given.
+
+    Returns:
+        tuple: The list of prime implicants covering all minterms, and True if the cover is proven minimal.
+    """
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    rows = chart.rows
+    columns = chart.columns
+    if costs is None:
+        costs = [implicant_cost(pi) for pi in chart.prime_implicants]
+    row_of = {pi: row for row, pi in enumerate(chart.prime_implicants)}
+
+    selected = [row_of[pi] for pi in essential_pis]
+    uncovered = (1 << len(chart.minterms)) - 1
+    for row in selected:
+        uncovered &= ~rows[row]
+    active = to_bitset((row for row in range(len(rows)) if rows[row] & uncovered), len(rows))
+    # columns dropped by column dominance leave `uncovered` but stay in `remaining` until actually covered
+    remaining = uncovered
+    forced, uncovered, active, expired = reduce_cover(chart, costs, uncovered, active, deadline)
+    selected += forced
+    for row in forced:
+        remaining &= ~rows[row]
+
+    if stats is not None:
+        stats.count(reduced_rows=active.bit_count(), reduced_columns=uncovered.bit_count())
+
+    # the greedy cover may use dropped rows, so it has to cover every remaining column itself
+    best_picks = greedy_cover(chart, remaining)
+    best_cost = sum(costs[row] for row in best_picks)
+    optimal = not expired and (deadline is None or time.monotonic() <= deadline)
+
+    # each stack entry is (uncovered, active rows, picks as nested (row, parent) pairs, cost of picks)
+    stack = [(uncovered, active, None, 0)]
+    nodes = 0
+    while stack and optimal:
+        uncovered, active, picks, cost = stack.pop()
+        nodes += 1
+        if (node_budget is not None and nodes > node_budget) or (
+                deadline is not None and not nodes & 255 and time.monotonic() > deadline):
+            optimal = False
+            break
+        forced = ()
+        if active.bit_count() <= NODE_REDUCTION_MAX_ROWS:
+            forced, uncovered, active, expired = reduce_cover(chart, costs, uncovered, active, deadline)
+            if expired:
+                optimal = False
+                break
+        for row in forced:
+            picks = (row, picks)
+            cost += costs[row]
+        if not uncovered:
+            if cost < best_cost:
+                best_cost = cost
+                best_picks = []
+                while picks:
+                    row, picks = picks
+                    best_picks.append(row)
+            continue
+
+        coverings = sorted((columns[col] & active for col in bit_indices(uncovered)), key=int.bit_count)
+        branch_rows = coverings[0]
+        if not branch_rows:
+            continue
+        bound = cost
+        used = 0
+        for covering in coverings:
+            if not covering & used:
+                used |= covering
+                bound += min(costs[row] for row in bit_indices(covering))
+        if bound >= best_cost:
+            continue
+
+        candidates = sorted(bit_indices(branch_rows),
+                            key=lambda row: costs[row] / (rows[row] & uncovered).bit_count())
+        excluded = 0
+        children = []
+        for row in candidates:
+            excluded |= 1 << row
+            children.append((uncovered & ~rows[row], active & ~excluded, (row, picks), cost + costs[row]))
+        stack.extend(reversed(children))
+
+    if stats is not None:
+        stats.count(search_nodes=nodes, optimal=optimal)
+    final_pis = [chart.prime_implicants[row] for row in selected + best_picks]
+    return final_pis, optimal
+
+# Function to minimize the Boolean function
+def minimize_function(minterms, dont_cares, num_vars=None, memory_budget=DEFAULT_MEMORY_BUDGET, use_numpy=None,
+                      cover='exact', time_budget=DEFAULT_COVER_TIME_BUDGET, node_budget=None, method='qm',
+                      merge_workers=None, stats=None, spill=False, checkpoint=None):
+    """
+    Minimizes a Boolean function using the Quine-McCluskey method, or the Espresso-style heuristic for
+    functions too wide to enumerate every prime implicant of.
+
+    Args:
+        minterms (iterable of int): The minterms, in any order; read once.
+        dont_cares (iterable of int): The don't-care conditions, in any order; read once.
+        num_vars (int or None): Number of variables, or None to infer it from the largest term.
+        memory_budget (int or None): Maximum estimated size of the implicant tables, and of the prime implicant
+            chart, in bytes, None for no limit.
+        use_numpy (bool or None): Force the numpy chart backend on or off, or None to use it for large charts when installed.
+        cover (str): 'exact' for a minimum cost cover found within the budgets (see exact_cover),
+            'greedy' for the fast greedy cover (see iterative_reduction).
+        time_budget (float or None): Seconds allowed for the exact cover, None for no limit.
+        node_budget (int or None): Search nodes allowed for the exact cover, None for no limit.
+        method (str): 'qm' for Quine-McCluskey, 'espresso' for the heuristic (see espresso.py), which
+            ignores the memory, chart and cover options.
+        merge_workers (int or None): Worker processes for prime implicant generation on large functions (see
+            find_prime_implicants), None or 1 for none.
+        stats (MinimizationStats or None): Records per-phase times and counters when given; None costs nothing.
+        spill (bool or str): Stream prime implicants through iter_prime_implicants, spilling levels larger
+            than memory_budget to temporary files (in this directory if a path is given) instead of raising
+            MemoryBudgetExceeded. Only prime implicant generation spills: the chart is built in memory and
+            still raises MemoryBudgetExceeded when it exceeds the budget. merge_workers and the per-level
+            stats do not apply then.
+        checkpoint (Checkpoint or None): Saves the solver state to its file as it goes and resumes from
+            the last save of the same function (see checkpoint.py); the file is removed on completion.
+            Levels are not saved while spilling, only the finished prime implicants.
+
+    Returns:
+        list of Implicant: The minimized prime implicants.
+
+    Raises:
+        ValueError: If a term does not fit in num_vars variables, or cover or method is unknown.
+        MemoryBudgetExceeded: If the implicant tables or the chart would exceed memory_budget.
+    """
+    if cover not in ('exact', 'greedy'):
+        raise ValueError(f"Unknown cover {cover!r}, expected 'exact' or 'greedy'.")
+    if method not in ('qm', 'espresso'):
+        raise ValueError(f"Unknown method {method!r}, expected 'qm' or 'espresso'.")
+    minterms = sorted(set(minterms))
+    dont_cares = set(dont_cares)
+    num_vars = resolve_num_vars(minterms, dont_cares, num_vars)
+    all_terms = dont_cares.union(minterms)
+    if not minterms:
+        return []
+    if method == 'espresso':
+        with timed(stats, 'espresso'):
+            return [Implicant(value, care) for value, care in espresso(minterms, dont_cares, num_vars)]
+    state = None
+    if checkpoint is not None:
+        state = checkpoint.start(minterms, dont_cares, num_vars)
+        if stats is not None and state is not None:
+            stats.count(resumed=state.phase, resumed_level=state.level)
+    with timed(stats, 'find_prime_implicants'):
+        if state is not None and state.phase == 'cover':
+            prime_implicants = state.prime_implicants
+        else:
+            if spill:
+                spill_dir = None if spill is True else spill
+                prime_implicants = sorted(iter_prime_implicants(all_terms, num_vars, memory_budget, spill_dir))
+            else:
+                prime_implicants = find_prime_implicants(all_terms, num_vars, memory_budget, merge_workers, stats,
+                                                         checkpoint)
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save('cover', prime_implicants=prime_implicants)
+        if stats is not None:
+            stats.count(prime_implicants=len(prime_implicants))
+    with timed(stats, 'build_chart'):
+        chart = build_chart(minterms, prime_implicants, num_vars, use_numpy, memory_budget)
+        if stats is not None:
+            cells = len(chart.rows) * len(chart.columns)
+            stats.count(chart_rows=len(chart.rows), chart_columns=len(chart.columns),
+                        chart_density=sum(row.bit_count() for row in chart.rows) / cells if cells else 0.0)
+
+    with timed(stats, 'extract_essential_prime_implicants'):
+        essential_pis, _ = extract_essential_prime_implicants(chart)
+        if stats is not None:
+            stats.count(essential_prime_implicants=len(essential_pis))
+    if cover == 'exact':
+        with timed(stats, 'exact_cover'):
+            final_pis, _ = exact_cover(chart, essential_pis, time_budget, node_budget, stats=stats)
+            if stats is not None:
+                stats.count(terms=len(final_pis))
+    else:
+        with timed(stats, 'iterative_reduction'):
+            final_pis = iterative_reduction(chart, essential_pis, checkpoint)
+            if stats is not None:
+                stats.count(greedy_iterations=len(final_pis) - len(essential_pis), terms=len(final_pis))
+
+    if checkpoint is not None:
+        if stats is not None:
+            stats.count(checkpoints=checkpoint.saves)
+        checkpoint.clear()
+    return final_pis
+
+# Function to generate SOP expression from prime implicants
+def sop_expression(prime_implicants, num_vars, variables=None):
+    """
+    Converts prime implicants to a Sum of Products (SOP) expression.
+
+    Args:
+        prime_implicants (list of Implicant): The prime implicants.
+        num_vars (int): Number of variables.
+        variables (list of str or None): Variable names, most significant first; generated when None.
+
+    Returns:
+        str: The SOP expression, '0' for an empty cover and '1' for a tautology.
+    """
+    if variables is None:
+        variables = variable_names(num_vars)
+    if not prime_implicants:
+        return '0'
+    terms = []
+
+    for pi in sorted(prime_implicants):
+        term = ''
+        for idx, bit in enumerate(to_binary(pi, num_vars)):
+            if bit == '0':
+                term += f"{variables[idx]}'"
+            elif bit == '1':
+                term += f"{variables[idx]}"
+        terms.append(term or '1')
+
+    return ' + '.join(sorted(terms))
+
+
+# Example input and execution
+if __name__ == "__main__":
+    # manually input the minterms and dont care values to run script directly... if not use the cli script which allows users input values via command line
+    minterms = [1,2,5,7]  # Minterms
+    dont_cares = []  # Don't care conditions
+    num_vars = 3  # Number of variables
+
+    # Minimize function and generate SOP expression
+    final_prime_implicants = minimize_function(minterms, dont_cares, num_vars)
+    final_expression = sop_expression(final_prime_implicants, num_vars)
+
+    print("Minimized Boolean Function:", final_expression)
@@ -0,0 +1,408 @@
+"""
+Local HTTP/JSON minimization service, for tools that want answers without spawning the CLI per function.
+
+    python service.py [--port 8765] [--workers N]
+
+It listens on 127.0.0.1 only and speaks just enough HTTP/1.1 for JSON clients, with keep-alive:
+
+    POST /minimize   a record as in batch JSON Lines input, e.g. {"minterms": [1, 2, 5], "num_vars": 3},
+                     answered with the batch result ({"id", "expression", "terms"} or {"id", "error"})
+    GET  /health     {"status": "ok"} while the service accepts work
+    GET  /metrics    request, batching and queue counters
+
+Connections are handled by asyncio; the solving runs on a process pool. Requests that arrive within
+batch_delay of each other are sent to a worker together, up to batch_size at a time, and a request equal
+to one already in flight waits for that one's answer instead of being solved again. At most queue_size
+requests wait for a worker; beyond that the service answers 503 so clients back off.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from batch import parse_jsonl, solve_chunk
+
+# The service is for this machine only
+HOST = '127.0.0.1'
+
+DEFAULT_PORT = 8765
+
+# Most requests sent to a worker at once
+DEFAULT_BATCH_SIZE = 32
+
+# Seconds the batcher waits for more requests before sending a partial batch
+DEFAULT_BATCH_DELAY = 0.005
+
+# Most requests waiting for a worker before new ones are refused
+DEFAULT_QUEUE_SIZE = 1024
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 16 << 20
+
+# Largest request line plus headers accepted, in bytes
+MAX_HEADER_BYTES = 64 << 10
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           422: 'Unprocessable Entity', 503: 'Service Unavailable'}
+
+
+class RequestError(Exception):
+    """
+    Raised for a request the service cannot read; carries the HTTP status to answer with.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MinimizationService:
+    """
+    The request queue, batcher and process pool behind the HTTP front end. Call start() inside the
+    event loop before submitting, and close() when done.
+    """
+
+    def __init__(self, workers=None, batch_size=DEFAULT_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY,
+                 queue_size=DEFAULT_QUEUE_SIZE, timeout=None, **options):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.timeout = timeout
+        self.options = options
+        self.queue = asyncio.Queue(queue_size)
+        # requests being solved or queued, by coalescing key, each with the future of its result
+        self.in_flight = {}
+        # two batches per worker keeps every worker busy without moving the queue into the pool
+        self.batch_slots = asyncio.Semaphore(2 * self.workers)
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.batcher = None
+        self.started = time.monotonic()
+        self.counters = {'requests': 0, 'solved': 0, 'failed': 0, 'coalesced': 0, 'rejected': 0, 'batches': 0,
+                         'batched_requests': 0, 'pool_restarts': 0}
+        self.total_latency = 0.0
+
+    def start(self):
+        """
+        Starts the batcher task.
+        """
+        self.batcher = asyncio.create_task(self.run_batches())
+
+    async def close(self):
+        """
+        Stops the batcher and shuts the process pool down.
+        """
+        if self.batcher is not None:
+            self.batcher.cancel()
+            try:
+                await self.batcher
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(cancel_futures=True)
+
+    async def submit(self, record):
+        """
+        Queues a record and waits for its result, sharing the result of an equal record already in flight.
+
+        Args:
+            record (dict): A record as yielded by parse_jsonl.
+
+        Returns:
+            dict: The result, with the record's own id.
+
+        Raises:
+            asyncio.QueueFull: If queue_size requests are already waiting.
+        """
+        self.counters['requests'] += 1
+        start = time.monotonic()
+        # two requests coalesce when they only differ by id; repr keeps the bytes of truth-table records
+        key = repr(sorted((name, value) for name, value in record.items() if name != 'id'))
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            try:
+                self.queue.put_nowait((key, record, future))
+            except asyncio.QueueFull:
+                self.counters['rejected'] += 1
+                raise
+            self.in_flight[key] = future
+        result = await asyncio.shield(future)
+        self.counters['failed' if 'error' in result else 'solved'] += 1
+        self.total_latency += time.monotonic() - start
+        return {**result, 'id': record['id']}
+
+    async def run_batches(self):
+        """
+        Takes requests off the queue in batches of up to batch_size, waiting at most batch_delay after the
+        first for the rest, and starts a solve for each batch while a batch slot is free.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.batch_slots.acquire()
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), max(deadline - loop.time(), 0)))
+                except asyncio.TimeoutError:
+                    break
+            self.counters['batches'] += 1
+            self.counters['batched_requests'] += len(batch)
+            asyncio.create_task(self.solve_batch(batch))
+
+    async def solve_batch(self, batch):
+        """
+        Solves one batch on the pool and resolves each request's future.
+
+        Args:
+            batch (list of tuple): (key, record, future) of each request.
+        """
+        records = [record for _, record, _ in batch]
+        executor = self.executor
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                results = await loop.run_in_executor(executor, solve_chunk, records, self.timeout, self.options)
+            except BrokenProcessPool:
+                # every batch on a broken pool fails; the first to notice starts a fresh pool for later ones
+                if executor is self.executor:
+                    executor.shutdown(cancel_futures=True)
+                    self.executor = ProcessPoolExecutor(self.workers)
+                    self.counters['pool_restarts'] += 1
+                results = [{'id': record['id'], 'error': "Worker process crashed."} for record in records]
+            except Exception:
+                # one bad record fails the whole chunk, so solve them one at a time to fail only that one
+                results = []
+                for record in records:
+                    try:
+                        results += await loop.run_in_executor(
+                            executor, solve_chunk, [record], self.timeout, self.options)
+                    except Exception as error:
+                        results.append({'id': record['id'], 'error': f"Solver failed: {error!r}"})
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+        finally:
+            self.batch_slots.release()
+            # however the batch ended, its requests are no longer in flight; a cancelled batch fails them
+            for key, _, future in batch:
+                self.in_flight.pop(key, None)
+                if not future.done():
+                    future.set_result({'id': None, 'error': "Request was not solved."})
+
+    def metrics(self):
+        """
+        Returns the service counters, ready for json.dumps.
+
+        Returns:
+            dict: Request, batching and queue counters.
+        """
+        answered = self.counters['solved'] + self.counters['failed']
+        batches = self.counters['batches']
+        return {
+            **self.counters,
+            'queued': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'in_flight': len(self.in_flight),
+            'workers': self.workers,
+            'mean_batch_size': self.counters['batched_requests'] / batches if batches else 0.0,
+            'mean_latency_seconds': self.total_latency / answered if answered else 0.0,
+            'uptime_seconds': time.monotonic() - self.started,
+        }
+
+# Function to read one HTTP request
+async def read_request(reader):
+    """
+    Reads one HTTP/1.1 request.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+
+    Returns:
+        tuple or None: (method, path, headers, body), or None when the client closed the connection.
+
+    Raises:
+        RequestError: If the request is malformed or too large.
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as error:
+        if error.partial.strip():
+            raise RequestError(400, "Incomplete request.") from error
+        return None
+    except asyncio.LimitOverrunError as error:
+        raise RequestError(413, "Request headers too large.") from error
+    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+    try:
+        method, path, _ = request_line.split(' ')
+    except ValueError as error:
+        raise RequestError(400, f"Malformed request line {request_line!r}.") from error
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError as error:
+        raise RequestError(400, "Malformed Content-Length.") from error
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, f"Request body over {MAX_BODY_BYTES} bytes.")
+    body = await reader.readexactly(length) if length else b''
+    return method, path.split('?', 1)[0], headers, body
+
+# Function to write one HTTP response
+async def write_response(writer, status, payload, keep_alive=True, headers=None):
+    """
+    Writes a JSON response.
+
+    Args:
+        writer (asyncio.StreamWriter): The connection.
+        status (int): The HTTP status.
+        payload (dict): The response body.
+        keep_alive (bool): Keep the connection open for another request.
+        headers (dict or None): Extra headers.
+    """
+    body = json.dumps(payload).encode() + b'\n'
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}", "Content-Type: application/json",
+             f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+
+# Function to answer one request
+async def respond(service, method, path, body, number):
+    """
+    Routes a request to its endpoint.
+
+    Args:
+        service (MinimizationService): The service.
+        method (str): The HTTP method.
+        path (str): The request path.
+        body (bytes): The request body.
+        number (int): Sequence number of the request; records without an id get 'request:<number>'.
+
+    Returns:
+        tuple: The HTTP status, the payload and any extra headers.
+    """
+    routes = {'/health': 'GET', '/metrics': 'GET', '/minimize': 'POST'}
+    if path not in routes:
+        return 404, {'error': f"No endpoint {path}."}, None
+    if method != routes[path]:
+        return 405, {'error': f"{path} takes {routes[path]}."}, {'Allow': routes[path]}
+    if path == '/health':
+        return 200, {'status': 'ok'}, None
+    if path == '/metrics':
+        return 200, service.metrics(), None
+
+    try:
+        text = body.decode()
+    except UnicodeDecodeError:
+        return 400, {'id': f"request:{number}", 'error': "Request body is not UTF-8."}, None
+    # parse_jsonl reads one record per line, and a newline can only be whitespace in valid JSON
+    records = list(parse_jsonl([('request', number, text.replace('\n', ' '))]))
+    if not records:
+        return 400, {'id': f"request:{number}", 'error': "Empty request body."}, None
+    record = records[0]
+    if 'error' in record:
+        return 400, record, None
+    try:
+        result = await service.submit(record)
+    except asyncio.QueueFull:
+        return 503, {'id': record['id'], 'error': "Too many requests queued; retry later."}, {'Retry-After': '1'}
+    return (422 if 'error' in result else 200), result, None
+
+# Function to serve one connection
+async def handle_connection(service, reader, writer, counter):
+    """
+    Answers requests on one connection until the client closes it or asks to.
+
+    Args:
+        service (MinimizationService): The service.
+        reader (asyncio.StreamReader): The connection's reader.
+        writer (asyncio.StreamWriter): The connection's writer.
+        counter (list of int): Shared one-item request counter, for default ids.
+    """
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except RequestError as error:
+                await write_response(writer, error.status, {'error': str(error)}, keep_alive=False)
+                break
+            if request is None:
+                break
+            method, path, headers, body = request
+            counter[0] += 1
+            status, payload, extra = await respond(service, method, path, body, counter[0])
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            await write_response(writer, status, payload, keep_alive, extra)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+# Function to run the service
+async def serve(port=DEFAULT_PORT, ready=None, **service_options):
+    """
+    Runs the service on HOST until cancelled.
+
+    Args:
+        port (int): The TCP port, 0 for any free one.
+        ready (callable or None): Called with the bound port once the service is listening.
+        **service_options: Keyword arguments for MinimizationService.
+    """
+    service = MinimizationService(**service_options)
+    service.start()
+    counter = [0]
+    server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer, counter),
+                                        HOST, port, limit=MAX_HEADER_BYTES)
+    try:
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve minimization requests over HTTP/JSON on localhost.")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument('--workers', '-j', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"most requests sent to a worker at once (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument('--batch-delay', type=float, default=DEFAULT_BATCH_DELAY,
+                        help=f"seconds to wait for a batch to fill (default: {DEFAULT_BATCH_DELAY})")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"requests allowed to wait before new ones get 503 (default: {DEFAULT_QUEUE_SIZE})")
+    parser.add_argument('--timeout', type=float, help="give up on a function after this many seconds (POSIX only)")
+    parser.add_argument('--cache', nargs='?', const=True, metavar='FILE',
+                        help="reuse results for repeated functions, sharing them across runs through FILE (SQLite) if given")
+    parser.add_argument('--npn', action='store_true',
+                        help="solve functions equal up to input permutation and negation only once")
+    parser.add_argument('--form', choices=['sop', 'pos', 'auto'], default='sop',
+                        help="sum of products, product of sums from the off-set, or whichever is cheaper (default: sop)")
+    parser.add_argument('--no-verify', action='store_true',
+                        help="skip checking each result's cover against its function (see verify.py)")
+    args = parser.parse_args(argv)
+
+    options = {'workers': args.workers, 'batch_size': args.batch_size, 'batch_delay': args.batch_delay,
+               'queue_size': args.queue_size, 'timeout': args.timeout, 'cache': args.cache, 'npn': args.npn,
+               'form': args.form, 'verify': not args.no_verify}
+    ready = lambda port: print(f"Serving on http://{HOST}:{port}", file=sys.stderr, flush=True)
+    try:
+        asyncio.run(serve(args.port, ready, **options))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Result verification: checks that a cover is correct for the function it was minimized from, without
+evaluating the expression minterm by minterm.
+
+A cover is correct when every minterm is inside some implicant and no implicant reaches the off-set.
+Up to VERIFY_TABLE_MAX_VARS variables this is checked on truth tables held as int bitsets (bit m for
+minterm m, as to_bitset builds them): large implicants are built with a few word-parallel shifts or
+masks and small ones set term by term, the cover's table is their union, and the errors are two bitwise
+expressions away. Wider
+functions, whose tables would not fit, are checked from the terms instead: each minterm against the
+cover, and each implicant by counting the on-set and don't-care terms inside it.
+
+    report = verify_cover(minimize_function([1, 2, 5], [], 3), [1, 2, 5], [], 3)
+    report['passed']   # True
+    report['cost']     # {'terms': 2, 'literals': 5, 'gate_inputs': 7}
+"""
+from functools import lru_cache
+
+from forms import cover_cost
+from quine_mccluskey import to_bitset
+
+# Functions wider than this are verified from their terms instead of truth tables
+VERIFY_TABLE_MAX_VARS = 24
+
+# Counterexamples reported per kind of error
+MAX_COUNTEREXAMPLES = 10
+
+# Table bits a bitwise operation gets through in the time it takes to set one bit from Python; smaller
+# implicants are set term by term, larger ones built with whole-table operations
+POINT_COST_BITS = 1 << 13
+
+# Function to build the truth tables of the input variables
+@lru_cache(maxsize=8)
+def variable_tables(num_vars):
+    """
+    Builds the truth table of each input, as bits of the minterm.
+
+    Args:
+        num_vars (int): Number of variables.
+
+    Returns:
+        list of int: Table i has bit m set when bit i of minterm m is set.
+    """
+    tables = []
+    for var in range(num_vars):
+        # a run of 2**var ones after as many zeros, doubled until it spans the table
+        table = ((1 << (1 << var)) - 1) << (1 << var)
+        period = 2 << var
+        while period < 1 << num_vars:
+            table |= table << period
+            period *= 2
+        tables.append(table)
+    return tables
+
+# Function to build the truth table of an implicant
+def cube_table(implicant, num_vars):
+    """
+    Builds the truth table of an implicant: spreading its lowest minterm over its free bits, or
+    intersecting the tables of its literals, whichever takes fewer steps.
+
+    Args:
+        implicant (Implicant): The implicant.
+        num_vars (int): Number of variables.
+
+    Returns:
+        int: The table, bit m set for every minterm m inside the implicant.
+    """
+    full_care = (1 << num_vars) - 1
+    free = full_care & ~implicant.care
+    if free.bit_count() <= implicant.care.bit_count():
+        table = 1 << implicant.value
+        while free:
+            bit = free & -free
+            free ^= bit
+            table |= table << bit
+        return table
+    full = (1 << (1 << num_vars)) - 1
+    table = full
+    tables = variable_tables(num_vars)
+    care = implicant.care
+    while care:
+        bit = care & -care
+        care ^= bit
+        var = bit.bit_length() - 1
+        table &= tables[var] if implicant.value & bit else full & ~tables[var]
+    return table
+
+# Function to list the lowest set bits of a bitset
+def lowest_bits(bitset, count=MAX_COUNTEREXAMPLES):
+    """
+    Lists the lowest set bits of an int bitset, without walking the rest.
+
+    Args:
+        bitset (int): The bitset.
+        count (int): How many to list at most.
+
+    Returns:
+        list of int: Their positions, lowest first.
+    """
+    positions = []
+    while bitset and len(positions) < count:
+        low = bitset & -bitset
+        positions.append(low.bit_length() - 1)
+        bitset ^= low
+    return positions
+
+# Function to verify a cover with truth tables
+def verify_with_tables(implicants, targets, dont_cares, num_vars):
+    """
+    Finds the target terms a cover misses and the other terms it reaches, on int bitset truth tables.
+
+    Args:
+        implicants (list of Implicant): The cover.
+        targets (iterable of int): Terms the cover must include.
+        dont_cares (iterable of int): Terms it may include.
+        num_vars (int): Number of variables.
+
+    Returns:
+        tuple: The lowest missed target terms and the lowest forbidden terms covered.
+    """
+    size = 1 << num_vars
+    target_table = to_bitset(targets, size)
+    allowed_table = target_table | to_bitset(dont_cares, size)
+    full_care = size - 1
+    buffer = bytearray((size + 7) // 8)
+    cover = 0
+    for implicant in implicants:
+        free = full_care & ~implicant.care
+        if (1 << free.bit_count()) * POINT_COST_BITS <= max(free.bit_count(), 1) * size:
+            sub = free
+            while True:
+                term = implicant.value | sub
+                buffer[term >> 3] |= 1 << (term & 7)
+                if not sub:
+                    break
+                sub = (sub - 1) & free
+        else:
+            cover |= cube_table(implicant, num_vars)
+    cover |= int.from_bytes(buffer, 'little')
+    return lowest_bits(target_table & ~cover), lowest_bits(cover & ~allowed_table)
+
+# Function to verify a cover from its terms
+def verify_with_terms(implicants, targets, dont_cares, num_vars):
+    """
+    Finds the target terms a cover misses and the other terms it reaches, without truth tables: each
+    target is tested against the cover, and an implicant reaches a forbidden term exactly when it holds
+    fewer allowed terms than its size.
+
+    Args:
+        implicants (list of Implicant): The cover.
+        targets (iterable of int): Terms the cover must include.
+        dont_cares (iterable of int): Terms it may include.
+        num_vars (int): Number of variables.
+
+    Returns:
+        tuple: The lowest missed target terms and the lowest forbidden terms covered (the first found
+        in each offending implicant).
+    """
+    allowed = set(targets).union(dont_cares)
+    # implicants grouped by care mask, so each term is tested once per mask rather than once per implicant
+    by_care = {}
+    for implicant in implicants:
+        by_care.setdefault(implicant.care, set()).add(implicant.value)
+    missed = sorted(term for term in set(targets)
+                    if not any(term & care in values for care, values in by_care.items()))
+    inside = {}
+    for care, values in by_care.items():
+        for term in allowed:
+            if term & care in values:
+                inside[term & care, care] = inside.get((term & care, care), 0) + 1
+
+    full_care = (1 << num_vars) - 1
+    reached = []
+    for implicant in set(implicants):
+        free = full_care & ~implicant.care
+        if inside.get((implicant.value, implicant.care), 0) == 1 << free.bit_count():
+            continue
+        # some term of the implicant is forbidden; walk it until one turns up
+        sub = free
+        while implicant.value | sub in allowed:
+            sub = (sub - 1) & free
+        reached.append(implicant.value | sub)
+    return missed[:MAX_COUNTEREXAMPLES], sorted(reached)[:MAX_COUNTEREXAMPLES]
+
+# Function to verify a cover
+def verify_cover(implicants, minterms, dont_cares, num_vars, form='sop'):
+    """
+    Checks that a cover is correct: for a sum of products, that it includes every minterm and stays
+    within the minterms and don't cares; for a product of sums, that its implicants do the same for the
+    off-set.
+
+    Args:
+        implicants (list of Implicant): The cover.
+        minterms (list of int): The function's minterms.
+        dont_cares (list of int): The function's don't-care conditions.
+        num_vars (int): Number of variables.
+        form (str): 'sop' for a cover of the on-set, 'pos' for a cover of the off-set (see forms.py).
+
+    Returns:
+        dict: passed, the counterexamples (uncovered: minterms the function should be 1 on but is not;
+        wrong: minterms it should be 0 on but is not; at most MAX_COUNTEREXAMPLES each, lowest first)
+        and cover_cost of the cover, ready for json.dumps.
+    """
+    if form == 'pos':
+        # the clauses must cover the off-set, and a clause reaching the on-set makes the function 0 there
+        minterms = set(minterms)
+        dont_cares = set(dont_cares).difference(minterms)
+        targets = [term for term in range(1 << num_vars) if term not in minterms and term not in dont_cares]
+        missed, reached = verify_with_tables(implicants, targets, dont_cares, num_vars)
+        uncovered, wrong = reached, missed
+    else:
+        verify = verify_with_tables if num_vars <= VERIFY_TABLE_MAX_VARS else verify_with_terms
+        uncovered, wrong = verify(implicants, minterms, dont_cares, num_vars)
+    return {
+        'passed': not uncovered and not wrong,
+        'uncovered': uncovered,
+        'wrong': wrong,
+        'cost': cover_cost(implicants),
+    }